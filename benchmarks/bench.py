@@ -0,0 +1,526 @@
+"""
+End-to-end benchmark harness against local Graph / Azure OpenAI / connector stand-ins.
+
+    python benchmarks/bench.py --scenarios parser,graph,summarizer --requests 50 --concurrency 8 \
+        --output bench.json --baseline benchmarks/baseline.json
+
+Starts benchmarks/fakes.py as a child process, then runs each scenario in its own child
+process (so peak RSS is per scenario and the stand-ins do not share its event loop):
+
+  parser       parse + render one transcript (CPU only; --concurrency is ignored)
+  compaction   compact + chunk one parsed transcript (CPU only); reports the token reduction
+  graph        GraphTranscriptClient.fetch_transcripts_for_user_async, one organizer per request
+  graph-batch  GraphTranscriptClient.fetch_transcripts_for_users_async over all organizers ($batch)
+  summarizer   TranscriptSummarizer.summarize_map_reduce_async over one organizer's transcripts
+  pipeline     graph + summarizer for one organizer (streamed, unless --env PIPELINE_ENABLED=false)
+  messages     POST /api/messages "summary" to the real aiohttp app; latency runs until the
+               summary reaches the fake connector (needs the Agents SDK installed)
+
+Reports throughput, p50/p95/p99 latency and peak RSS, writes them as JSON (--output) and
+compares them with a stored run (--baseline); --save-baseline writes the run as the new
+baseline. Stand-in behaviour (sizes, latencies, 429 injection) is set by the fakes.py
+options, and agent configuration by --env KEY=VALUE.
+"""
+
+import argparse
+import asyncio
+import json
+import os
+import platform
+import resource
+import subprocess
+import sys
+import tempfile
+import time
+import urllib.request
+import uuid
+from pathlib import Path
+from typing import Any, Awaitable, Callable
+
+import fakes
+
+SCENARIOS = ("parser", "compaction", "graph", "graph-batch", "summarizer", "pipeline", "messages")
+# (metric, True if higher is better)
+COMPARED_METRICS = (
+    ("throughput_per_s", True),
+    ("p50_ms", False),
+    ("p95_ms", False),
+    ("p99_ms", False),
+    ("peak_rss_mib", False),
+)
+
+
+def percentile(sorted_values: list[float], p: float) -> float:
+    """Nearest-rank percentile of an already sorted list."""
+    if not sorted_values:
+        return 0.0
+    rank = max(1, min(len(sorted_values), round(p / 100 * len(sorted_values) + 0.5)))
+    return sorted_values[rank - 1]
+
+
+def peak_rss_mib() -> float:
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # Linux reports KiB, macOS bytes.
+    return peak / 2**20 if platform.system() == "Darwin" else peak / 1024
+
+
+async def run_ops(
+    op: Callable[[int], Awaitable[Any]], requests: int, concurrency: int
+) -> dict[str, Any]:
+    """Run op(0..requests-1) with at most concurrency in flight; latency and throughput stats."""
+    latencies: list[float] = []
+    errors: list[str] = []
+    semaphore = asyncio.Semaphore(concurrency)
+
+    async def one(i: int) -> None:
+        async with semaphore:
+            start = time.perf_counter()
+            try:
+                await op(i)
+            except Exception as e:
+                errors.append(f"{type(e).__name__}: {e}")
+                return
+            latencies.append(time.perf_counter() - start)
+
+    started = time.perf_counter()
+    await asyncio.gather(*(one(i) for i in range(requests)))
+    wall = time.perf_counter() - started
+    latencies.sort()
+    return {
+        "requests": requests,
+        "concurrency": concurrency,
+        "errors": len(errors),
+        "first_errors": errors[:3],
+        "seconds": round(wall, 4),
+        "throughput_per_s": round(len(latencies) / wall, 3) if wall else 0.0,
+        "mean_ms": round(1000 * sum(latencies) / len(latencies), 2) if latencies else 0.0,
+        "p50_ms": round(1000 * percentile(latencies, 50), 2),
+        "p95_ms": round(1000 * percentile(latencies, 95), 2),
+        "p99_ms": round(1000 * percentile(latencies, 99), 2),
+    }
+
+
+# Child side: one scenario in this process
+
+
+def _redirect_transport(target: str, max_connections: int):
+    import httpx
+
+    class RedirectTransport(httpx.AsyncHTTPTransport):
+        """Send every request (e.g. to graph.microsoft.com) to the local stand-in instead."""
+
+        def __init__(self, **kwargs: Any):
+            super().__init__(**kwargs)
+            self._target = httpx.URL(target)
+
+        async def handle_async_request(self, request: httpx.Request) -> httpx.Response:
+            request.url = request.url.copy_with(
+                scheme=self._target.scheme, host=self._target.host, port=self._target.port
+            )
+            return await super().handle_async_request(request)
+
+    return RedirectTransport(
+        limits=httpx.Limits(max_connections=max_connections, max_keepalive_connections=max_connections)
+    )
+
+
+class StaticTokens:
+    """GraphTokenManager stand-in: the fake Graph accepts any bearer token."""
+
+    access_token = "benchmark-token"
+
+    async def get_token(self) -> str:
+        return self.access_token
+
+    async def start(self) -> None:
+        pass
+
+    async def aclose(self) -> None:
+        pass
+
+    def stats(self) -> dict[str, float]:
+        return {}
+
+
+def _config(args: argparse.Namespace, fake_url: str):
+    from meeting_agent.config import load_config
+
+    env = {
+        "AZURE_OPENAI_ENDPOINT": fake_url,
+        "AZURE_OPENAI_API_KEY": "benchmark",
+        "AZURE_OPENAI_DEPLOYMENT_NAME": "benchmark",
+        "MEETING_ORGANIZER_USER_ID": "organizer-0",
+        "SUMMARY_CACHE_ENABLED": "false",
+        "TRANSCRIPT_STORE_ENABLED": "false",
+    }
+    env.update(dict(kv.split("=", 1) for kv in args.env))
+    return env, load_config(env)
+
+
+def _graph_client(config, fake_url: str):
+    from meeting_agent.graph_client import GraphTranscriptClient
+
+    transport = _redirect_transport(fake_url, config.graph_max_concurrency + 2)
+    return GraphTranscriptClient(config, StaticTokens(), None, transport=transport)  # type: ignore[arg-type]
+
+
+def _synthetic_transcripts(args: argparse.Namespace) -> list[dict[str, Any]]:
+    from meeting_agent.transcript_parser import parse_vtt_to_text
+    from vtt_parser import iter_vtt_chunks
+
+    text = parse_vtt_to_text("".join(iter_vtt_chunks(args.transcript_minutes / 60)))
+    return [
+        {
+            "transcript_id": f"bench-{i}",
+            "meeting_id": f"meeting-{i}",
+            "created_date_time": "",
+            "content_text": text,
+        }
+        for i in range(args.transcripts_per_organizer)
+    ]
+
+
+async def _scenario_parser(args: argparse.Namespace, fake_url: str) -> dict[str, Any]:
+    from meeting_agent.transcript_parser import iter_vtt_segments, render_segments
+    from vtt_parser import iter_vtt_chunks
+
+    hours = args.transcript_minutes / 60
+
+    async def op(i: int) -> None:
+        render_segments(list(iter_vtt_segments(iter_vtt_chunks(hours))))
+
+    return await run_ops(op, args.requests, 1)
+
+
+async def _scenario_compaction(args: argparse.Namespace, fake_url: str) -> dict[str, Any]:
+    from meeting_agent.chunking import transcript_chunks
+    from meeting_agent.compaction import CompactionOptions, compaction_options
+
+    _, config = _config(args, fake_url)
+    options = compaction_options(config) or CompactionOptions()
+    transcript = _synthetic_transcripts(args)[0]
+    reports = []
+
+    async def op(i: int) -> None:
+        reports.append(transcript_chunks(transcript, config.summary_chunk_tokens, options)[1])
+
+    result = await run_ops(op, args.requests, 1)
+    report = reports[-1]
+    result["tokens_before"] = report.tokens_before
+    result["tokens_after"] = report.tokens_after
+    result["tokens_saved_pct"] = round(100 * report.saved_ratio, 1)
+    return result
+
+
+async def _scenario_graph(args: argparse.Namespace, fake_url: str) -> dict[str, Any]:
+    _, config = _config(args, fake_url)
+    client = _graph_client(config, fake_url)
+    try:
+
+        async def op(i: int) -> None:
+            await client.fetch_transcripts_for_user_async(f"organizer-{i % args.organizers}")
+
+        result = await run_ops(op, args.requests, args.concurrency)
+        result["graph_scheduler"] = client.scheduler.stats()
+        return result
+    finally:
+        await client.aclose()
+
+
+async def _scenario_graph_batch(args: argparse.Namespace, fake_url: str) -> dict[str, Any]:
+    _, config = _config(args, fake_url)
+    client = _graph_client(config, fake_url)
+    organizers = [f"organizer-{i}" for i in range(args.organizers)]
+    try:
+
+        async def op(i: int) -> None:
+            await client.fetch_transcripts_for_users_async(organizers)
+
+        result = await run_ops(op, args.requests, args.concurrency)
+        result["graph_scheduler"] = client.scheduler.stats()
+        return result
+    finally:
+        await client.aclose()
+
+
+async def _scenario_summarizer(args: argparse.Namespace, fake_url: str) -> dict[str, Any]:
+    from meeting_agent.summarizer import TranscriptSummarizer
+
+    _, config = _config(args, fake_url)
+    summarizer = TranscriptSummarizer(config, None)
+    transcripts = _synthetic_transcripts(args)
+    try:
+
+        async def op(i: int) -> None:
+            await summarizer.summarize_map_reduce_async(transcripts)
+
+        return await run_ops(op, args.requests, args.concurrency)
+    finally:
+        await summarizer.aclose()
+
+
+async def _scenario_pipeline(args: argparse.Namespace, fake_url: str) -> dict[str, Any]:
+    from meeting_agent.summarizer import TranscriptSummarizer
+
+    _, config = _config(args, fake_url)
+    client = _graph_client(config, fake_url)
+    summarizer = TranscriptSummarizer(config, None)
+    first_content: list[float] = []
+    try:
+
+        async def op(i: int) -> None:
+            start = time.perf_counter()
+            started: list[float] = []
+
+            def on_delta(delta: str) -> None:
+                if not started:
+                    started.append(time.perf_counter() - start)
+
+            user_id = f"organizer-{i % args.organizers}"
+            if config.pipeline_enabled:
+                await summarizer.summarize_transcript_stream_async(
+                    client.iter_transcripts_for_user_async(user_id), on_delta=on_delta
+                )
+            else:
+                transcripts = await client.fetch_transcripts_for_user_async(user_id)
+                await summarizer.summarize_transcripts_async(transcripts, combined=True, on_delta=on_delta)
+            first_content.extend(started)
+
+        result = await run_ops(op, args.requests, args.concurrency)
+        result["graph_scheduler"] = client.scheduler.stats()
+        first_content.sort()
+        if first_content:
+            # Time to the first streamed summary text (what a user waits for before seeing anything).
+            result["first_content_p50_ms"] = round(1000 * percentile(first_content, 50), 2)
+            result["first_content_p95_ms"] = round(1000 * percentile(first_content, 95), 2)
+        return result
+    finally:
+        await client.aclose()
+        await summarizer.aclose()
+
+
+async def _scenario_messages(args: argparse.Namespace, fake_url: str) -> dict[str, Any]:
+    import httpx
+    from aiohttp import web
+
+    from meeting_agent import app as app_module
+    from meeting_agent.__main__ import create_app
+
+    env, config = _config(args, fake_url)
+    # Anonymous bot identity (as with the Bot Framework Emulator); outputs go to a scratch dir.
+    for key in ("MicrosoftAppId", "MicrosoftAppPassword", "CLIENT_ID", "CLIENT_SECRET"):
+        env.setdefault(key, "")
+    os.environ.update(env)
+    output_dir = tempfile.mkdtemp(prefix="meeting-agent-bench-")
+    app_module._default_output_dir = lambda: output_dir
+
+    runtime = app_module.AgentRuntime(config)
+    await runtime.graph_client.aclose()
+    runtime.graph_tokens = StaticTokens()  # type: ignore[assignment]
+    runtime.graph_client = _graph_client(config, fake_url)
+    app_module._runtime = runtime
+
+    runner = web.AppRunner(create_app(), access_log=None)
+    await runner.setup()
+    site = web.TCPSite(runner, "127.0.0.1", 0)
+    await site.start()
+    agent_url = f"http://127.0.0.1:{site._server.sockets[0].getsockname()[1]}"  # type: ignore[union-attr]
+    ack_latencies: list[float] = []
+
+    async with httpx.AsyncClient(timeout=600.0) as http:
+        while (await http.get(f"{agent_url}/ready")).status_code != 200:
+            await asyncio.sleep(0.05)
+
+        async def op(i: int) -> None:
+            conversation = f"bench-{uuid.uuid4().hex[:8]}"
+            activity = {
+                "type": "message",
+                "id": uuid.uuid4().hex,
+                "text": "summary",
+                "channelId": "emulator",
+                "serviceUrl": fake_url + "/",
+                "from": {"id": "bench-user", "name": "Benchmark"},
+                "recipient": {"id": "bench-bot", "name": "Agent"},
+                "conversation": {"id": conversation},
+            }
+            start = time.perf_counter()
+            resp = await http.post(f"{agent_url}/api/messages", json=activity)
+            resp.raise_for_status()
+            ack_latencies.append(time.perf_counter() - start)
+            reply = await http.get(f"{fake_url}/_bench/wait/{conversation}")
+            reply.raise_for_status()
+
+        try:
+            result = await run_ops(op, args.requests, args.concurrency)
+        finally:
+            await runner.cleanup()
+    ack_latencies.sort()
+    result["ack_p50_ms"] = round(1000 * percentile(ack_latencies, 50), 2)
+    result["ack_p95_ms"] = round(1000 * percentile(ack_latencies, 95), 2)
+    return result
+
+
+SCENARIO_FUNCS = {
+    "parser": _scenario_parser,
+    "compaction": _scenario_compaction,
+    "graph": _scenario_graph,
+    "graph-batch": _scenario_graph_batch,
+    "summarizer": _scenario_summarizer,
+    "pipeline": _scenario_pipeline,
+    "messages": _scenario_messages,
+}
+
+
+def run_child(args: argparse.Namespace) -> None:
+    result = asyncio.run(SCENARIO_FUNCS[args.child](args, args.fake_url))
+    result["peak_rss_mib"] = round(peak_rss_mib(), 1)
+    print(json.dumps(result), flush=True)
+
+
+# Parent side: stand-ins, scenario processes, results and baseline comparison
+
+
+def _get_json(url: str) -> dict[str, Any]:
+    with urllib.request.urlopen(url, timeout=30) as resp:
+        return json.load(resp)
+
+
+def _start_fakes(args: argparse.Namespace) -> tuple[subprocess.Popen, str]:
+    fake_args = []
+    for name, value in vars(fakes.FakeSettings()).items():
+        fake_args += [f"--{name.replace('_', '-')}", str(getattr(args, name))]
+    proc = subprocess.Popen(
+        [sys.executable, str(Path(__file__).with_name("fakes.py")), "--port", "0", *fake_args],
+        stdout=subprocess.PIPE,
+        text=True,
+    )
+    line = proc.stdout.readline() if proc.stdout else ""
+    if not line:
+        proc.kill()
+        raise RuntimeError("fake services did not start")
+    return proc, f"http://127.0.0.1:{json.loads(line)['listening']}"
+
+
+def _run_scenario(name: str, fake_url: str) -> dict[str, Any]:
+    before = _get_json(f"{fake_url}/_bench/stats")
+    proc = subprocess.run(
+        [sys.executable, __file__, *sys.argv[1:], "--child", name, "--fake-url", fake_url],
+        capture_output=True,
+        text=True,
+    )
+    if proc.returncode != 0:
+        sys.stderr.write(proc.stderr[-4000:])
+        return {"failed": True, "returncode": proc.returncode}
+    result = json.loads(proc.stdout.strip().splitlines()[-1])
+    after = _get_json(f"{fake_url}/_bench/stats")
+    result["fake_services"] = {k: after[k] - before.get(k, 0) for k in after}
+    return result
+
+
+def _git_commit() -> str:
+    try:
+        return subprocess.run(
+            ["git", "rev-parse", "--short", "HEAD"],
+            capture_output=True,
+            text=True,
+            cwd=Path(__file__).parent,
+        ).stdout.strip()
+    except OSError:
+        return ""
+
+
+def compare(current: dict[str, Any], baseline: dict[str, Any], threshold: float) -> list[str]:
+    """Print current vs baseline per scenario and metric; returns the regressions found."""
+    regressions: list[str] = []
+    print(f"\nCompared with baseline {baseline.get('git_commit') or ''} ({baseline.get('timestamp', '')}):")
+    print(f"{'scenario':12} {'metric':18} {'baseline':>11} {'current':>11} {'change':>8}")
+    for name, result in current["scenarios"].items():
+        base = baseline.get("scenarios", {}).get(name)
+        if not base or result.get("failed") or base.get("failed"):
+            continue
+        for metric, higher_is_better in COMPARED_METRICS:
+            old, new = base.get(metric), result.get(metric)
+            if not old or new is None:
+                continue
+            change = (new - old) / old
+            worse = -change if higher_is_better else change
+            flag = ""
+            if worse > threshold:
+                flag = "  REGRESSION"
+                regressions.append(f"{name} {metric}: {old} -> {new}")
+            print(f"{name:12} {metric:18} {old:11.2f} {new:11.2f} {change:+8.1%}{flag}")
+    return regressions
+
+
+def print_results(results: dict[str, Any]) -> None:
+    print(f"{'scenario':12} {'req':>5} {'conc':>5} {'err':>4} {'ops/s':>9} {'p50 ms':>9} {'p95 ms':>9} {'p99 ms':>9} {'RSS MiB':>8}")
+    for name, r in results["scenarios"].items():
+        if r.get("failed"):
+            print(f"{name:12} failed (exit {r.get('returncode')})")
+            continue
+        print(
+            f"{name:12} {r['requests']:5d} {r['concurrency']:5d} {r['errors']:4d} {r['throughput_per_s']:9.2f}"
+            f" {r['p50_ms']:9.1f} {r['p95_ms']:9.1f} {r['p99_ms']:9.1f} {r['peak_rss_mib']:8.1f}"
+        )
+        for error in r.get("first_errors", []):
+            print(f"{'':12} error: {error}")
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--scenarios", default="parser,compaction,graph,graph-batch,summarizer,pipeline")
+    parser.add_argument("--requests", type=int, default=20, help="operations per scenario")
+    parser.add_argument("--concurrency", type=int, default=4, help="operations in flight at once")
+    parser.add_argument("--env", action="append", default=[], metavar="KEY=VALUE", help="agent configuration")
+    parser.add_argument("--output", help="write results as JSON here")
+    parser.add_argument("--baseline", help="compare with this results file")
+    parser.add_argument("--save-baseline", help="also write results here as the new baseline")
+    parser.add_argument("--threshold", type=float, default=0.10, help="relative change counted as a regression")
+    parser.add_argument("--fail-on-regression", action="store_true", help="exit 1 if any regression is found")
+    parser.add_argument("--child", choices=SCENARIOS, help=argparse.SUPPRESS)
+    parser.add_argument("--fake-url", help=argparse.SUPPRESS)
+    fakes.add_arguments(parser)
+    args = parser.parse_args()
+
+    if args.child:
+        run_child(args)
+        return
+
+    names = [n.strip() for n in args.scenarios.split(",") if n.strip()]
+    unknown = [n for n in names if n not in SCENARIOS]
+    if unknown:
+        parser.error(f"unknown scenario(s): {', '.join(unknown)}")
+    proc, fake_url = _start_fakes(args)
+    try:
+        results = {
+            "timestamp": time.strftime("%Y-%m-%dT%H:%M:%SZ", time.gmtime()),
+            "git_commit": _git_commit(),
+            "python": platform.python_version(),
+            "settings": {
+                "requests": args.requests,
+                "concurrency": args.concurrency,
+                "env": args.env,
+                "fakes": vars(fakes.settings_from_args(args)),
+            },
+            "scenarios": {name: _run_scenario(name, fake_url) for name in names},
+        }
+    finally:
+        proc.terminate()
+        proc.wait()
+
+    print_results(results)
+    for path in (args.output, args.save_baseline):
+        if path:
+            Path(path).write_text(json.dumps(results, indent=2) + "\n", encoding="utf-8")
+    regressions: list[str] = []
+    if args.baseline and Path(args.baseline).exists():
+        baseline = json.loads(Path(args.baseline).read_text(encoding="utf-8"))
+        if baseline.get("settings") != results["settings"]:
+            print("\nWarning: baseline was recorded with different settings")
+        regressions = compare(results, baseline, args.threshold)
+    if regressions and args.fail_on_regression:
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,290 @@
+"""
+Local stand-ins for Microsoft Graph, Azure OpenAI and the Bot Framework connector, served by
+one aiohttp app. Used by benchmarks/bench.py (which starts it as a child process), or by hand:
+
+    python benchmarks/fakes.py --port 8765 --organizers 20 --throttle-rate 0.05
+
+Graph:      GET  /v1.0/users/{id}/onlineMeetings/getAllTranscripts(...)  (paged via $skiptoken)
+            GET  /v1.0/users/{id}/onlineMeetings/{meeting}/transcripts/{id}/content  (VTT)
+            POST /v1.0/$batch
+OpenAI:     POST /openai/deployments/{deployment}/chat/completions
+Connector:  POST /v3/conversations/{conversation}/activities[/{activity}]
+Harness:    GET  /_bench/wait/{conversation}  (long-poll for the first non-acknowledgement reply)
+            GET  /_bench/stats
+
+Links in Graph responses use the real https://graph.microsoft.com/v1.0 base, as Graph does;
+the harness routes them here with a redirecting httpx transport.
+"""
+
+import argparse
+import asyncio
+import base64
+import json
+import random
+import re
+import time
+import uuid
+from dataclasses import dataclass
+from datetime import datetime, timedelta, timezone
+
+from aiohttp import web
+
+from vtt_parser import iter_vtt_chunks
+
+GRAPH_BASE = "https://graph.microsoft.com/v1.0"
+
+_ALL_TRANSCRIPTS_RE = re.compile(r"^/users/([^/]+)/onlineMeetings/getAllTranscripts\(")
+_CONTENT_RE = re.compile(r"^/users/([^/]+)/onlineMeetings/([^/]+)/transcripts/([^/]+)/content$")
+
+
+@dataclass
+class FakeSettings:
+    organizers: int = 10
+    transcripts_per_organizer: int = 5
+    page_size: int = 2
+    transcript_minutes: float = 60.0
+    graph_latency_ms: float = 20.0
+    # Extra content latency per MB of VTT (transfer time).
+    content_ms_per_mb: float = 50.0
+    throttle_rate: float = 0.0
+    retry_after_seconds: float = 1.0
+    llm_latency_ms: float = 300.0
+    llm_ms_per_1k_prompt_tokens: float = 20.0
+    # With stream=True: first token after llm_latency_ms, then this per completion token.
+    llm_ms_per_output_token: float = 5.0
+    seed: int = 1
+
+
+class FakeServices:
+    def __init__(self, settings: FakeSettings):
+        self.s = settings
+        self._random = random.Random(settings.seed)
+        self._vtt = "".join(iter_vtt_chunks(settings.transcript_minutes / 60))
+        self._now = datetime.now(timezone.utc)
+        self._activities: dict[str, list[dict]] = {}
+        self._waiters: dict[str, asyncio.Event] = {}
+        self.counts = {
+            "graph_requests": 0,
+            "graph_throttled": 0,
+            "batch_requests": 0,
+            "batch_sub_requests": 0,
+            "llm_requests": 0,
+            "llm_prompt_tokens": 0,
+            "connector_activities": 0,
+        }
+
+    # Graph
+
+    def _throttle(self) -> bool:
+        if self.s.throttle_rate and self._random.random() < self.s.throttle_rate:
+            self.counts["graph_throttled"] += 1
+            return True
+        return False
+
+    def _transcripts(self, user_id: str) -> list[dict]:
+        out = []
+        for i in range(self.s.transcripts_per_organizer):
+            created = self._now - timedelta(hours=6 * (i + 1))
+            meeting_id = f"meeting-{user_id}-{i}"
+            transcript_id = f"transcript-{user_id}-{i}"
+            out.append(
+                {
+                    "id": transcript_id,
+                    "meetingId": meeting_id,
+                    "createdDateTime": created.strftime("%Y-%m-%dT%H:%M:%S.0000000Z"),
+                    "transcriptContentUrl": (
+                        f"{GRAPH_BASE}/users/{user_id}/onlineMeetings/{meeting_id}"
+                        f"/transcripts/{transcript_id}/content"
+                    ),
+                }
+            )
+        return out
+
+    async def _graph_get(self, path: str, query: dict[str, str]) -> tuple[int, dict[str, str], object]:
+        """One Graph GET: (status, headers, body); body is JSON-able, or str for VTT."""
+        self.counts["graph_requests"] += 1
+        await asyncio.sleep(self.s.graph_latency_ms / 1000)
+        if self._throttle():
+            return 429, {"Retry-After": f"{self.s.retry_after_seconds:g}"}, {"error": {"code": "TooManyRequests"}}
+        match = _ALL_TRANSCRIPTS_RE.match(path)
+        if match:
+            items = self._transcripts(match.group(1))
+            skip = int(query.get("$skiptoken", "0"))
+            body: dict = {"value": items[skip : skip + self.s.page_size]}
+            if skip + self.s.page_size < len(items):
+                body["@odata.nextLink"] = f"{GRAPH_BASE}{path}?$skiptoken={skip + self.s.page_size}"
+            return 200, {"Content-Type": "application/json"}, body
+        if _CONTENT_RE.match(path):
+            await asyncio.sleep(self.s.content_ms_per_mb * len(self._vtt) / 1e6 / 1000)
+            return 200, {"Content-Type": "text/vtt"}, self._vtt
+        return 404, {}, {"error": {"code": "NotFound", "path": path}}
+
+    async def graph(self, request: web.Request) -> web.StreamResponse:
+        path = "/" + request.match_info["tail"]
+        if request.method == "POST" and path == "/$batch":
+            return await self._batch(request)
+        status, headers, body = await self._graph_get(path, dict(request.query))
+        headers = {k: v for k, v in headers.items() if k != "Content-Type"}
+        if isinstance(body, str):
+            return web.Response(status=status, headers=headers, text=body, content_type="text/vtt")
+        return web.json_response(body, status=status, headers=headers)
+
+    async def _batch(self, request: web.Request) -> web.Response:
+        self.counts["batch_requests"] += 1
+        payload = await request.json()
+
+        async def one(sub: dict) -> dict:
+            self.counts["batch_sub_requests"] += 1
+            path, _, qs = sub["url"].partition("?")
+            query = dict(p.split("=", 1) for p in qs.split("&") if "=" in p)
+            status, headers, body = await self._graph_get(path, query)
+            if isinstance(body, str):
+                body = base64.b64encode(body.encode("utf-8")).decode("ascii")
+            return {"id": sub["id"], "status": status, "headers": headers, "body": body}
+
+        responses = await asyncio.gather(*(one(sub) for sub in payload.get("requests", [])))
+        return web.json_response({"responses": responses})
+
+    # Azure OpenAI
+
+    async def _stream_completion(
+        self, request: web.Request, deployment: str, prompt_tokens: int
+    ) -> web.StreamResponse:
+        """Server-sent chat.completion.chunk events: a few Markdown paragraphs, word by word."""
+        response = web.StreamResponse(headers={"Content-Type": "text/event-stream"})
+        await response.prepare(request)
+        completion_id = f"chatcmpl-{uuid.uuid4().hex[:12]}"
+        paragraph = f"Summary of {prompt_tokens} prompt tokens: topics, decisions and action items. " * 4
+        words = ("\n\n".join(f"**Topic {i}.** {paragraph.strip()}" for i in range(1, 6))).split(" ")
+
+        async def event(delta: dict, finish_reason: str | None = None) -> None:
+            chunk = {
+                "id": completion_id,
+                "object": "chat.completion.chunk",
+                "created": int(time.time()),
+                "model": deployment,
+                "choices": [{"index": 0, "delta": delta, "finish_reason": finish_reason}],
+            }
+            await response.write(f"data: {json.dumps(chunk)}\n\n".encode("utf-8"))
+
+        await event({"role": "assistant", "content": ""})
+        for i, word in enumerate(words):
+            await asyncio.sleep(self.s.llm_ms_per_output_token / 1000)
+            await event({"content": word if i == 0 else " " + word})
+        await event({}, "stop")
+        await response.write(b"data: [DONE]\n\n")
+        await response.write_eof()
+        return response
+
+    async def chat_completions(self, request: web.Request) -> web.StreamResponse:
+        payload = await request.json()
+        prompt_chars = sum(len(m.get("content", "")) for m in payload.get("messages", []))
+        prompt_tokens = prompt_chars // 4
+        self.counts["llm_requests"] += 1
+        self.counts["llm_prompt_tokens"] += prompt_tokens
+        await asyncio.sleep(
+            (self.s.llm_latency_ms + self.s.llm_ms_per_1k_prompt_tokens * prompt_tokens / 1000) / 1000
+        )
+        if payload.get("stream"):
+            return await self._stream_completion(request, request.match_info["deployment"], prompt_tokens)
+        content = f"Summary of {prompt_tokens} prompt tokens: topics, decisions and action items."
+        return web.json_response(
+            {
+                "id": f"chatcmpl-{uuid.uuid4().hex[:12]}",
+                "object": "chat.completion",
+                "created": int(time.time()),
+                "model": request.match_info["deployment"],
+                "choices": [
+                    {
+                        "index": 0,
+                        "finish_reason": "stop",
+                        "message": {"role": "assistant", "content": content},
+                    }
+                ],
+                "usage": {
+                    "prompt_tokens": prompt_tokens,
+                    "completion_tokens": len(content) // 4,
+                    "total_tokens": prompt_tokens + len(content) // 4,
+                },
+            }
+        )
+
+    # Bot Framework connector
+
+    async def activities(self, request: web.Request) -> web.Response:
+        conversation = request.match_info["conversation"]
+        activity = await request.json()
+        self.counts["connector_activities"] += 1
+        activity["_received_at"] = time.time()
+        self._activities.setdefault(conversation, []).append(activity)
+        self._waiters.setdefault(conversation, asyncio.Event()).set()
+        return web.json_response({"id": uuid.uuid4().hex})
+
+    async def wait_reply(self, request: web.Request) -> web.Response:
+        """First activity in the conversation that is not a job acknowledgement."""
+        conversation = request.match_info["conversation"]
+        timeout = float(request.query.get("timeout", "300"))
+        deadline = time.monotonic() + timeout
+        while True:
+            for activity in self._activities.get(conversation, []):
+                if "(job " not in (activity.get("text") or ""):
+                    return web.json_response(activity)
+            event = self._waiters.setdefault(conversation, asyncio.Event())
+            event.clear()
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                return web.json_response({"error": "timeout"}, status=504)
+            try:
+                await asyncio.wait_for(event.wait(), remaining)
+            except asyncio.TimeoutError:
+                pass
+
+    async def stats(self, request: web.Request) -> web.Response:
+        return web.json_response(self.counts)
+
+    def app(self) -> web.Application:
+        app = web.Application(client_max_size=64 * 1024 * 1024)
+        app.router.add_route("*", "/v1.0/{tail:.*}", self.graph)
+        app.router.add_post("/openai/deployments/{deployment}/chat/completions", self.chat_completions)
+        app.router.add_post("/v3/conversations/{conversation}/activities", self.activities)
+        app.router.add_post("/v3/conversations/{conversation}/activities/{activity}", self.activities)
+        app.router.add_get("/_bench/wait/{conversation}", self.wait_reply)
+        app.router.add_get("/_bench/stats", self.stats)
+        return app
+
+
+def add_arguments(parser: argparse.ArgumentParser) -> None:
+    """FakeSettings fields as --options (shared with bench.py)."""
+    defaults = FakeSettings()
+    for name, value in vars(defaults).items():
+        parser.add_argument(f"--{name.replace('_', '-')}", type=type(value), default=value)
+
+
+def settings_from_args(args: argparse.Namespace) -> FakeSettings:
+    return FakeSettings(**{name: getattr(args, name) for name in vars(FakeSettings())})
+
+
+async def serve(settings: FakeSettings, port: int) -> None:
+    runner = web.AppRunner(FakeServices(settings).app(), access_log=None)
+    await runner.setup()
+    site = web.TCPSite(runner, "127.0.0.1", port)
+    await site.start()
+    bound = site._server.sockets[0].getsockname()[1]  # type: ignore[union-attr]
+    # bench.py reads this line to learn the port.
+    print(json.dumps({"listening": bound}), flush=True)
+    await asyncio.Event().wait()
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--port", type=int, default=0, help="0 picks a free port")
+    add_arguments(parser)
+    args = parser.parse_args()
+    try:
+        asyncio.run(serve(settings_from_args(args), args.port))
+    except KeyboardInterrupt:
+        pass
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,202 @@
+"""
+Benchmark: cold-start budget of the container entry point, each run in a fresh interpreter.
+
+    python benchmarks/startup.py --repeat 5 --output startup.json
+
+  import   `python -X importtime -c "import meeting_agent.__main__"`: total import time, the
+           slowest imports under it, and that no deferred module (Agents SDK, msal, httpx,
+           openai) was imported
+  health   `python -m meeting_agent` until GET /health answers (the port is open)
+  ready    the same server until GET /ready answers 200: agent stack imported, runtime built
+           and warmed up (token endpoints point at a closed local port, so warm-up fails fast;
+           needs the Agents SDK installed, skip with --no-ready)
+
+Reports the median of each and exits 1 when one exceeds its budget (--import-budget-ms,
+--health-budget-ms, --ready-budget-ms) or a deferred module was imported eagerly. The server
+runs with its normal output/ directory.
+"""
+
+import argparse
+import json
+import os
+import socket
+import statistics
+import subprocess
+import sys
+import time
+import urllib.error
+import urllib.request
+from pathlib import Path
+from typing import Any
+
+# Must not be imported by `import meeting_agent.__main__` (they load with the runtime).
+DEFERRED_MODULES = ("meeting_agent.app", "microsoft_agents", "msal", "httpx", "openai")
+
+IMPORT_PROBE = (
+    "import meeting_agent.__main__\n"
+    "import json, sys\n"
+    f"print(json.dumps([m for m in {DEFERRED_MODULES!r} if m in sys.modules]))\n"
+)
+
+
+def _free_port() -> int:
+    with socket.socket() as s:
+        s.bind(("127.0.0.1", 0))
+        return s.getsockname()[1]
+
+
+def measure_import() -> dict[str, Any]:
+    """One `-X importtime` run: total ms for meeting_agent.__main__, slowest children, deferred modules seen."""
+    proc = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", IMPORT_PROBE],
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    total_us = 0
+    children: list[tuple[int, str]] = []
+    for line in proc.stderr.splitlines():
+        # "import time: self [us] | cumulative | imported package" (nesting as leading spaces)
+        if not line.startswith("import time:") or "imported package" in line:
+            continue
+        _, cumulative, name = line[len("import time:") :].split("|")
+        depth = (len(name) - len(name.lstrip())) // 2
+        if depth == 0 and name.strip().startswith("meeting_agent"):
+            total_us += int(cumulative)
+        elif depth == 1:
+            children.append((int(cumulative), name.strip()))
+    return {
+        "import_ms": total_us / 1000,
+        "slowest": [(name, us / 1000) for us, name in sorted(children, reverse=True)[:5]],
+        "deferred_imported": json.loads(proc.stdout.strip().splitlines()[-1]),
+    }
+
+
+def _get(url: str) -> tuple[int, dict[str, Any]]:
+    """(status, JSON body); status 0 while nothing is listening."""
+    try:
+        with urllib.request.urlopen(url, timeout=1) as resp:
+            return resp.status, json.load(resp)
+    except urllib.error.HTTPError as e:
+        return e.code, json.load(e)
+    except OSError:
+        return 0, {}
+
+
+def measure_server(ready: bool, timeout: float) -> dict[str, Any]:
+    """Start `python -m meeting_agent`; ms until /health answers and (if ready) until /ready is 200."""
+    port = _free_port()
+    closed = f"https://127.0.0.1:{_free_port()}"
+    env = {
+        **os.environ,
+        "PORT": str(port),
+        "WEB_WORKERS": "1",
+        "TENANT_ID": "benchmark",
+        "CLIENT_ID": "benchmark",
+        "CLIENT_SECRET": "benchmark",
+        "AUTHORITY": f"{closed}/benchmark",
+        "AZURE_OPENAI_ENDPOINT": closed,
+        "AZURE_OPENAI_API_KEY": "benchmark",
+        "PRECOMPUTE_INTERVAL_MINUTES": "0",
+    }
+    base = f"http://127.0.0.1:{port}"
+    result: dict[str, Any] = {"health_ms": None, "ready_ms": None}
+    started = time.perf_counter()
+    proc = subprocess.Popen(
+        [sys.executable, "-m", "meeting_agent"],
+        env=env,
+        stdout=subprocess.DEVNULL,
+        stderr=subprocess.PIPE,
+        text=True,
+    )
+    try:
+        deadline = started + timeout
+        while time.perf_counter() < deadline and proc.poll() is None:
+            if result["health_ms"] is None and _get(f"{base}/health")[0] == 200:
+                result["health_ms"] = 1000 * (time.perf_counter() - started)
+                if not ready:
+                    break
+            if result["health_ms"] is not None:
+                status, body = _get(f"{base}/ready")
+                if status == 200:
+                    result["ready_ms"] = 1000 * (time.perf_counter() - started)
+                    break
+                if body.get("status") == "failed":
+                    break
+            time.sleep(0.005)
+    finally:
+        proc.terminate()
+        try:
+            _, stderr = proc.communicate(timeout=30)
+        except subprocess.TimeoutExpired:
+            proc.kill()
+            _, stderr = proc.communicate()
+    if result["health_ms"] is None or (ready and result["ready_ms"] is None):
+        result["log_tail"] = [line for line in stderr.splitlines() if "aiohttp.access" not in line][-5:]
+    return result
+
+
+def _median(values: list[float | None]) -> float | None:
+    measured = [v for v in values if v is not None]
+    return round(statistics.median(measured), 1) if len(measured) == len(values) and measured else None
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--repeat", type=int, default=5, help="fresh interpreters per measurement")
+    parser.add_argument("--import-budget-ms", type=float, default=400)
+    parser.add_argument("--health-budget-ms", type=float, default=1500)
+    parser.add_argument("--ready-budget-ms", type=float, default=6000)
+    parser.add_argument("--no-ready", action="store_true", help="do not wait for /ready")
+    parser.add_argument("--timeout", type=float, default=60, help="seconds to wait for the server")
+    parser.add_argument("--output", help="write results as JSON here")
+    args = parser.parse_args()
+
+    imports = [measure_import() for _ in range(args.repeat)]
+    servers = [measure_server(not args.no_ready, args.timeout) for _ in range(args.repeat)]
+    results = {
+        "timestamp": time.strftime("%Y-%m-%dT%H:%M:%SZ", time.gmtime()),
+        "python": sys.version.split()[0],
+        "repeat": args.repeat,
+        "import_ms": _median([r["import_ms"] for r in imports]),
+        "health_ms": _median([r["health_ms"] for r in servers]),
+        "ready_ms": None if args.no_ready else _median([r["ready_ms"] for r in servers]),
+        "slowest_imports": imports[-1]["slowest"],
+        "deferred_imported": sorted({m for r in imports for m in r["deferred_imported"]}),
+    }
+
+    failures: list[str] = []
+    print(f"{'measure':8} {'median ms':>10} {'budget ms':>10}")
+    for name, budget in (
+        ("import", args.import_budget_ms),
+        ("health", args.health_budget_ms),
+        ("ready", None if args.no_ready else args.ready_budget_ms),
+    ):
+        if budget is None:
+            continue
+        value = results[f"{name}_ms"]
+        if value is None:
+            failures.append(f"{name}: not reached")
+            print(f"{name:8} {'-':>10} {budget:10.0f}  NOT REACHED")
+            continue
+        flag = ""
+        if value > budget:
+            flag = "  OVER BUDGET"
+            failures.append(f"{name}: {value} ms > {budget:.0f} ms")
+        print(f"{name:8} {value:10.1f} {budget:10.0f}{flag}")
+    print("\nSlowest imports under meeting_agent.__main__:")
+    for module, ms in results["slowest_imports"]:
+        print(f"  {module:40} {ms:8.1f} ms")
+    if results["deferred_imported"]:
+        failures.append(f"imported eagerly: {', '.join(results['deferred_imported'])}")
+    for line in next((r["log_tail"] for r in servers if "log_tail" in r), []):
+        print(f"  server: {line}")
+    if args.output:
+        Path(args.output).write_text(json.dumps(results, indent=2) + "\n", encoding="utf-8")
+    if failures:
+        print("\nStartup budget exceeded: " + "; ".join(failures))
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
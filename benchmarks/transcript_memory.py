@@ -0,0 +1,100 @@
+"""
+Benchmark: memory held by many parsed transcripts in the three in-memory forms, on synthetic
+Teams transcripts (see vtt_parser.py):
+
+  dict        GraphTranscriptClient result dicts (content_text string, speaker on every line)
+  dataclass   list[TranscriptSegment] per transcript (one object per cue)
+  columnar    ColumnarTranscript (interned speakers, array columns, one UTF-8 text buffer)
+
+    python benchmarks/transcript_memory.py --transcripts 50 --hours 1
+
+Reports memory retained after building all transcripts (tracemalloc; the VTT input is
+generated per transcript and released), build time, and for the columnar form the cost of
+a time-range slice, a speaker slice and rendering back to text.
+"""
+
+import argparse
+import gc
+import time
+import tracemalloc
+from typing import Any, Callable
+
+from meeting_agent.transcript_columns import ColumnarTranscript
+from meeting_agent.transcript_parser import iter_vtt_segments, render_segments
+from vtt_parser import SPEAKERS, iter_vtt_chunks
+
+
+def _dicts(hours: float, count: int) -> list[dict[str, Any]]:
+    return [
+        {
+            "transcript_id": f"transcript-{i}",
+            "meeting_id": f"meeting-{i}",
+            "created_date_time": "2025-01-01T00:00:00.0000000Z",
+            "content_text": render_segments(iter_vtt_segments(iter_vtt_chunks(hours))),
+        }
+        for i in range(count)
+    ]
+
+
+def _dataclasses(hours: float, count: int) -> list[list[Any]]:
+    return [list(iter_vtt_segments(iter_vtt_chunks(hours))) for _ in range(count)]
+
+
+def _columnar(hours: float, count: int) -> list[ColumnarTranscript]:
+    return [ColumnarTranscript.from_vtt(iter_vtt_chunks(hours)) for _ in range(count)]
+
+
+def _retained(build: Callable[[], Any]) -> tuple[Any, float, float]:
+    """(result, seconds, MiB still allocated once build() returns)."""
+    gc.collect()
+    tracemalloc.start()
+    start = time.perf_counter()
+    result = build()
+    seconds = time.perf_counter() - start
+    gc.collect()
+    current, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return result, seconds, current / 2**20
+
+
+def _timed(run: Callable[[], Any], repeat: int = 5) -> float:
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        run()
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--transcripts", type=int, default=50, help="transcripts held in memory")
+    parser.add_argument("--hours", type=float, default=1.0, help="length of each transcript in hours")
+    args = parser.parse_args()
+
+    print(f"{args.transcripts} synthetic transcripts of {args.hours:g} h")
+    print(f"{'form':10} {'build s':>8} {'retained MiB':>13} {'vs dict':>8}")
+    baseline = None
+    columnar: list[ColumnarTranscript] = []
+    for name, build in (("dict", _dicts), ("dataclass", _dataclasses), ("columnar", _columnar)):
+        result, seconds, mib = _retained(lambda: build(args.hours, args.transcripts))
+        baseline = baseline or mib
+        print(f"{name:10} {seconds:8.2f} {mib:13.1f} {mib / baseline:7.2f}x")
+        if name == "columnar":
+            columnar = result
+        del result
+
+    transcript = columnar[0]
+    half = args.hours * 1800
+    print(f"\nColumnar operations on one transcript ({len(transcript)} cues, {transcript.nbytes() / 2**20:.2f} MiB):")
+    for label, run in (
+        ("between (10 min window)", lambda: len(transcript.between(half, half + 600))),
+        ("for_speaker (one speaker)", lambda: len(transcript.for_speaker(SPEAKERS[0]))),
+        ("render (whole transcript)", transcript.render),
+        ("render (10 min window)", lambda: transcript.between(half, half + 600).render()),
+    ):
+        print(f"  {label:28} {1000 * _timed(run):8.3f} ms")
+
+
+if __name__ == "__main__":
+    main()
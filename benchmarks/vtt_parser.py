@@ -0,0 +1,170 @@
+"""
+Benchmark: streaming VttStreamParser vs. the previous whole-string parse_vtt_to_text /
+parse_vtt_to_segments, on synthetic multi-hour Teams transcripts.
+
+    python benchmarks/vtt_parser.py --hours 4 --repeat 3
+
+Reports throughput (MB/s, cues/s) and peak traced memory (tracemalloc) per variant.
+Every variant includes generating the input; the first row shows that cost alone.
+The "stream" variants consume the VTT as 64 KiB chunks generated on the fly, the way
+GraphTranscriptClient reads an httpx response, so the full body is never in memory.
+"""
+
+import argparse
+import gc
+import re
+import time
+import tracemalloc
+from dataclasses import dataclass
+from typing import Callable, Iterator
+
+from meeting_agent.transcript_parser import iter_vtt_segments, parse_vtt_to_segments, render_segments
+
+CHUNK_SIZE = 64 * 1024
+SPEAKERS = ["Adele Vance", "Alex Wilber", "Megan Bowen", "Nestor Wilke", "Patti Fernandez"]
+WORDS = "we should move the release to next week because the budget review is still open".split()
+# Back-channel cues from another speaker, as Teams captions them.
+BACKCHANNEL = ["Yeah.", "Mm-hmm.", "Okay.", "Right, right."]
+
+
+def _timestamp(seconds: float) -> str:
+    h, rem = divmod(seconds, 3600)
+    m, s = divmod(rem, 60)
+    return f"{int(h):02d}:{int(m):02d}:{s:06.3f}"
+
+
+def iter_vtt_chunks(hours: float, chunk_size: int = CHUNK_SIZE) -> Iterator[str]:
+    """Synthetic Teams-style VTT (one ~3 s cue per utterance), yielded in chunk_size pieces."""
+    buffer = ["WEBVTT\n\n"]
+    size = len(buffer[0])
+    t = 0.0
+    i = 0
+    while t < hours * 3600:
+        duration = 1.5 + (i % 7) * 0.5
+        speaker = SPEAKERS[(i // 3) % len(SPEAKERS)]
+        words = " ".join(WORDS[(i + k) % len(WORDS)] for k in range(4 + i % 12)).capitalize() + "."
+        if i % 4 == 3:
+            speaker = SPEAKERS[(i // 3 + 1) % len(SPEAKERS)]
+            words = BACKCHANNEL[i % len(BACKCHANNEL)]
+        elif i % 5 == 0:
+            words = "Um, " + words
+        cue = (
+            f"{i:08x}-0000-0000-0000-000000000000/{i}-0\n"
+            f"{_timestamp(t)} --> {_timestamp(t + duration)}\n"
+            f"<v {speaker}>{words}</v>\n\n"
+        )
+        buffer.append(cue)
+        size += len(cue)
+        if size >= chunk_size:
+            yield "".join(buffer)
+            buffer, size = [], 0
+        t += duration
+        i += 1
+    if buffer:
+        yield "".join(buffer)
+
+
+# Previous implementation, kept here as the baseline.
+@dataclass
+class LegacySegment:
+    speaker: str
+    text: str
+
+
+def legacy_parse_vtt_to_text(vtt_content: str) -> str:
+    if not vtt_content or not vtt_content.strip():
+        return ""
+    lines = vtt_content.strip().splitlines()
+    text_parts: list[str] = []
+    in_cue = False
+    for line in lines:
+        line = line.strip()
+        if not line:
+            continue
+        if line.upper().startswith("WEBVTT"):
+            continue
+        if re.match(r"^\d{2}:\d{2}:\d{2}", line) or " --> " in line:
+            in_cue = True
+            continue
+        if in_cue or "<v " in line:
+            match = re.search(r"<v\s+([^>]+)>\s*([^<]*)\s*</v>", line, re.IGNORECASE)
+            if match:
+                speaker, text = match.group(1).strip(), match.group(2).strip()
+                if text:
+                    text_parts.append(f"{speaker}: {text}")
+            else:
+                if line and not line.startswith("NOTE"):
+                    text_parts.append(line)
+        in_cue = False
+    return "\n".join(text_parts).strip()
+
+
+def legacy_parse_vtt_to_segments(vtt_content: str) -> list[LegacySegment]:
+    if not vtt_content or not vtt_content.strip():
+        return []
+    segments: list[LegacySegment] = []
+    for line in vtt_content.strip().splitlines():
+        line = line.strip()
+        match = re.search(r"<v\s+([^>]+)>\s*([^<]*)\s*</v>", line, re.IGNORECASE)
+        if match:
+            segments.append(LegacySegment(speaker=match.group(1).strip(), text=match.group(2).strip()))
+    return segments
+
+
+def _measure(name: str, run: Callable[[], int], nbytes: int, repeat: int) -> dict[str, float | str]:
+    best = float("inf")
+    cues = 0
+    for _ in range(repeat):
+        gc.collect()
+        start = time.perf_counter()
+        cues = run()
+        best = min(best, time.perf_counter() - start)
+    gc.collect()
+    tracemalloc.start()
+    run()
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return {
+        "variant": name,
+        "seconds": best,
+        "mb_per_s": nbytes / best / 1e6,
+        "cues_per_s": cues / best,
+        "peak_mib": peak / 2**20,
+    }
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--hours", type=float, default=4.0, help="transcript length in hours")
+    parser.add_argument("--repeat", type=int, default=3, help="timing runs per variant (best is reported)")
+    args = parser.parse_args()
+
+    nbytes = sum(len(c) for c in iter_vtt_chunks(args.hours))
+
+    def whole() -> str:
+        return "".join(iter_vtt_chunks(args.hours))
+
+    variants: list[tuple[str, Callable[[], int]]] = [
+        ("(input generation only)", lambda: sum(1 for _ in iter_vtt_chunks(args.hours))),
+        ("legacy text + segments (2 passes)", lambda: (
+            lambda vtt: (legacy_parse_vtt_to_text(vtt), len(legacy_parse_vtt_to_segments(vtt)))[1]
+        )(whole())),
+        ("legacy parse_vtt_to_text", lambda: legacy_parse_vtt_to_text(whole()).count("\n") + 1),
+        ("parse_vtt_to_segments (string)", lambda: len(parse_vtt_to_segments(whole()))),
+        ("stream -> segments + text", lambda: (
+            lambda segs: (render_segments(segs), len(segs))[1]
+        )(list(iter_vtt_segments(iter_vtt_chunks(args.hours))))),
+        ("stream -> count only", lambda: sum(1 for _ in iter_vtt_segments(iter_vtt_chunks(args.hours)))),
+    ]
+    print(f"Synthetic transcript: {args.hours:g} h, {nbytes / 1e6:.1f} MB of VTT")
+    print(f"{'variant':36} {'seconds':>8} {'MB/s':>8} {'cues/s':>10} {'peak MiB':>9}")
+    for name, run in variants:
+        r = _measure(name, run, nbytes, args.repeat)
+        print(
+            f"{r['variant']:36} {r['seconds']:8.3f} {r['mb_per_s']:8.1f} "
+            f"{r['cues_per_s']:10.0f} {r['peak_mib']:9.1f}"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -1,45 +1,239 @@
-"""Entrypoint: run the agent as an aiohttp server (POST /api/messages)."""
+"""
+Entrypoint: run the agent as an aiohttp server (POST /api/messages; WEB_WORKERS > 1 runs
+several worker processes on the port), or with the `precompute` argument run one precompute
+pass and exit (e.g. from cron, off-hours).
+"""
 
 import asyncio
+import importlib
 import logging
 import os
+import sys
+import time
+from typing import TYPE_CHECKING
 
 from aiohttp import web
 
-from meeting_agent.app import get_app_and_adapter
 from meeting_agent.config import load_config
-from microsoft_agents.hosting.aiohttp import start_agent_process
+from meeting_agent.metrics import REGISTRY, CorrelationIdFilter
+from meeting_agent.workers import Supervisor, supervised, worker_index
+
+if TYPE_CHECKING:
+    from meeting_agent.app import AgentRuntime
 
 logging.basicConfig(
     level=logging.INFO,
-    format="%(asctime)s [%(levelname)s] %(name)s: %(message)s",
+    format="%(asctime)s [%(levelname)s] [%(process)d] [%(correlation_id)s] %(name)s: %(message)s",
 )
+for _handler in logging.getLogger().handlers:
+    _handler.addFilter(CorrelationIdFilter())
 logger = logging.getLogger(__name__)
 
+# The agent stack (Agents SDK, msal, httpx, openai) is imported by meeting_agent.app. It is
+# loaded after the port opens, so /health answers during a cold start; see on_startup.
+APP_MODULE = "meeting_agent.app"
+
+RUNTIME_KEY: web.AppKey["asyncio.Future[AgentRuntime]"] = web.AppKey("runtime")
+STARTUP_TASK_KEY = web.AppKey("startup_task", asyncio.Task)
+WORKER_RUNNER_KEY = web.AppKey("worker_runner", web.AppRunner)
+
+
+def _loaded_runtime(app: web.Application) -> "AgentRuntime | None":
+    """The runtime once it has been built, else None."""
+    future = app.get(RUNTIME_KEY)
+    if future is None or not future.done() or future.cancelled() or future.exception() is not None:
+        return None
+    return future.result()
+
 
 async def handle_messages(request: web.Request) -> web.Response:
-    """Handle POST /api/messages: run the agent with CloudAdapter."""
-    app, adapter = get_app_and_adapter()
-    response = await start_agent_process(request, app, adapter)
+    """Handle POST /api/messages: run the agent with CloudAdapter (waits while the runtime loads)."""
+    try:
+        runtime = await asyncio.shield(request.app[RUNTIME_KEY])
+    except Exception:
+        return web.json_response({"status": "unavailable"}, status=503)
+    # Already loaded with the runtime.
+    from microsoft_agents.hosting.aiohttp import start_agent_process
+
+    response = await start_agent_process(request, runtime.agent_app, runtime.adapter)
     if response is None:
         return web.Response(status=500, text="Agent process returned None")
     return response
 
 
+async def handle_health(request: web.Request) -> web.Response:
+    """Handle GET /health: liveness (the process is serving HTTP)."""
+    return web.json_response({"status": "ok"})
+
+
+async def handle_ready(request: web.Request) -> web.Response:
+    """Handle GET /ready: 200 once the runtime has been built and warmed up, else 503."""
+    future = request.app[RUNTIME_KEY]
+    if future.done() and not future.cancelled() and future.exception() is not None:
+        return web.json_response({"status": "failed"}, status=503)
+    runtime = _loaded_runtime(request.app)
+    if runtime is None or not runtime.ready:
+        return web.json_response({"status": "starting"}, status=503)
+    return web.json_response({"status": "ready"})
+
+
+async def handle_metrics(request: web.Request) -> web.Response:
+    """Handle GET /metrics: stage latencies, bytes, tokens, cache and in-flight gauges (Prometheus text)."""
+    return web.Response(
+        body=REGISTRY.render().encode("utf-8"),
+        headers={"Content-Type": "text/plain; version=0.0.4; charset=utf-8"},
+    )
+
+
+async def handle_jobs(request: web.Request) -> web.Response:
+    """Handle GET /api/jobs: status of recent summary jobs (no summary text)."""
+    runtime = _loaded_runtime(request.app)
+    if runtime is None:
+        return web.json_response({"status": "starting"}, status=503)
+    return web.json_response(
+        {
+            "worker": worker_index(),
+            "counts": runtime.jobs.stats(),
+            "jobs": [j.to_dict() for j in runtime.jobs.jobs()],
+        }
+    )
+
+
+async def handle_job(request: web.Request) -> web.Response:
+    """Handle GET /api/jobs/{job_id}: status of one summary job."""
+    runtime = _loaded_runtime(request.app)
+    if runtime is None:
+        return web.json_response({"status": "starting"}, status=503)
+    job = runtime.jobs.get(request.match_info["job_id"])
+    if job is None:
+        # Jobs live in the worker that started them.
+        return web.json_response({"error": "job not found", "worker": worker_index()}, status=404)
+    return web.json_response({**job.to_dict(), "worker": worker_index()})
+
+
+async def _start_runtime(runtime_future: "asyncio.Future[AgentRuntime]") -> None:
+    """Import the agent stack off the event loop, build the runtime once, then warm it up."""
+    started = time.perf_counter()
+    try:
+        app_module = await asyncio.to_thread(importlib.import_module, APP_MODULE)
+        runtime = app_module.get_runtime()
+    except Exception as e:
+        logger.exception("Agent runtime failed to load: %s", e)
+        runtime_future.set_exception(e)
+        return
+    runtime_future.set_result(runtime)
+    logger.info("Agent runtime loaded in %.2fs", time.perf_counter() - started)
+    if worker_index() == 0:
+        # One scheduled pass per host, not one per worker.
+        runtime.start_precompute_schedule()
+    await runtime.warm_up()
+
+
+async def _start_worker_site(app: web.Application, port: int) -> web.AppRunner:
+    """Serve this worker's /metrics and /api/jobs on its own port, so each worker can be scraped."""
+    worker_app = web.Application()
+    worker_app[RUNTIME_KEY] = app[RUNTIME_KEY]
+    worker_app.router.add_get("/metrics", handle_metrics)
+    worker_app.router.add_get("/api/jobs", handle_jobs)
+    worker_app.router.add_get("/api/jobs/{job_id}", handle_job)
+    runner = web.AppRunner(worker_app)
+    await runner.setup()
+    await web.TCPSite(runner, "0.0.0.0", port).start()
+    logger.info("Worker %d serving /metrics and /api/jobs on port %d", worker_index(), port)
+    return runner
+
+
+async def on_startup(app: web.Application) -> None:
+    """Start loading the runtime in the background; the port opens without waiting for it."""
+    runtime_future = asyncio.get_running_loop().create_future()
+    app[RUNTIME_KEY] = runtime_future
+    app[STARTUP_TASK_KEY] = asyncio.create_task(_start_runtime(runtime_future))
+    if supervised():
+        # Metrics and jobs are per worker: label them, and optionally serve them per worker.
+        REGISTRY.set_const_labels(worker=str(worker_index()))
+        metrics_port = load_config(os.environ).worker_metrics_port
+        if metrics_port:
+            app[WORKER_RUNNER_KEY] = await _start_worker_site(app, metrics_port + worker_index())
+
+
+async def on_shutdown(app: web.Application) -> None:
+    """Let running summary jobs finish (and be delivered) before the runtime is closed."""
+    runtime = _loaded_runtime(app)
+    if runtime is not None:
+        await runtime.jobs.drain(runtime.config.shutdown_timeout_seconds)
+
+
+async def on_cleanup(app: web.Application) -> None:
+    """Stop loading or warm-up if still running and close the runtime's clients."""
+    task = app.get(STARTUP_TASK_KEY)
+    if task is not None and not task.done():
+        task.cancel()
+        try:
+            await task
+        except asyncio.CancelledError:
+            pass
+    worker_runner = app.get(WORKER_RUNNER_KEY)
+    if worker_runner is not None:
+        await worker_runner.cleanup()
+    runtime = _loaded_runtime(app)
+    if runtime is not None:
+        from meeting_agent.app import reset_runtime
+
+        await runtime.close()
+        reset_runtime()
+
+
 def create_app() -> web.Application:
-    """Create aiohttp Application with /api/messages route."""
+    """Create aiohttp Application with /api/messages, health/readiness, metrics and job status routes."""
     app = web.Application()
     app.router.add_post("/api/messages", handle_messages)
+    app.router.add_get("/health", handle_health)
+    app.router.add_get("/ready", handle_ready)
+    app.router.add_get("/metrics", handle_metrics)
+    app.router.add_get("/api/jobs", handle_jobs)
+    app.router.add_get("/api/jobs/{job_id}", handle_job)
+    app.on_startup.append(on_startup)
+    app.on_shutdown.append(on_shutdown)
+    app.on_cleanup.append(on_cleanup)
     return app
 
 
+async def precompute() -> None:
+    """Build the runtime, run one precompute pass for the configured organizers, and close it."""
+    from meeting_agent.app import get_runtime, reset_runtime
+
+    runtime = get_runtime()
+    try:
+        await runtime.warm_up()
+        await runtime.precompute()
+    finally:
+        await runtime.close()
+        reset_runtime()
+
+
 def main() -> None:
-    """Run the aiohttp server."""
+    """Run the aiohttp server, or its worker supervisor (or `precompute`: one precompute pass)."""
+    if sys.argv[1:2] == ["precompute"]:
+        asyncio.run(precompute())
+        return
     config = load_config(os.environ)
     port = config.port
-    app = create_app()
-    logger.info("Starting agent server on port %s (POST /api/messages)", port)
-    web.run_app(app, host="0.0.0.0", port=port)
+    logger.info(
+        "Starting agent server on port %s (POST /api/messages, %d worker(s))", port, config.web_workers
+    )
+    if config.web_workers > 1:
+        # Workers import the agent stack after their port opens; the supervisor imports it once
+        # they are running, so restarted workers inherit it instead of importing it again.
+        Supervisor(
+            create_app,
+            "0.0.0.0",
+            port,
+            config.web_workers,
+            config.shutdown_timeout_seconds,
+            preload=lambda: importlib.import_module(APP_MODULE),
+        ).run()
+        return
+    web.run_app(create_app(), host="0.0.0.0", port=port, shutdown_timeout=config.shutdown_timeout_seconds)
 
 
 if __name__ == "__main__":
@@ -1,42 +1,72 @@
 """M365 Agents SDK application: AgentApplication, adapter, and message handler."""
 
+import asyncio
 import logging
 import os
+import sqlite3
+import time
+import uuid
+from dataclasses import replace
+from datetime import datetime
 from pathlib import Path
-from typing import Any
+from typing import Any, AsyncIterator, Awaitable, Callable
 
+from microsoft_agents.activity import Activity
 from microsoft_agents.hosting.core import (
     AgentApplication,
     ApplicationOptions,
     Authorization,
-    MemoryStorage,
     RestChannelServiceClientFactory,
+    Storage,
     TurnState,
 )
 from microsoft_agents.hosting.core.turn_context import TurnContext
-from microsoft_agents.hosting.aiohttp import CloudAdapter, start_agent_process
+from microsoft_agents.hosting.aiohttp import CloudAdapter
 from microsoft_agents.authentication.msal import MsalConnectionManager
 
-from meeting_agent.config import load_config, Config
-from meeting_agent.auth import GraphAuth
+from meeting_agent.archive import ArchiveScope, SummaryArchive
+from meeting_agent.config import MAX_TRANSCRIPT_DAYS, load_config, Config
+from meeting_agent.auth import GraphAuth, GraphTokenManager
+from meeting_agent.file_locks import FileLocks
 from meeting_agent.graph_client import GraphTranscriptClient
-from meeting_agent.summarizer import TranscriptSummarizer
+from meeting_agent.jobs import RUNNING, JobManager, SummaryJob
+from meeting_agent.metrics import (
+    IN_FLIGHT,
+    MESSAGES,
+    REGISTRY,
+    CallbackGauge,
+    new_correlation_id,
+    stage,
+)
+from meeting_agent.precompute import PrecomputedSummaryStore, digest_key, organizer_key
+from meeting_agent.query_scope import (
+    QueryScope,
+    asks_for_summary,
+    is_question,
+    is_scoped_request,
+    parse_query,
+)
+from meeting_agent.replies import MarkdownStreamBuffer, MessagePacer, split_markdown
+from meeting_agent.segment_index import SegmentIndex
+from meeting_agent.state_storage import SqliteStorage
+from meeting_agent.summarizer import OnDelta, TranscriptSummarizer
+from meeting_agent.summary_cache import SummaryCache, sha256_hex
+from meeting_agent.transcript_store import TranscriptStore
+from meeting_agent.workers import supervised, worker_index
 
 logger = logging.getLogger(__name__)
 
-# Lazy-initialized services (Graph client, summarizer)
-_graph_client: GraphTranscriptClient | None = None
-_summarizer: TranscriptSummarizer | None = None
+BOT_FRAMEWORK_RESOURCE = "https://api.botframework.com"
+
+# Process-wide runtime, built once (see get_runtime)
+_runtime: "AgentRuntime | None" = None
 
 
-def _ensure_services(config: Config) -> tuple[GraphTranscriptClient, TranscriptSummarizer]:
-    global _graph_client, _summarizer
-    if _graph_client is None:
-        auth = GraphAuth(config)
-        _graph_client = GraphTranscriptClient(config, auth)
-    if _summarizer is None:
-        _summarizer = TranscriptSummarizer(config)
-    return _graph_client, _summarizer
+def _default_output_dir() -> str:
+    try:
+        return str(Path(__file__).resolve().parents[2] / "output")
+    except Exception:
+        return "output"
 
 
 def _build_connections_config(config: Config) -> dict[str, Any]:
@@ -55,9 +85,10 @@ def _build_connections_config(config: Config) -> dict[str, Any]:
     }
 
 
-def _create_app_and_adapter() -> tuple[AgentApplication[TurnState], CloudAdapter]:
-    """Create AgentApplication and CloudAdapter for the aiohttp server."""
-    config = load_config(os.environ)
+def _create_app_and_adapter(
+    config: Config, storage: Storage
+) -> tuple[AgentApplication[TurnState], CloudAdapter, MsalConnectionManager]:
+    """Create AgentApplication and CloudAdapter for the aiohttp server (handlers are registered by AgentRuntime)."""
     agents_config = _build_connections_config(config)
     connection_manager = MsalConnectionManager(**agents_config)
     channel_factory = RestChannelServiceClientFactory(connection_manager)
@@ -65,7 +96,6 @@ def _create_app_and_adapter() -> tuple[AgentApplication[TurnState], CloudAdapter
         connection_manager=connection_manager,
         channel_service_client_factory=channel_factory,
     )
-    storage = MemoryStorage()
     authorization = Authorization(storage=storage, connection_manager=connection_manager)
     options = ApplicationOptions(
         bot_app_id=config.microsoft_app_id,
@@ -77,52 +107,663 @@ def _create_app_and_adapter() -> tuple[AgentApplication[TurnState], CloudAdapter
         authorization=authorization,
         **agents_config.get("AGENTAPPLICATION", {}),
     )
+    return app, adapter, connection_manager
+
+
+async def _send_markdown(context: TurnContext, text: str, pacer: MessagePacer | None = None) -> None:
+    """Send text in full, as one or more messages split at Markdown boundaries and paced."""
+    pacer = pacer or MessagePacer()
+    for piece in split_markdown(text):
+        await pacer.wait()
+        await context.send_activity(piece)
+
+
+def _command(text: str, query: bool = False) -> str:
+    """Metric label for a message, in the order on_message dispatches it."""
+    if not text:
+        return "empty"
+    if text.startswith("status"):
+        return "status"
+    if "digest" in text:
+        return "digest"
+    if query:
+        return "query"
+    if "summary" in text or "summarize" in text:
+        return "summary"
+    return "help"
+
+
+def _format_job_status(job: SummaryJob) -> str:
+    line = f"Job {job.job_id}: {job.status}"
+    if job.status == RUNNING and job.started_at:
+        line += f" for {time.time() - job.started_at:.0f}s"
+    elif job.finished_at:
+        line += f", finished {time.time() - job.finished_at:.0f}s ago"
+    if job.error:
+        line += f" ({job.error})"
+    return line
+
+
+class AgentRuntime:
+    """Process-wide agent, adapter and service clients, built once and reused per request."""
+
+    def __init__(self, config: Config):
+        self.config = config
+        self.auth = GraphAuth(config)
+        self.graph_tokens = GraphTokenManager(self.auth)
+        self.transcript_store: TranscriptStore | None = None
+        if config.transcript_store_enabled:
+            self.transcript_store = TranscriptStore(
+                Path(_default_output_dir()) / "transcripts.sqlite3",
+                retention_days=MAX_TRANSCRIPT_DAYS,
+            )
+        self.graph_client = GraphTranscriptClient(config, self.graph_tokens, self.transcript_store)
+        self.summary_cache: SummaryCache | None = None
+        if config.summary_cache_enabled:
+            self.summary_cache = SummaryCache(
+                Path(_default_output_dir()) / "summary_cache.sqlite3",
+                max_bytes=config.summary_cache_max_mb * 1024 * 1024,
+                max_age_seconds=config.summary_cache_max_age_days * 86400,
+            )
+        self.summarizer = TranscriptSummarizer(config, self.summary_cache)
+        self.segment_index: SegmentIndex | None = None
+        if config.segment_index_enabled:
+            try:
+                self.segment_index = SegmentIndex(
+                    Path(_default_output_dir()) / "segment_index.sqlite3",
+                    retention_days=MAX_TRANSCRIPT_DAYS,
+                )
+            except sqlite3.OperationalError as e:
+                logger.warning(
+                    "Segment index unavailable (SQLite without FTS5?); questions use full transcripts: %s", e
+                )
+        self.archive = SummaryArchive(
+            Path(_default_output_dir()) / "archive",
+            compress=config.archive_compress,
+            archive_transcripts=config.archive_transcripts,
+            retention_days=config.archive_retention_days,
+        )
+        self.precomputed = PrecomputedSummaryStore(Path(_default_output_dir()) / "precomputed.sqlite3")
+        self.jobs = JobManager(config.summary_job_concurrency)
+        # Coordinates summary jobs across worker processes (see WEB_WORKERS).
+        self.flights = FileLocks(Path(_default_output_dir()) / "locks")
+        self.turn_state = SqliteStorage(
+            Path(_default_output_dir()) / "turn_state.sqlite3",
+            max_cached=config.turn_state_cache_entries,
+            ttl_seconds=config.turn_state_ttl_hours * 3600,
+            # With several workers, the next turn may land on another process: write through.
+            flush_interval=1.0 if config.web_workers == 1 else 0.0,
+        )
+        self.agent_app, self.adapter, self._connection_manager = _create_app_and_adapter(
+            config, self.turn_state
+        )
+        self._register_handlers()
+        self._register_metrics()
+        self._ready = asyncio.Event()
+
+    @property
+    def ready(self) -> bool:
+        """True once warm_up() has finished."""
+        return self._ready.is_set()
+
+    async def summarize_for_organizer(self, user_id: str, on_delta: OnDelta | None = None) -> str:
+        """
+        Full pipeline for one organizer over the configured window: fetch transcripts, then
+        summarize (the final completion is streamed into on_delta, if given). With
+        PIPELINE_ENABLED, summarization starts on each transcript as soon as it is downloaded.
+        """
+        started = time.time()
+        key = organizer_key(user_id, self.config.transcript_days)
+        scope = ArchiveScope(user_id, *self.config.start_end_utc())
+        if not self.config.pipeline_enabled:
+            transcripts = await self.graph_client.fetch_transcripts_for_user_async(user_id)
+            await self._index(user_id, transcripts)
+            return await self._summarize_fetched(transcripts, key, scope, started, on_delta)
+
+        failed: list[dict[str, Any]] = []
+        fetched: list[dict[str, Any]] = []
+
+        async def downloaded() -> AsyncIterator[dict[str, Any]]:
+            async for t in self.graph_client.iter_transcripts_for_user_async(user_id):
+                if t.get("fetch_error"):
+                    failed.append(t)
+                else:
+                    fetched.append(t)
+                    yield t
+
+        summary = await self.summarizer.summarize_transcript_stream_async(
+            downloaded(), archive=self.archive, scope=scope, on_delta=on_delta
+        )
+        await self._index(user_id, fetched)
+        return await self._finish_summary(summary, len(failed), key, started)
+
+    async def summarize_for_organizers(
+        self, user_ids: tuple[str, ...], on_delta: OnDelta | None = None
+    ) -> str:
+        """Digest over many organizers: batched fetch for all of them, then one combined summary."""
+        started = time.time()
+        digest = f"digest-{sha256_hex(','.join(sorted(user_ids)))[:12]}"
+        scope = ArchiveScope(digest, *self.config.start_end_utc())
+        by_user = await self.graph_client.fetch_transcripts_for_users_async(list(user_ids))
+        for user_id, results in by_user.items():
+            await self._index(user_id, results)
+        transcripts = [t for results in by_user.values() for t in results]
+        return await self._summarize_fetched(
+            transcripts, digest_key(user_ids, self.config.transcript_days), scope, started, on_delta
+        )
+
+    async def summarize_query(self, user_id: str, text: str, on_delta: OnDelta | None = None) -> str:
+        """
+        Answer a question or scoped request over one organizer's window: fetch (and index) the
+        transcripts, parse date, meeting, speaker and topic from text, and summarize only the
+        best-matching segments (up to QUERY_MAX_TOKENS), with text as the focus. The fetch runs
+        under the organizer's single-flight lock, like a summary job's. A summary request that
+        turns out not to be scoped (see _scope) gets the full summary.
+        """
+        started = time.time()
+        start, end = self.config.window_utc()
+        key = organizer_key(user_id, self.config.transcript_days)
+        async with self.flights.hold(key):
+            transcripts = await self.graph_client.fetch_transcripts_for_user_async(user_id)
+            fetched = [t for t in transcripts if not t.get("fetch_error")]
+            await self._index(user_id, fetched)
+        failed = len(transcripts) - len(fetched)
+        if self.segment_index is None:
+            summary = await self.summarizer.summarize_transcripts_async(
+                fetched, combined=True, on_delta=on_delta, focus=text
+            )
+        else:
+            scope, scoped = await asyncio.to_thread(self._scope, user_id, text, start, end)
+            if not scoped:
+                return await self._single_flight(
+                    key,
+                    lambda: self._summarize_fetched(
+                        transcripts, key, ArchiveScope(user_id, *self.config.start_end_utc()), started, on_delta
+                    ),
+                )
+            excerpts = await asyncio.to_thread(
+                self.segment_index.excerpts,
+                user_id,
+                scope.start,
+                scope.end,
+                scope.terms,
+                scope.speakers,
+                scope.meeting_ids,
+                self.config.query_max_tokens,
+            )
+            if not excerpts and scope.terms and (scope.dated or scope.speakers or scope.meeting_ids):
+                # Topic words may name the meeting rather than what was said ("yesterday's
+                # standup"): fall back to everything else in scope.
+                scope = replace(scope, terms=())
+                excerpts = await asyncio.to_thread(
+                    self.segment_index.excerpts,
+                    user_id,
+                    scope.start,
+                    scope.end,
+                    (),
+                    scope.speakers,
+                    scope.meeting_ids,
+                    self.config.query_max_tokens,
+                )
+            logger.info(
+                "Query scope %s: %d meeting(s) with matching segments", scope.describe(), len(excerpts)
+            )
+            if not excerpts:
+                summary = f"Nothing in the meetings I can see matches ({scope.describe()})."
+            else:
+                summary = await self.summarizer.summarize_transcripts_async(
+                    excerpts, combined=True, on_delta=on_delta, focus=text
+                )
+                summary += f"\n\n(From excerpts of {len(excerpts)} meeting(s); {scope.describe()}.)"
+        if failed:
+            summary += (
+                f"\n\nNote: {failed} transcript(s) could not be downloaded from Microsoft Graph "
+                "and are not included. Try again later."
+            )
+        return summary
+
+    def _scope(
+        self, user_id: str | None, text: str, start: datetime, end: datetime
+    ) -> tuple[QueryScope, bool]:
+        """
+        Scope of text within [start, end], with the organizer's indexed speakers and meetings,
+        and whether it is answered from excerpts (is_scoped_request; topic terms count only if
+        they occur in the index). Blocking (index lookups).
+        """
+        index = self.segment_index if user_id else None
+        if not (is_question(text) or asks_for_summary(text)):
+            return parse_query(text, start, end), False
+        if index is None:
+            scope = parse_query(text, start, end)
+            return scope, is_scoped_request(text, scope, None)
+        scope = parse_query(
+            text, start, end, index.speakers(user_id, start, end), index.meeting_ids(user_id, start, end)
+        )
+        return scope, is_scoped_request(
+            text, scope, lambda terms: index.has_matches(user_id, scope.start, scope.end, terms)
+        )
+
+    async def _is_query(self, user_id: str | None, text: str) -> bool:
+        """True if text is a question or scoped summary request (answered by a query job)."""
+        return (await asyncio.to_thread(self._scope, user_id, text, *self.config.window_utc()))[1]
+
+    async def _index(self, user_id: str, transcripts: list[dict[str, Any]]) -> None:
+        """Add fetched transcripts to the segment index (if enabled); failures are logged."""
+        if self.segment_index is None or not transcripts:
+            return
+        try:
+            await asyncio.to_thread(self.segment_index.add, user_id, transcripts)
+        except sqlite3.Error as e:
+            logger.warning("Segment index update failed for organizer %s: %s", user_id, e)
+
+    async def _summarize_fetched(
+        self,
+        transcripts: list[dict[str, Any]],
+        key: str,
+        scope: ArchiveScope,
+        started: float,
+        on_delta: OnDelta | None = None,
+    ) -> str:
+        """
+        Summarize fetched transcripts and archive the summary under scope; a complete result is
+        also kept as the precomputed summary for key.
+        """
+        failed = [t for t in transcripts if t.get("fetch_error")]
+        summary = await self.summarizer.summarize_transcripts_async(
+            [t for t in transcripts if not t.get("fetch_error")],
+            combined=True,
+            archive=self.archive,
+            scope=scope,
+            on_delta=on_delta,
+        )
+        return await self._finish_summary(summary, len(failed), key, started)
+
+    async def _finish_summary(self, summary: str, failed: int, key: str, started: float) -> str:
+        """Note failed downloads in the summary, or keep a complete one as the precomputed summary for key."""
+        if failed:
+            summary += (
+                f"\n\nNote: {failed} transcript(s) could not be downloaded from Microsoft Graph "
+                "and are not included. Try again later."
+            )
+        elif not summary.startswith("(Summarization failed"):
+            await asyncio.to_thread(self.precomputed.put, key, summary, started)
+        return summary
+
+    async def _precomputed_reply(self, key: str) -> str | None:
+        """Stored summary for key if it is current (within PRECOMPUTE_MAX_AGE_MINUTES), as a reply."""
+        found = await asyncio.to_thread(self.precomputed.get, key, self.config.precompute_max_age_minutes * 60)
+        if found is None:
+            return None
+        summary, computed_at = found
+        age_minutes = max(0, int((time.time() - computed_at) // 60))
+        return f"{summary}\n\n(Prepared {age_minutes} min ago.)"
+
+    async def precompute(self) -> None:
+        """
+        One precompute pass: refresh the stored summary of every configured organizer (and the
+        digest, if configured). Runs as ordinary summary jobs, so it shares work with (and is
+        bounded like) interactive requests. Failures are logged per organizer.
+        """
+        new_correlation_id(f"precompute-{uuid.uuid4().hex[:8]}")
+        started = time.perf_counter()
+        jobs = [self.submit_summary_job(u)[0] for u in self.config.precompute_organizers()]
+        if self.config.digest_organizer_user_ids:
+            jobs.append(self.submit_digest_job(self.config.digest_organizer_user_ids)[0])
+        results = await asyncio.gather(*(job.wait() for job in jobs), return_exceptions=True)
+        failed = sum(1 for r in results if isinstance(r, Exception))
+        logger.info(
+            "Precompute pass: %d summary job(s), %d failed, %.1fs",
+            len(jobs),
+            failed,
+            time.perf_counter() - started,
+        )
+
+    def start_precompute_schedule(self) -> None:
+        """Run a precompute pass every PRECOMPUTE_INTERVAL_MINUTES in the background (if set)."""
+        if self.config.precompute_interval_minutes:
+            self.jobs.spawn(self._precompute_loop())
+
+    async def _precompute_loop(self) -> None:
+        interval = self.config.precompute_interval_minutes * 60
+        await self._ready.wait()
+        while True:
+            try:
+                await self.precompute()
+            except Exception as e:
+                logger.exception("Precompute pass failed: %s", e)
+            await asyncio.sleep(interval)
 
-    @app.activity("message")
-    async def on_message(context: TurnContext, state: TurnState) -> bool:
-        """Handle message: fetch transcripts and summarize, or echo help."""
-        text = (context.activity.text or "").strip().lower()
-        if not text:
+    async def _single_flight(self, key: str, run: Callable[[], Awaitable[str]]) -> str:
+        """
+        Run under the cross-process lock for key, so worker processes never fetch or summarize
+        the same organizer and window at once. If the holder we waited for stored a new
+        summary for key, return that instead of running again.
+        """
+        before = await asyncio.to_thread(self.precomputed.get, key, float("inf"))
+        async with self.flights.hold(key) as waited:
+            if waited:
+                after = await asyncio.to_thread(self.precomputed.get, key, float("inf"))
+                if after is not None and after != before:
+                    logger.info("Using the summary another worker just computed for %s", key)
+                    return after[0]
+            return await run()
+
+    def submit_summary_job(self, user_id: str) -> tuple[SummaryJob, bool]:
+        """Queue a summary job for the organizer and window, or join the identical one in flight."""
+        key = (user_id, self.config.transcript_days)
+        return self.jobs.submit(
+            key,
+            lambda job: self._single_flight(
+                organizer_key(user_id, self.config.transcript_days),
+                lambda: self.summarize_for_organizer(user_id, job.publish),
+            ),
+        )
+
+    def submit_digest_job(self, user_ids: tuple[str, ...]) -> tuple[SummaryJob, bool]:
+        """Queue a digest job for the organizers and window, or join the identical one in flight."""
+        key = ("digest", user_ids, self.config.transcript_days)
+        return self.jobs.submit(
+            key,
+            lambda job: self._single_flight(
+                digest_key(user_ids, self.config.transcript_days),
+                lambda: self.summarize_for_organizers(user_ids, job.publish),
+            ),
+        )
+
+    def submit_query_job(self, user_id: str, text: str) -> tuple[SummaryJob, bool]:
+        """Queue a job answering text for the organizer and window, or join the identical one in flight."""
+        key = ("query", user_id, self.config.transcript_days, text)
+        return self.jobs.submit(key, lambda job: self.summarize_query(user_id, text, job.publish))
+
+    async def _deliver(self, continuation: Activity, job: SummaryJob) -> None:
+        """
+        Post the job's summary into the originating conversation as proactive messages: whole
+        Markdown blocks as the final completion streams in (paced to the channel), then the rest
+        of the result once the job finishes. Nothing is truncated.
+        """
+        await job.wait_for_content()
+
+        async def send(proactive_context: TurnContext) -> None:
+            buffer = MarkdownStreamBuffer()
+            pacer = MessagePacer()
+            async for delta in job.follow():
+                buffer.feed(delta)
+                ready = buffer.take_ready() if pacer.ready() else None
+                if ready:
+                    await _send_markdown(proactive_context, ready, pacer)
+            try:
+                result = await job.wait()
+            except Exception as e:
+                result = f"Error: {e}"
+            # The result normally continues the streamed text; if not (it failed midway), send it whole.
+            streamed = buffer.sent.rstrip()
+            rest = result[len(streamed) :] if result.startswith(streamed) else result
+            await _send_markdown(proactive_context, rest, pacer)
+
+        try:
+            await self.adapter.continue_conversation(self.config.microsoft_app_id, continuation, send)
+        except Exception as e:
+            logger.exception("Failed to deliver summary for job %s: %s", job.job_id, e)
+
+    async def _acknowledge(
+        self, context: TurnContext, job: SummaryJob, coalesced: bool, query: bool = False
+    ) -> None:
+        """Tell the user the job is under way, and deliver its result to this conversation when done."""
+        if coalesced:
+            what = "An answer to this request" if query else "A summary for this period"
             await context.send_activity(
-                "Send 'summary' or 'summarize' to get meeting summaries for the last configured days."
+                f"{what} is already being generated (job {job.job_id}). "
+                "I'll post it here when it's ready."
             )
-            return True
-        if "summary" in text or "summarize" in text:
-            user_id = config.meeting_organizer_user_id
-            if not user_id:
+        else:
+            what = "searching them for your request" if query else "generating summary"
+            await context.send_activity(
+                f"Fetching meeting transcripts and {what} (job {job.job_id}). "
+                "I'll post it here when it's ready; send 'status' to check on it."
+            )
+        reference = context.activity.get_conversation_reference()
+        self.jobs.spawn(self._deliver(reference.get_continuation_activity(), job))
+
+    def _register_handlers(self) -> None:
+        app = self.agent_app
+        config = self.config
+
+        @app.activity("message")
+        async def on_message(context: TurnContext, state: TurnState) -> bool:
+            """Instrumented entry point: new correlation ID (inherited by jobs it starts), metrics, then dispatch."""
+            new_correlation_id()
+            text = (context.activity.text or "").strip().lower()
+            command = _command(text)
+            # Status, digest and empty messages are dispatched without reading the index.
+            query = command in ("summary", "help") and await self._is_query(
+                config.meeting_organizer_user_id, text
+            )
+            command = _command(text, query)
+            MESSAGES.inc(command=command)
+            logger.info("Message %s: %s", context.activity.id, command)
+            with IN_FLIGHT.track_in_progress(operation="message"), stage("message"):
+                return await handle_message(context, text, query)
+
+        async def handle_message(context: TurnContext, text: str, query: bool) -> bool:
+            """
+            Handle message: queue a summary job, or a query job for a question or scoped request
+            (results are sent proactively), report job status, or echo help.
+            """
+            if not text:
                 await context.send_activity(
-                    "Meeting organizer user ID is not configured (MEETING_ORGANIZER_USER_ID). "
-                    "Please set it in configuration to fetch your meeting transcripts."
+                    "Send 'summary' or 'summarize' to get meeting summaries for the last configured days, "
+                    "'digest' for the configured team digest, or ask a question such as "
+                    "'what did we decide about the budget?' or 'summary of yesterday's standup'."
                 )
                 return True
-            try:
-                await context.send_activity("Fetching meeting transcripts and generating summary...")
-                graph_client, summarizer = _ensure_services(config)
-                transcripts = graph_client.fetch_transcripts_for_user(user_id)
-                try:
-                    output_dir = str(Path(__file__).resolve().parents[2] / "output")
-                except Exception:
-                    output_dir = "output"
-                summary = summarizer.summarize_transcripts(
-                    transcripts, combined=True, output_dir=output_dir
+            user_id = config.meeting_organizer_user_id
+            if text.startswith("status"):
+                jobs = self.jobs.jobs()
+                lines = [_format_job_status(j) for j in jobs[:5]] or [
+                    "No summary jobs yet. Send 'summary' to start one."
+                ]
+                if supervised():
+                    # Jobs are kept by the worker that runs them; say whose these are.
+                    lines.insert(0, f"Worker {worker_index()} (jobs started on other workers are not listed):")
+                await context.send_activity("\n".join(lines))
+                return True
+            if "digest" in text:
+                if not config.digest_organizer_user_ids:
+                    await context.send_activity(
+                        "Digest organizers are not configured (DIGEST_ORGANIZER_USER_IDS). "
+                        "Please set them in configuration to get a team digest."
+                    )
+                    return True
+                reply = await self._precomputed_reply(
+                    digest_key(config.digest_organizer_user_ids, config.transcript_days)
                 )
-                reply = summary[:4000] + "..." if len(summary) > 4000 else summary
-                await context.send_activity(reply)
-            except Exception as e:
-                logger.exception("Transcript/summary error: %s", e)
-                await context.send_activity(f"Error: {e}")
+                if reply is not None:
+                    await _send_markdown(context, reply)
+                    return True
+                job, coalesced = self.submit_digest_job(config.digest_organizer_user_ids)
+                await self._acknowledge(context, job, coalesced)
+                return True
+            if query or "summary" in text or "summarize" in text:
+                if not user_id:
+                    await context.send_activity(
+                        "Meeting organizer user ID is not configured (MEETING_ORGANIZER_USER_ID). "
+                        "Please set it in configuration to fetch your meeting transcripts."
+                    )
+                    return True
+                if query:
+                    job, coalesced = self.submit_query_job(user_id, text)
+                    await self._acknowledge(context, job, coalesced, query=True)
+                    return True
+                reply = await self._precomputed_reply(organizer_key(user_id, config.transcript_days))
+                if reply is not None:
+                    await _send_markdown(context, reply)
+                    return True
+                job, coalesced = self.submit_summary_job(user_id)
+                await self._acknowledge(context, job, coalesced)
+                return True
+            await context.send_activity(
+                "Send 'summary' or 'summarize' to get meeting summaries, or ask a question about your meetings."
+            )
             return True
-        await context.send_activity("Send 'summary' or 'summarize' to get meeting summaries.")
-        return True
 
-    @app.error
-    async def on_error(context: TurnContext, error: Exception) -> None:
-        logger.exception("Agent error: %s", error)
-        await context.send_activity("The bot encountered an error. Please try again.")
+        @app.error
+        async def on_error(context: TurnContext, error: Exception) -> None:
+            logger.exception("Agent error: %s", error)
+            await context.send_activity("The bot encountered an error. Please try again.")
+
+    def _register_metrics(self) -> None:
+        """Expose the runtime's own counters (scheduler, tokens, cache, jobs) on /metrics at scrape time."""
+
+        def graph_requests() -> dict[tuple[str, ...], float]:
+            stats = self.graph_client.scheduler.stats()
+            return {(k,): stats[k] for k in ("requests", "retries", "throttled", "failures")}
+
+        def graph_concurrency() -> dict[tuple[str, ...], float]:
+            stats = self.graph_client.scheduler.stats()
+            return {("limit",): stats["concurrency_limit"], ("in_flight",): stats["in_flight"]}
+
+        def graph_tokens() -> dict[tuple[str, ...], float]:
+            stats = self.graph_tokens.stats()
+            return {(k,): stats[k] for k in ("refreshes", "failures") if k in stats}
+
+        def summary_cache() -> dict[tuple[str, ...], float]:
+            if self.summary_cache is None:
+                return {}
+            stats = self.summary_cache.stats()
+            return {("entries",): stats["entries"], ("bytes",): stats["bytes"]}
+
+        def summary_jobs() -> dict[tuple[str, ...], float]:
+            return {(status,): count for status, count in self.jobs.stats().items()}
+
+        def archive() -> dict[tuple[str, ...], float]:
+            stats = self.archive.stats()
+            return {("files",): stats["files"], ("bytes",): stats["bytes"]}
+
+        def segment_index() -> dict[tuple[str, ...], float]:
+            if self.segment_index is None:
+                return {}
+            return {(k,): v for k, v in self.segment_index.stats().items()}
+
+        def summary_locks() -> dict[tuple[str, ...], float]:
+            return {("acquired",): self.flights.acquired, ("waited",): self.flights.waited}
+
+        def turn_state() -> dict[tuple[str, ...], float]:
+            stats = self.turn_state.stats()
+            return {(k,): stats[k] for k in ("entries", "cached", "pending")}
+
+        for metric in (
+            CallbackGauge(
+                "meeting_agent_graph_requests_total",
+                "Graph requests sent, retried, throttled and failed.",
+                ("event",),
+                graph_requests,
+                kind="counter",
+            ),
+            CallbackGauge(
+                "meeting_agent_graph_concurrency",
+                "Graph scheduler adaptive limit and requests in flight.",
+                ("value",),
+                graph_concurrency,
+            ),
+            CallbackGauge(
+                "meeting_agent_graph_token_events_total",
+                "Graph token refreshes and refresh failures.",
+                ("event",),
+                graph_tokens,
+                kind="counter",
+            ),
+            CallbackGauge(
+                "meeting_agent_summary_cache_size",
+                "Summary cache entries and stored bytes.",
+                ("value",),
+                summary_cache,
+            ),
+            CallbackGauge(
+                "meeting_agent_summary_jobs", "Known summary jobs by status.", ("status",), summary_jobs
+            ),
+            CallbackGauge(
+                "meeting_agent_summary_locks_total",
+                "Cross-process summary locks taken, and how many had to wait for another worker.",
+                ("outcome",),
+                summary_locks,
+                kind="counter",
+            ),
+            CallbackGauge(
+                "meeting_agent_archive_size", "Archived files and their bytes on disk.", ("value",), archive
+            ),
+            CallbackGauge(
+                "meeting_agent_segment_index_size",
+                "Transcripts and segments in the local search index.",
+                ("value",),
+                segment_index,
+            ),
+            CallbackGauge(
+                "meeting_agent_turn_state",
+                "Stored turn-state entries, entries in the memory cache, and writes not yet flushed.",
+                ("value",),
+                turn_state,
+            ),
+        ):
+            REGISTRY.register(metric)
+
+    async def warm_up(self) -> None:
+        """
+        Prime token caches so the first request does not pay for them, and start the
+        background Graph token refresher.
+        Failures are logged, not raised: the first real request will retry and surface the error.
+        """
+        try:
+            await self.graph_tokens.start()
+        except Exception as e:
+            logger.warning("Graph token warm-up failed: %s", e)
+        try:
+            connection = self._connection_manager.get_default_connection()
+            await connection.get_access_token(
+                BOT_FRAMEWORK_RESOURCE, [f"{BOT_FRAMEWORK_RESOURCE}/.default"]
+            )
+        except Exception as e:
+            logger.warning("Bot Framework token warm-up failed: %s", e)
+        self._ready.set()
+        logger.info("Agent runtime warm-up finished")
+
+    async def close(self) -> None:
+        """Cancel background jobs, then close pooled HTTP clients and local stores."""
+        self._ready.clear()
+        await self.jobs.close()
+        await self.graph_tokens.aclose()
+        logger.info("Graph tokens: %s", self.graph_tokens.stats())
+        logger.info("Graph requests: %s", self.graph_client.scheduler.stats())
+        await self.graph_client.aclose()
+        await self.summarizer.aclose()
+        if self.summary_cache is not None:
+            logger.info("Summary cache: %s", self.summary_cache.stats())
+            self.summary_cache.close()
+        if self.transcript_store is not None:
+            self.transcript_store.close()
+        if self.segment_index is not None:
+            logger.info("Segment index: %s", self.segment_index.stats())
+            self.segment_index.close()
+        self.precomputed.close()
+        self.archive.close()
+        logger.info("Turn state: %s", self.turn_state.stats())
+        await self.turn_state.aclose()
+
+
+def get_runtime() -> AgentRuntime:
+    """Return the process-wide AgentRuntime, creating it on first use."""
+    global _runtime
+    if _runtime is None:
+        _runtime = AgentRuntime(load_config(os.environ))
+    return _runtime
+
 
-    return app, adapter
+def reset_runtime() -> None:
+    """Forget the process-wide runtime (after it has been closed)."""
+    global _runtime
+    _runtime = None
 
 
 def get_app_and_adapter() -> tuple[AgentApplication[TurnState], CloudAdapter]:
     """Return (AgentApplication, CloudAdapter) for the aiohttp server."""
-    return _create_app_and_adapter()
+    runtime = get_runtime()
+    return runtime.agent_app, runtime.adapter
@@ -0,0 +1,282 @@
+"""
+Output archive for generated summaries (and optionally raw transcripts): atomic writes laid out
+by organizer and window, optional gzip, an insert-only SQLite index, and retention cleanup.
+"""
+
+import asyncio
+import contextlib
+import gzip
+import logging
+import os
+import sqlite3
+import tempfile
+import threading
+import time
+import uuid
+from dataclasses import dataclass
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Any
+
+logger = logging.getLogger(__name__)
+
+# Retention cleanup runs after this many writes (and on open), not on every write.
+CLEANUP_EVERY_WRITES = 50
+
+
+def _slug(value: str, limit: int = 64) -> str:
+    return "".join(c if c.isalnum() or c in "-_" else "_" for c in (value or "unknown"))[:limit]
+
+
+def _day(iso: str) -> str:
+    """20250101 from an ISO 8601 timestamp (or the slugged value if it does not parse)."""
+    try:
+        return datetime.fromisoformat(iso.replace("Z", "+00:00")).strftime("%Y%m%d")
+    except ValueError:
+        return _slug(iso)
+
+
+def atomic_write(path: Path, data: bytes) -> None:
+    """Write data to path via a temporary file in the same directory and a rename."""
+    path.parent.mkdir(parents=True, exist_ok=True)
+    fd, tmp = tempfile.mkstemp(dir=path.parent, prefix=f".{path.name}.", suffix=".tmp")
+    try:
+        with os.fdopen(fd, "wb") as f:
+            f.write(data)
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(tmp, path)
+    except BaseException:
+        with contextlib.suppress(FileNotFoundError):
+            os.unlink(tmp)
+        raise
+
+
+def write_flat_summary(output_dir: str | Path, summary: str, meeting_id: str | None = None) -> Path:
+    """
+    Write summary to output_dir/combined_summary.md, or output_dir/summary_<meeting id>.md for
+    one meeting: the flat layout of the deprecated summarize_transcripts(output_dir=...).
+    """
+    name = f"summary_{_slug(meeting_id, 50)}.md" if meeting_id is not None else "combined_summary.md"
+    path = Path(output_dir) / name
+    atomic_write(path, summary.encode("utf-8"))
+    return path
+
+
+@dataclass(frozen=True)
+class ArchiveScope:
+    """Who and which window a summary covers; decides where it is filed and how it is indexed."""
+
+    organizer: str
+    window_start: str
+    window_end: str
+
+
+@dataclass
+class ArchiveEntry:
+    """One archived file, as recorded in the index (path relative to the archive root)."""
+
+    path: str
+    kind: str
+    organizer: str
+    window_start: str
+    window_end: str
+    meeting_id: str | None
+    created_at: float
+    size: int
+
+
+class SummaryArchive:
+    """
+    Files under root/<organizer>/<window start>-<window end>/ (summaries) and
+    root/<organizer>/transcripts/ (raw transcripts, if enabled), each written atomically so
+    concurrent runs never clobber or half-write a file. Every file is recorded in
+    root/index.sqlite3, so past summaries are found by organizer, window or kind without
+    scanning directories. Files older than retention_days are deleted with their index rows.
+    Blocking; the a* methods run off the event loop. Thread-safe.
+    """
+
+    def __init__(
+        self,
+        root: str | Path,
+        compress: bool = False,
+        archive_transcripts: bool = False,
+        retention_days: int = 30,
+    ):
+        self.root = Path(root)
+        self.root.mkdir(parents=True, exist_ok=True)
+        self.compress = compress
+        self.archive_transcripts = archive_transcripts
+        self._retention_seconds = retention_days * 86400
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(self.root / "index.sqlite3", check_same_thread=False)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute(
+            "CREATE TABLE IF NOT EXISTS archive ("
+            " path TEXT PRIMARY KEY,"
+            " kind TEXT NOT NULL,"
+            " organizer TEXT NOT NULL,"
+            " window_start TEXT NOT NULL,"
+            " window_end TEXT NOT NULL,"
+            " meeting_id TEXT,"
+            " created_at REAL NOT NULL,"
+            " size INTEGER NOT NULL)"
+        )
+        self._conn.execute(
+            "CREATE INDEX IF NOT EXISTS archive_organizer ON archive (organizer, kind, created_at)"
+        )
+        self._conn.execute("CREATE INDEX IF NOT EXISTS archive_created ON archive (created_at)")
+        self._conn.commit()
+        self._writes_since_cleanup = 0
+        self.cleanup()
+
+    def _write(self, relative: Path, text: str, entry: dict[str, Any]) -> ArchiveEntry:
+        data = text.encode("utf-8")
+        if self.compress:
+            data = gzip.compress(data, mtime=0)
+            relative = relative.with_name(relative.name + ".gz")
+        atomic_write(self.root / relative, data)
+        archived = ArchiveEntry(path=relative.as_posix(), created_at=time.time(), size=len(data), **entry)
+        with self._lock:
+            self._conn.execute(
+                "INSERT OR REPLACE INTO archive"
+                " (path, kind, organizer, window_start, window_end, meeting_id, created_at, size)"
+                " VALUES (?, ?, ?, ?, ?, ?, ?, ?)",
+                (
+                    archived.path,
+                    archived.kind,
+                    archived.organizer,
+                    archived.window_start,
+                    archived.window_end,
+                    archived.meeting_id,
+                    archived.created_at,
+                    archived.size,
+                ),
+            )
+            self._conn.commit()
+            self._writes_since_cleanup += 1
+            cleanup_due = self._writes_since_cleanup >= CLEANUP_EVERY_WRITES
+        if cleanup_due:
+            self.cleanup()
+        return archived
+
+    def write_summary(
+        self, scope: ArchiveScope, summary: str, kind: str = "combined", meeting_id: str | None = None
+    ) -> ArchiveEntry:
+        """Archive one summary under its organizer and window (a new file per run)."""
+        window = f"{_day(scope.window_start)}-{_day(scope.window_end)}"
+        stamp = datetime.now(timezone.utc).strftime("%Y%m%dT%H%M%S")
+        name = f"{stamp}-{uuid.uuid4().hex[:6]}-{kind}"
+        if meeting_id:
+            name += f"-{_slug(meeting_id, 40)}"
+        return self._write(
+            Path(_slug(scope.organizer)) / window / f"{name}.md",
+            summary,
+            {
+                "kind": kind,
+                "organizer": scope.organizer,
+                "window_start": scope.window_start,
+                "window_end": scope.window_end,
+                "meeting_id": meeting_id,
+            },
+        )
+
+    def write_transcripts(self, scope: ArchiveScope, transcripts: list[dict[str, Any]]) -> int:
+        """Archive raw transcript text (if enabled), once per transcript ID. Returns files written."""
+        if not self.archive_transcripts:
+            return 0
+        written = 0
+        for t in transcripts:
+            if not t.get("content_text"):
+                continue
+            name = f"{_slug(t.get('transcript_id') or '')}.txt"
+            relative = Path(_slug(scope.organizer)) / "transcripts" / name
+            indexed = relative.as_posix() + (".gz" if self.compress else "")
+            with self._lock:
+                known = self._conn.execute("SELECT 1 FROM archive WHERE path = ?", (indexed,)).fetchone()
+            if known:
+                continue
+            self._write(
+                relative,
+                t["content_text"],
+                {
+                    "kind": "transcript",
+                    "organizer": scope.organizer,
+                    "window_start": t.get("created_date_time", ""),
+                    "window_end": t.get("created_date_time", ""),
+                    "meeting_id": t.get("meeting_id"),
+                },
+            )
+            written += 1
+        return written
+
+    async def awrite_summary(
+        self, scope: ArchiveScope, summary: str, kind: str = "combined", meeting_id: str | None = None
+    ) -> ArchiveEntry:
+        return await asyncio.to_thread(self.write_summary, scope, summary, kind, meeting_id)
+
+    async def awrite_transcripts(self, scope: ArchiveScope, transcripts: list[dict[str, Any]]) -> int:
+        return await asyncio.to_thread(self.write_transcripts, scope, transcripts)
+
+    def find(
+        self,
+        organizer: str | None = None,
+        kind: str | None = None,
+        since: float | None = None,
+        limit: int = 20,
+    ) -> list[ArchiveEntry]:
+        """Indexed entries, newest first, optionally filtered by organizer, kind and created_at >= since."""
+        clauses, params = [], []
+        for column, value in (("organizer", organizer), ("kind", kind)):
+            if value is not None:
+                clauses.append(f"{column} = ?")
+                params.append(value)
+        if since is not None:
+            clauses.append("created_at >= ?")
+            params.append(since)
+        where = f" WHERE {' AND '.join(clauses)}" if clauses else ""
+        with self._lock:
+            rows = self._conn.execute(
+                "SELECT path, kind, organizer, window_start, window_end, meeting_id, created_at, size"
+                f" FROM archive{where} ORDER BY created_at DESC LIMIT ?",
+                (*params, limit),
+            ).fetchall()
+        return [ArchiveEntry(*row) for row in rows]
+
+    def read_text(self, entry: ArchiveEntry) -> str:
+        data = (self.root / entry.path).read_bytes()
+        if entry.path.endswith(".gz"):
+            data = gzip.decompress(data)
+        return data.decode("utf-8")
+
+    def cleanup(self) -> int:
+        """Delete files (and index rows) older than the retention period. Returns files removed."""
+        cutoff = time.time() - self._retention_seconds
+        with self._lock:
+            self._writes_since_cleanup = 0
+            rows = self._conn.execute("SELECT path FROM archive WHERE created_at < ?", (cutoff,))
+            paths = [row[0] for row in rows]
+        if not paths:
+            return 0
+        for path in paths:
+            full = self.root / path
+            with contextlib.suppress(FileNotFoundError):
+                full.unlink()
+            with contextlib.suppress(OSError):
+                # Remove the window (and organizer) directory once it is empty.
+                full.parent.rmdir()
+                full.parent.parent.rmdir()
+        with self._lock:
+            self._conn.executemany("DELETE FROM archive WHERE path = ?", [(p,) for p in paths])
+            self._conn.commit()
+        logger.info("Archive: removed %d file(s) past retention", len(paths))
+        return len(paths)
+
+    def stats(self) -> dict[str, int]:
+        with self._lock:
+            files, size = self._conn.execute("SELECT COUNT(*), COALESCE(SUM(size), 0) FROM archive").fetchone()
+        return {"files": files, "bytes": size}
+
+    def close(self) -> None:
+        with self._lock:
+            self._conn.close()
@@ -1,30 +1,47 @@
 """Microsoft Entra ID app-only authentication for Microsoft Graph."""
 
+import asyncio
 import logging
+import threading
+import time
 from typing import Any
 
 import msal
 
 from meeting_agent.config import Config
+from meeting_agent.metrics import STAGE_ERRORS, STAGE_SECONDS
 
 logger = logging.getLogger(__name__)
 
+# Refresh this long before expiry. MSAL itself treats tokens within 5 minutes of expiry as
+# expired, so a refresh inside that margin really goes to Entra instead of its cache.
+REFRESH_MARGIN_SECONDS = 300.0
+# Callers never get a token closer than this to expiry; inside it they wait for a refresh.
+MIN_VALIDITY_SECONDS = 60.0
+RETRY_DELAY_SECONDS = 30.0
+
 
 class GraphAuth:
     """Acquire and cache tokens for Microsoft Graph (app-only)."""
 
     def __init__(self, config: Config):
         self._config = config
-        self._app = msal.ConfidentialClientApplication(
-            client_id=config.client_id,
-            client_credential=config.client_secret,
-            authority=config.authority,
-        )
+        # Built on first use: MSAL performs authority discovery (a network call) on construction.
+        self._app: msal.ConfidentialClientApplication | None = None
         self._scope = [config.graph_scope()]
 
+    def _client_app(self) -> msal.ConfidentialClientApplication:
+        if self._app is None:
+            self._app = msal.ConfidentialClientApplication(
+                client_id=self._config.client_id,
+                client_credential=self._config.client_secret,
+                authority=self._config.authority,
+            )
+        return self._app
+
     def get_token(self) -> dict[str, Any]:
         """Acquire token for Graph (cached by MSAL)."""
-        result = self._app.acquire_token_for_client(scopes=self._scope)
+        result = self._client_app().acquire_token_for_client(scopes=self._scope)
         if "access_token" not in result:
             error = result.get("error_description", result.get("error", "unknown"))
             raise RuntimeError(f"Failed to acquire Graph token: {error}")
@@ -34,3 +51,115 @@ class GraphAuth:
     def access_token(self) -> str:
         """Current access token for Graph."""
         return self.get_token()["access_token"]
+
+
+class GraphTokenManager:
+    """
+    Holds the current Graph token and its expiry for the whole process. A background task
+    refreshes it REFRESH_MARGIN_SECONDS before expiry, so request headers are built from
+    memory. Concurrent callers that find it expired share a single refresh (MSAL runs in a
+    worker thread, never on the event loop).
+    """
+
+    def __init__(self, auth: GraphAuth):
+        self._auth = auth
+        self._token: str | None = None
+        self._expires_at = 0.0  # time.monotonic()
+        self._refresh_task: asyncio.Task | None = None
+        self._background: asyncio.Task | None = None
+        self._sync_lock = threading.Lock()
+        self.refreshes = 0
+        self.failures = 0
+        self.total_refresh_seconds = 0.0
+        self.last_refresh_seconds = 0.0
+
+    def _valid(self, now: float | None = None) -> bool:
+        now = time.monotonic() if now is None else now
+        return self._token is not None and now < self._expires_at - MIN_VALIDITY_SECONDS
+
+    def _acquire(self) -> str:
+        """Blocking MSAL call; records the token, its expiry and refresh latency."""
+        started = time.perf_counter()
+        try:
+            result = self._auth.get_token()
+        except Exception:
+            self.failures += 1
+            STAGE_ERRORS.inc(stage="graph_token")
+            raise
+        elapsed = time.perf_counter() - started
+        STAGE_SECONDS.observe(elapsed, stage="graph_token")
+        self._token = result["access_token"]
+        self._expires_at = time.monotonic() + float(result.get("expires_in", 3600))
+        self.refreshes += 1
+        self.last_refresh_seconds = elapsed
+        self.total_refresh_seconds += elapsed
+        logger.debug("Graph token refreshed in %.3fs, expires in %ss", elapsed, result.get("expires_in"))
+        return self._token
+
+    @property
+    def access_token(self) -> str:
+        """Current token for synchronous callers (refreshes inline only when it has expired)."""
+        if self._valid():
+            return self._token  # type: ignore[return-value]
+        with self._sync_lock:
+            if self._valid():
+                return self._token  # type: ignore[return-value]
+            return self._acquire()
+
+    async def get_token(self) -> str:
+        """Current token; only waits (on a shared refresh) when it has expired."""
+        if self._valid():
+            return self._token  # type: ignore[return-value]
+        return await self.refresh()
+
+    async def refresh(self) -> str:
+        """Refresh now, or join the refresh already in flight."""
+        if self._refresh_task is None or self._refresh_task.done():
+            self._refresh_task = asyncio.ensure_future(asyncio.to_thread(self._acquire))
+        return await asyncio.shield(self._refresh_task)
+
+    async def start(self) -> None:
+        """Start the background refresher and wait for the first token."""
+        if self._background is None:
+            self._background = asyncio.ensure_future(self._refresh_loop())
+        await self.get_token()
+
+    async def _refresh_loop(self) -> None:
+        while True:
+            delay = self._expires_at - REFRESH_MARGIN_SECONDS - time.monotonic()
+            if self._token is None or delay <= 0:
+                delay = 0.0
+            await asyncio.sleep(delay)
+            try:
+                await self.refresh()
+            except Exception as e:
+                logger.warning("Background Graph token refresh failed: %s", e)
+                await asyncio.sleep(RETRY_DELAY_SECONDS)
+                continue
+            if self._expires_at - time.monotonic() <= REFRESH_MARGIN_SECONDS:
+                # Got a token that is already inside the margin (e.g. from a cache); don't spin.
+                await asyncio.sleep(RETRY_DELAY_SECONDS)
+
+    def stats(self) -> dict[str, float]:
+        """Refresh/failure counts, refresh latency, and seconds until the current token expires."""
+        return {
+            "refreshes": self.refreshes,
+            "failures": self.failures,
+            "last_refresh_seconds": round(self.last_refresh_seconds, 4),
+            "avg_refresh_seconds": round(self.total_refresh_seconds / self.refreshes, 4)
+            if self.refreshes
+            else 0.0,
+            "expires_in_seconds": round(max(0.0, self._expires_at - time.monotonic()), 1)
+            if self._token
+            else 0.0,
+        }
+
+    async def aclose(self) -> None:
+        """Stop the background refresher."""
+        if self._background is not None:
+            self._background.cancel()
+            try:
+                await self._background
+            except asyncio.CancelledError:
+                pass
+            self._background = None
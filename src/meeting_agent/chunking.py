@@ -0,0 +1,189 @@
+"""Token-budgeted chunking of transcripts on speaker-turn boundaries (for map-reduce summarization)."""
+
+import logging
+from dataclasses import dataclass
+from typing import Any
+
+from meeting_agent.compaction import CompactionOptions, CompactionReport, compact_segments
+from meeting_agent.metrics import TRANSCRIPT_TOKENS
+from meeting_agent.transcript_parser import TranscriptSegment, parse_text_to_segments
+
+logger = logging.getLogger(__name__)
+
+try:
+    import tiktoken
+
+    _ENCODING = tiktoken.get_encoding("o200k_base")
+except Exception:  # optional dependency (or encoding download unavailable)
+    _ENCODING = None
+
+# Heuristic for English transcript text when tiktoken is not installed.
+CHARS_PER_TOKEN = 4
+
+
+def estimate_tokens(text: str) -> int:
+    """Token count of text (exact with tiktoken installed, otherwise ~4 characters per token)."""
+    if not text:
+        return 0
+    if _ENCODING is not None:
+        return len(_ENCODING.encode(text, disallowed_special=()))
+    return (len(text) + CHARS_PER_TOKEN - 1) // CHARS_PER_TOKEN
+
+
+@dataclass
+class TranscriptChunk:
+    """A token-budgeted slice of one meeting's transcript."""
+
+    meeting_id: str
+    created_date_time: str
+    part: int
+    parts: int
+    text: str
+    tokens: int
+    # Speaker alias legend of a compacted transcript, repeated in every chunk.
+    legend: str = ""
+
+    def render(self) -> str:
+        """Chunk text with its meeting header (what is sent to the model)."""
+        part = f" [part {self.part}/{self.parts}]" if self.parts > 1 else ""
+        legend = f"{self.legend}\n" if self.legend else ""
+        return f"Meeting {self.meeting_id} ({self.created_date_time}){part}:\n{legend}{self.text}"
+
+
+def _turns(segments: list[TranscriptSegment]) -> list[str]:
+    """Merge consecutive segments by the same speaker into one line per speaker turn."""
+    turns: list[str] = []
+    speaker: str | None = None
+    parts: list[str] = []
+    for seg in segments:
+        if seg.speaker != speaker and parts:
+            turns.append(f"{speaker}: {' '.join(parts)}" if speaker else " ".join(parts))
+            parts = []
+        speaker = seg.speaker
+        parts.append(seg.text)
+    if parts:
+        turns.append(f"{speaker}: {' '.join(parts)}" if speaker else " ".join(parts))
+    return turns
+
+
+def _split_oversized(turn: str, max_tokens: int) -> list[str]:
+    """Split a single turn that exceeds the budget on word boundaries."""
+    pieces: list[str] = []
+    words: list[str] = []
+    tokens = 0
+    for word in turn.split(" "):
+        word_tokens = estimate_tokens(word + " ")
+        if words and tokens + word_tokens > max_tokens:
+            pieces.append(" ".join(words))
+            words, tokens = [], 0
+        words.append(word)
+        tokens += word_tokens
+    if words:
+        pieces.append(" ".join(words))
+    return pieces
+
+
+def chunk_segments(segments: list[TranscriptSegment], max_tokens: int) -> list[tuple[str, int]]:
+    """Pack speaker turns into (text, tokens) chunks of at most max_tokens each."""
+    chunks: list[tuple[str, int]] = []
+    lines: list[str] = []
+    tokens = 0
+    for turn in _turns(segments):
+        turn_tokens = estimate_tokens(turn + "\n")
+        pieces = [turn] if turn_tokens <= max_tokens else _split_oversized(turn, max_tokens)
+        for piece in pieces:
+            piece_tokens = turn_tokens if len(pieces) == 1 else estimate_tokens(piece + "\n")
+            if lines and tokens + piece_tokens > max_tokens:
+                chunks.append(("\n".join(lines), tokens))
+                lines, tokens = [], 0
+            lines.append(piece)
+            tokens += piece_tokens
+    if lines:
+        chunks.append(("\n".join(lines), tokens))
+    return chunks
+
+
+def transcript_chunks(
+    t: dict[str, Any], max_tokens: int, compaction: CompactionOptions | None = None
+) -> tuple[list[TranscriptChunk], CompactionReport | None]:
+    """
+    Chunks of one transcript result, compacted first if compaction is given (then also
+    returns the token reduction; otherwise None).
+    """
+    content_text = t.get("content_text", "") or ""
+    segments = parse_text_to_segments(content_text)
+    legend = ""
+    report = None
+    if compaction is not None:
+        raw_segments = len(segments)
+        segments, legend = compact_segments(segments, compaction)
+    legend_tokens = estimate_tokens(legend + "\n") if legend else 0
+    pieces = chunk_segments(segments, max(1, max_tokens - legend_tokens))
+    if compaction is not None:
+        report = CompactionReport(
+            segments_before=raw_segments,
+            segments_after=len(segments),
+            tokens_before=estimate_tokens(content_text),
+            tokens_after=sum(tokens + legend_tokens for _, tokens in pieces),
+        )
+    chunks = [
+        TranscriptChunk(
+            meeting_id=t.get("meeting_id", "") or "unknown",
+            created_date_time=t.get("created_date_time", ""),
+            part=i,
+            parts=len(pieces),
+            text=text,
+            tokens=tokens + legend_tokens,
+            legend=legend,
+        )
+        for i, (text, tokens) in enumerate(pieces, start=1)
+    ]
+    return chunks, report
+
+
+def chunk_transcripts(
+    transcripts: list[dict[str, Any]], max_tokens: int, compaction: CompactionOptions | None = None
+) -> list[TranscriptChunk]:
+    """
+    Split transcript results (from GraphTranscriptClient) into chunks of at most max_tokens,
+    cutting only between speaker turns (or between words for a single over-long turn).
+    With compaction, each transcript is compacted first and its token reduction is logged
+    and counted in TRANSCRIPT_TOKENS. Chunks keep meeting order; meetings without content
+    are skipped.
+    """
+    result: list[TranscriptChunk] = []
+    for t in transcripts:
+        chunks, report = transcript_chunks(t, max_tokens, compaction)
+        if report is not None and report.tokens_before:
+            TRANSCRIPT_TOKENS.inc(report.tokens_before, state="raw")
+            TRANSCRIPT_TOKENS.inc(report.tokens_after, state="compacted")
+            logger.info(
+                "Compacted transcript %s: %d -> %d segments, %d -> %d tokens (-%.0f%%)",
+                t.get("transcript_id") or t.get("meeting_id") or "unknown",
+                report.segments_before,
+                report.segments_after,
+                report.tokens_before,
+                report.tokens_after,
+                100 * report.saved_ratio,
+            )
+        result.extend(chunks)
+    return result
+
+
+def group_for_reduce(texts: list[str], fan_out: int, max_tokens: int) -> list[list[str]]:
+    """Group partial summaries for one reduce call each: at most fan_out items and max_tokens per group."""
+    groups: list[list[str]] = []
+    group: list[str] = []
+    tokens = 0
+    for text in texts:
+        text_tokens = estimate_tokens(text)
+        # A group always takes at least two items so every reduce level shrinks the list.
+        over_budget = tokens + text_tokens > max_tokens and len(group) >= 2
+        if group and (len(group) >= fan_out or over_budget):
+            groups.append(group)
+            group, tokens = [], 0
+        group.append(text)
+        tokens += text_tokens
+    if group:
+        groups.append(group)
+    return groups
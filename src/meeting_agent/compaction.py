@@ -0,0 +1,133 @@
+"""
+Transcript compaction before summarization: fewer prompt tokens for the same content.
+
+Teams VTT has one cue per short utterance, so the raw text repeats the speaker prefix on every
+line and is full of back-channel cues ("mm-hmm", "uh-huh") and disfluencies. Compaction drops
+filler-only cues, removes disfluencies and repeated fillers, normalizes whitespace, merges
+consecutive cues by the same speaker into one turn and, optionally, replaces speaker names
+with short aliases explained in a legend.
+"""
+
+import re
+from dataclasses import dataclass
+from functools import lru_cache
+
+from meeting_agent.config import Config
+from meeting_agent.transcript_parser import TranscriptSegment
+
+# Back-channel sounds only: a cue made of these carries nothing.
+DEFAULT_FILLERS = frozenset("um umm uh uhh hmm mm mhm mmhmm mm-hmm uh-huh".split())
+# Assent words are answers too ("Sure." to "can you take this?"); dropped only if opted in.
+ASSENT_WORDS = frozenset("yeah yep yup ok okay right sure cool alright great thanks".split())
+
+_WHITESPACE_RE = re.compile(r"\s+")
+# "um", "uhh", "hmm" etc. anywhere in a cue (but not inside "uh-huh", "mm-hmm"), with the comma
+# that sets them off.
+_DISFLUENCY_RE = re.compile(r"(?:,\s*)?(?<![\w-])(?:u+h+|u+m+|e+r+m+|h+m+|m+h?m+)(?![\w-]),?", re.IGNORECASE)
+_SPACE_BEFORE_PUNCT_RE = re.compile(r"\s+([.,!?;:])")
+_WORD_RE = re.compile(r"[\w'-]+")
+# Shorter repeated cues ("Yes.") are real answers, not duplicated captions.
+MIN_REPEAT_WORDS = 3
+
+
+@dataclass(frozen=True)
+class CompactionOptions:
+    """Which compaction steps run (from config: see compaction_options)."""
+
+    drop_fillers: bool = True
+    fillers: frozenset[str] = DEFAULT_FILLERS
+    merge_turns: bool = True
+    speaker_aliases: bool = False
+
+
+@dataclass
+class CompactionReport:
+    """Size of one transcript before and after compaction."""
+
+    segments_before: int
+    segments_after: int
+    tokens_before: int
+    tokens_after: int
+
+    @property
+    def saved_ratio(self) -> float:
+        """Fraction of prompt tokens saved (0..1)."""
+        if not self.tokens_before:
+            return 0.0
+        return max(0.0, 1 - self.tokens_after / self.tokens_before)
+
+
+def compaction_options(config: Config) -> CompactionOptions | None:
+    """Options from TRANSCRIPT_COMPACTION_* config, or None if compaction is disabled."""
+    if not config.transcript_compaction_enabled:
+        return None
+    fillers = frozenset(config.transcript_compaction_fillers) or DEFAULT_FILLERS
+    if config.transcript_compaction_drop_assent:
+        fillers |= ASSENT_WORDS
+    return CompactionOptions(fillers=fillers, speaker_aliases=config.transcript_speaker_aliases)
+
+
+@lru_cache(maxsize=8)
+def _repeat_re(fillers: frozenset[str]) -> re.Pattern[str]:
+    """Immediately repeated filler words ("mm-hmm, mm-hmm"); other repeats ("no, no", "10, 10") are kept."""
+    words = "|".join(re.escape(w) for w in sorted(fillers, key=len, reverse=True))
+    return re.compile(rf"(?<![\w'-])({words})(?:[\s,]+\1)+(?![\w'-])", re.IGNORECASE)
+
+
+def clean_text(text: str, fillers: frozenset[str] = DEFAULT_FILLERS) -> str:
+    """Normalize whitespace and remove disfluencies and repeated filler words from one cue."""
+    text = _DISFLUENCY_RE.sub("", text)
+    if fillers:
+        text = _repeat_re(fillers).sub(r"\1", text)
+    text = _WHITESPACE_RE.sub(" ", text)
+    return _SPACE_BEFORE_PUNCT_RE.sub(r"\1", text).strip(" ,")
+
+
+def is_filler(text: str, fillers: frozenset[str] = DEFAULT_FILLERS) -> bool:
+    """True if the cue consists only of back-channel words ("Mm-hmm.", "Uh-huh, hmm.")."""
+    words = (w.strip("'-") for w in _WORD_RE.findall(text.lower()))
+    return all(not w or w in fillers for w in words)
+
+
+def speaker_aliases(segments: list[TranscriptSegment]) -> dict[str, str]:
+    """Short alias (S1, S2, ...) per named speaker, in order of first appearance."""
+    aliases: dict[str, str] = {}
+    for seg in segments:
+        if seg.speaker and seg.speaker not in aliases:
+            aliases[seg.speaker] = f"S{len(aliases) + 1}"
+    return aliases
+
+
+def alias_legend(aliases: dict[str, str]) -> str:
+    """Legend line that goes with every chunk of an aliased transcript."""
+    if not aliases:
+        return ""
+    pairs = ", ".join(f"{alias} = {name}" for name, alias in aliases.items())
+    return f"Speakers (use the full names in the summary): {pairs}"
+
+
+def compact_segments(
+    segments: list[TranscriptSegment], options: CompactionOptions
+) -> tuple[list[TranscriptSegment], str]:
+    """Compacted segments plus the alias legend ("" unless options.speaker_aliases)."""
+    aliases = speaker_aliases(segments) if options.speaker_aliases else {}
+    out: list[TranscriptSegment] = []
+    for seg in segments:
+        if options.drop_fillers and is_filler(seg.text, options.fillers):
+            continue
+        text = clean_text(seg.text, options.fillers)
+        if not any(c.isalnum() for c in text):
+            continue
+        speaker = aliases.get(seg.speaker, seg.speaker)
+        if out and out[-1].speaker == speaker:
+            last = out[-1]
+            if len(text.split()) >= MIN_REPEAT_WORDS and last.text.endswith(text):
+                # Repeated fragment (the same words captioned twice).
+                last.end = seg.end
+                continue
+            if options.merge_turns:
+                last.text = f"{last.text} {text}"
+                last.end = seg.end
+                continue
+        out.append(TranscriptSegment(speaker=speaker, text=text, start=seg.start, end=seg.end))
+    return out, alias_legend(aliases)
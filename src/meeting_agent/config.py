@@ -4,6 +4,12 @@ import os
 from dataclasses import dataclass
 from datetime import datetime, timedelta, timezone
 
+# Upper bound for TRANSCRIPT_DAYS; local transcript data older than this is pruned.
+MAX_TRANSCRIPT_DAYS = 14
+# Upper bound for SUMMARY_CHUNK_TOKENS: at ~4 characters per token, a chunk and its prompt
+# stay under summarizer.MAX_SINGLE_CALL_CHARS (50000).
+MAX_CHUNK_TOKENS = 11000
+
 
 @dataclass
 class Config:
@@ -34,15 +40,91 @@ class Config:
     # Optional: default organizer user ID for transcript fetch
     meeting_organizer_user_id: str | None
 
+    # Graph HTTP client: concurrent transcript content downloads, optional HTTP/2
+    graph_max_concurrency: int = 8
+    graph_http2: bool = False
+    # Retries per Graph request on throttling (429/503) and transient errors
+    graph_max_retries: int = 5
+
+    # Azure OpenAI: concurrent per-meeting completions
+    openai_max_concurrency: int = 4
+
+    # Map-reduce summarization: tokens per transcript chunk, partial summaries per reduce call
+    summary_chunk_tokens: int = 6000
+    summary_reduce_fan_out: int = 8
+
+    # Streaming pipeline (list -> download and parse -> map summarization run concurrently):
+    # on/off, transcripts buffered between stages and map completions outstanding
+    pipeline_enabled: bool = True
+    pipeline_queue_size: int = 8
+
+    # Persistent summary cache (SQLite under output/)
+    summary_cache_enabled: bool = True
+    summary_cache_max_mb: int = 100
+    summary_cache_max_age_days: int = 30
+
+    # Local transcript store for incremental Graph sync (SQLite under output/)
+    transcript_store_enabled: bool = True
+
+    # Transcript compaction before summarization: on/off, filler words (empty = built-in list),
+    # assent words ("okay", "sure") as fillers too, and S1/S2 speaker aliases with a legend
+    transcript_compaction_enabled: bool = True
+    transcript_compaction_fillers: tuple[str, ...] = ()
+    transcript_compaction_drop_assent: bool = False
+    transcript_speaker_aliases: bool = False
+
+    # Output archive (output/archive/): gzip files, also keep raw transcripts, retention
+    archive_compress: bool = False
+    archive_transcripts: bool = False
+    archive_retention_days: int = 30
+
+    # Questions and scoped requests: local segment search index (SQLite FTS5 under output/),
+    # transcript tokens sent to the model per answer
+    segment_index_enabled: bool = True
+    query_max_tokens: int = 6000
+
+    # Server processes (pre-forked workers sharing the port) and graceful shutdown/restart timeout
+    web_workers: int = 1
+    shutdown_timeout_seconds: int = 30
+    # First of the per-worker ports serving /metrics and /api/jobs (worker N: this + N; 0: off)
+    worker_metrics_port: int = 0
+
+    # Conversation/user turn state (SQLite under output/): entries kept in memory, idle expiry
+    turn_state_cache_entries: int = 1000
+    turn_state_ttl_hours: int = 168
+
+    # Background summary jobs running at once
+    summary_job_concurrency: int = 2
+
+    # Optional: organizers covered by a team/department digest ("digest" message)
+    digest_organizer_user_ids: tuple[str, ...] = ()
+
+    # Scheduled pre-computation: organizers to walk (default: meeting_organizer_user_id),
+    # in-process interval (0 = only via `python -m meeting_agent precompute`), and how old a
+    # stored summary may be and still answer a request directly
+    precompute_organizer_user_ids: tuple[str, ...] = ()
+    precompute_interval_minutes: int = 0
+    precompute_max_age_minutes: int = 60
+
     def graph_scope(self) -> str:
         return "https://graph.microsoft.com/.default"
 
+    def window_utc(self) -> tuple[datetime, datetime]:
+        """Return (start, end) of the transcript window as aware UTC datetimes."""
+        end = datetime.now(timezone.utc)
+        return end - timedelta(days=self.transcript_days), end
+
     def start_end_utc(self) -> tuple[str, str]:
         """Return (startDateTime, endDateTime) in ISO 8601 UTC for getAllTranscripts."""
-        end = datetime.now(timezone.utc)
-        start = end - timedelta(days=self.transcript_days)
+        start, end = self.window_utc()
         return start.strftime("%Y-%m-%dT%H:%M:%SZ"), end.strftime("%Y-%m-%dT%H:%M:%SZ")
 
+    def precompute_organizers(self) -> tuple[str, ...]:
+        """Organizers the precompute pass covers."""
+        if self.precompute_organizer_user_ids:
+            return self.precompute_organizer_user_ids
+        return (self.meeting_organizer_user_id,) if self.meeting_organizer_user_id else ()
+
 
 def load_config(environ: dict[str, str] | None = None) -> Config:
     """Load configuration from environment."""
@@ -51,6 +133,22 @@ def load_config(environ: dict[str, str] | None = None) -> Config:
     def get(key: str, default: str = "") -> str:
         return env.get(key, default).strip()
 
+    def get_int(key: str, default: int, minimum: int = 1, maximum: int | None = None) -> int:
+        try:
+            value = max(minimum, int(get(key, str(default))))
+        except ValueError:
+            return default
+        return value if maximum is None else min(maximum, value)
+
+    def get_ids(key: str) -> tuple[str, ...]:
+        return tuple(dict.fromkeys(u.strip() for u in get(key).split(",") if u.strip()))
+
+    def get_bool(key: str, default: bool = False) -> bool:
+        value = get(key)
+        if not value:
+            return default
+        return value.lower() in ("1", "true", "yes", "on")
+
     tenant_id = get("TENANT_ID")
     client_id = get("CLIENT_ID") or get("MicrosoftAppId")
     client_secret = get("CLIENT_SECRET") or get("MicrosoftAppPassword")
@@ -58,7 +156,7 @@ def load_config(environ: dict[str, str] | None = None) -> Config:
 
     transcript_days_str = get("TRANSCRIPT_DAYS", "7")
     try:
-        transcript_days = max(1, min(14, int(transcript_days_str)))
+        transcript_days = max(1, min(MAX_TRANSCRIPT_DAYS, int(transcript_days_str)))
     except ValueError:
         transcript_days = 7
 
@@ -86,4 +184,35 @@ def load_config(environ: dict[str, str] | None = None) -> Config:
         azure_openai_api_version=api_version,
         port=port,
         meeting_organizer_user_id=get("MEETING_ORGANIZER_USER_ID") or None,
+        graph_max_concurrency=get_int("GRAPH_MAX_CONCURRENCY", 8),
+        graph_http2=get_bool("GRAPH_HTTP2"),
+        graph_max_retries=get_int("GRAPH_MAX_RETRIES", 5, minimum=0),
+        openai_max_concurrency=get_int("AZURE_OPENAI_MAX_CONCURRENCY", 4),
+        summary_chunk_tokens=get_int("SUMMARY_CHUNK_TOKENS", 6000, minimum=500, maximum=MAX_CHUNK_TOKENS),
+        summary_reduce_fan_out=get_int("SUMMARY_REDUCE_FAN_OUT", 8, minimum=2),
+        pipeline_enabled=get_bool("PIPELINE_ENABLED", True),
+        pipeline_queue_size=get_int("PIPELINE_QUEUE_SIZE", 8),
+        summary_cache_enabled=get_bool("SUMMARY_CACHE_ENABLED", True),
+        summary_cache_max_mb=get_int("SUMMARY_CACHE_MAX_MB", 100),
+        summary_cache_max_age_days=get_int("SUMMARY_CACHE_MAX_AGE_DAYS", 30),
+        transcript_store_enabled=get_bool("TRANSCRIPT_STORE_ENABLED", True),
+        transcript_compaction_enabled=get_bool("TRANSCRIPT_COMPACTION_ENABLED", True),
+        transcript_compaction_fillers=tuple(w.lower() for w in get_ids("TRANSCRIPT_COMPACTION_FILLERS")),
+        transcript_compaction_drop_assent=get_bool("TRANSCRIPT_COMPACTION_DROP_ASSENT"),
+        transcript_speaker_aliases=get_bool("TRANSCRIPT_SPEAKER_ALIASES"),
+        archive_compress=get_bool("ARCHIVE_COMPRESS"),
+        archive_transcripts=get_bool("ARCHIVE_TRANSCRIPTS"),
+        archive_retention_days=get_int("ARCHIVE_RETENTION_DAYS", 30),
+        segment_index_enabled=get_bool("SEGMENT_INDEX_ENABLED", True),
+        query_max_tokens=get_int("QUERY_MAX_TOKENS", 6000, minimum=500),
+        web_workers=get_int("WEB_WORKERS", 1, minimum=0) or os.cpu_count() or 1,
+        shutdown_timeout_seconds=get_int("SHUTDOWN_TIMEOUT_SECONDS", 30, minimum=0),
+        worker_metrics_port=get_int("WORKER_METRICS_PORT", 0, minimum=0, maximum=65535),
+        turn_state_cache_entries=get_int("TURN_STATE_CACHE_ENTRIES", 1000),
+        turn_state_ttl_hours=get_int("TURN_STATE_TTL_HOURS", 168),
+        summary_job_concurrency=get_int("SUMMARY_JOB_CONCURRENCY", 2),
+        digest_organizer_user_ids=get_ids("DIGEST_ORGANIZER_USER_IDS"),
+        precompute_organizer_user_ids=get_ids("PRECOMPUTE_ORGANIZER_USER_IDS"),
+        precompute_interval_minutes=get_int("PRECOMPUTE_INTERVAL_MINUTES", 0, minimum=0),
+        precompute_max_age_minutes=get_int("PRECOMPUTE_MAX_AGE_MINUTES", 60),
     )
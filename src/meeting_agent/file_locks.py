@@ -0,0 +1,63 @@
+"""
+Cross-process single-flight: one advisory lock file per key (fcntl.flock), shared by every
+worker process using the same directory. The lock is released when the holder exits or crashes.
+"""
+
+import asyncio
+import contextlib
+import logging
+import os
+from pathlib import Path
+from typing import AsyncIterator
+
+from meeting_agent.summary_cache import sha256_hex
+
+try:
+    import fcntl
+except ImportError:  # Windows: a single process only, nothing to coordinate with
+    fcntl = None
+
+logger = logging.getLogger(__name__)
+
+
+class FileLocks:
+    """
+    Keyed exclusive locks under directory. Waiting polls a non-blocking flock every
+    poll_interval seconds, so it never blocks the event loop and can be cancelled.
+    Lock files are small and reused, never deleted (deleting a flock file is racy).
+    """
+
+    def __init__(self, directory: str | Path, poll_interval: float = 0.2):
+        self._dir = Path(directory)
+        self._dir.mkdir(parents=True, exist_ok=True)
+        self._poll_interval = poll_interval
+        self.acquired = 0
+        self.waited = 0
+
+    def path(self, key: str) -> Path:
+        return self._dir / f"{sha256_hex(key)[:32]}.lock"
+
+    @contextlib.asynccontextmanager
+    async def hold(self, key: str) -> AsyncIterator[bool]:
+        """Hold the lock for key; yields True if another holder had to be waited for."""
+        if fcntl is None:
+            yield False
+            return
+        fd = os.open(self.path(key), os.O_RDWR | os.O_CREAT, 0o644)
+        waited = False
+        try:
+            while True:
+                try:
+                    fcntl.flock(fd, fcntl.LOCK_EX | fcntl.LOCK_NB)
+                    break
+                except BlockingIOError:
+                    if not waited:
+                        waited = True
+                        self.waited += 1
+                        logger.info("Waiting for another process working on %s", key)
+                    await asyncio.sleep(self._poll_interval)
+            self.acquired += 1
+            yield waited
+        finally:
+            # Closing the descriptor releases the lock.
+            os.close(fd)
@@ -1,33 +1,140 @@
 """Microsoft Graph client for meeting transcripts."""
 
+import asyncio
+import base64
+import binascii
+import importlib.util
 import logging
-from datetime import datetime
-from typing import Any
+import time
+from datetime import datetime, timedelta
+from typing import Any, AsyncIterator
 
 import httpx
 
-from meeting_agent.auth import GraphAuth
+from meeting_agent.auth import GraphTokenManager
 from meeting_agent.config import Config
-from meeting_agent.transcript_parser import parse_vtt_to_text
+from meeting_agent.graph_scheduler import (
+    RETRY_STATUSES,
+    THROTTLE_STATUSES,
+    GraphRequestScheduler,
+    parse_retry_after,
+)
+from meeting_agent.metrics import GRAPH_BYTES, STAGE_SECONDS, TRANSCRIPTS_PER_REQUEST, stage
+from meeting_agent.pipeline import StageQueue
+from meeting_agent.transcript_columns import ColumnarTranscript, ColumnarTranscriptBuilder
+from meeting_agent.transcript_parser import (
+    TranscriptSegment,
+    VttStreamParser,
+    parse_vtt_to_text,
+)
+from meeting_agent.transcript_store import TranscriptStore, parse_graph_datetime
 
 logger = logging.getLogger(__name__)
 
 GRAPH_BASE = "https://graph.microsoft.com/v1.0"
 
+# Incremental sync re-lists this much before the watermark; already-stored IDs are not re-downloaded.
+WATERMARK_OVERLAP = timedelta(minutes=5)
+
+# Graph $batch accepts at most 20 sub-requests per call.
+BATCH_MAX_REQUESTS = 20
+
+
+def _http2_available() -> bool:
+    return importlib.util.find_spec("h2") is not None
+
 
 class GraphTranscriptClient:
     """Fetch meeting transcripts via Microsoft Graph getAllTranscripts and content URL."""
 
-    def __init__(self, config: Config, auth: GraphAuth):
+    def __init__(
+        self,
+        config: Config,
+        tokens: GraphTokenManager,
+        store: TranscriptStore | None = None,
+        scheduler: GraphRequestScheduler | None = None,
+        transport: httpx.AsyncBaseTransport | None = None,
+    ):
         self._config = config
-        self._auth = auth
+        self._tokens = tokens
+        self._store = store
+        # Shared by every Graph call: Retry-After, retries and adaptive concurrency.
+        self.scheduler = scheduler or GraphRequestScheduler(
+            config.graph_max_concurrency, config.graph_max_retries
+        )
+        self._http = httpx.Client(timeout=60.0)
+        http2 = config.graph_http2
+        if http2 and not _http2_available():
+            logger.warning("GRAPH_HTTP2 is set but the 'h2' package is not installed; using HTTP/1.1")
+            http2 = False
+        # transport: optional override for the async client (e.g. local Graph stand-ins in benchmarks).
+        self._async_http = httpx.AsyncClient(
+            timeout=60.0,
+            http2=http2,
+            transport=transport,
+            limits=httpx.Limits(
+                max_connections=config.graph_max_concurrency + 2,
+                max_keepalive_connections=config.graph_max_concurrency + 2,
+                keepalive_expiry=60.0,
+            ),
+        )
+
+    def close(self) -> None:
+        """Close the pooled sync HTTP client."""
+        self._http.close()
+
+    async def aclose(self) -> None:
+        """Close both pooled HTTP clients."""
+        self._http.close()
+        await self._async_http.aclose()
 
     def _headers(self) -> dict[str, str]:
         return {
-            "Authorization": f"Bearer {self._auth.access_token}",
+            "Authorization": f"Bearer {self._tokens.access_token}",
             "Content-Type": "application/json",
         }
 
+    async def _headers_async(self) -> dict[str, str]:
+        # Served from memory; the token manager refreshes ahead of expiry in the background.
+        token = await self._tokens.get_token()
+        return {
+            "Authorization": f"Bearer {token}",
+            "Content-Type": "application/json",
+        }
+
+    @staticmethod
+    def _all_transcripts_url(user_id: str, start_date_time: str, end_date_time: str) -> str:
+        return (
+            f"{GRAPH_BASE}/users/{user_id}/onlineMeetings/getAllTranscripts"
+            f"(meetingOrganizerUserId='{user_id}',startDateTime={start_date_time},endDateTime={end_date_time})"
+        )
+
+    @staticmethod
+    def _absolute_content_url(content_url: str) -> str:
+        if not content_url.startswith("http"):
+            content_url = GRAPH_BASE.rstrip("/") + ("/" + content_url.lstrip("/"))
+        return content_url
+
+    @staticmethod
+    def _result(
+        meta: dict[str, Any],
+        content_text: str,
+        error: str | None = None,
+        transcript: ColumnarTranscript | None = None,
+    ) -> dict[str, Any]:
+        result: dict[str, Any] = {
+            "transcript_id": meta.get("id"),
+            "meeting_id": meta.get("meetingId"),
+            "created_date_time": meta.get("createdDateTime", ""),
+            "content_text": content_text,
+        }
+        if transcript is not None:
+            # Cue start times (ms from the meeting start), one per content_text line.
+            result["cue_starts_ms"] = transcript.start_times_ms()
+        if error is not None:
+            result["fetch_error"] = error
+        return result
+
     def get_all_transcripts(
         self,
         user_id: str,
@@ -38,19 +145,14 @@ class GraphTranscriptClient:
         GET /users/{userId}/onlineMeetings/getAllTranscripts(meetingOrganizerUserId=..., startDateTime=..., endDateTime=...)
         Returns list of callTranscript objects (id, meetingId, transcriptContentUrl, createdDateTime, etc.).
         """
-        url = (
-            f"{GRAPH_BASE}/users/{user_id}/onlineMeetings/getAllTranscripts"
-            f"(meetingOrganizerUserId='{user_id}',startDateTime={start_date_time},endDateTime={end_date_time})"
-        )
+        url = self._all_transcripts_url(user_id, start_date_time, end_date_time)
         all_transcripts: list[dict[str, Any]] = []
-        with httpx.Client(timeout=60.0) as client:
-            while url:
-                resp = client.get(url, headers=self._headers())
-                resp.raise_for_status()
-                data = resp.json()
-                value = data.get("value", [])
-                all_transcripts.extend(value)
-                url = data.get("@odata.nextLink")
+        while url:
+            resp = self.scheduler.request_sync(self._http, "GET", url, self._headers)
+            data = resp.json()
+            value = data.get("value", [])
+            all_transcripts.extend(value)
+            url = data.get("@odata.nextLink")
         return all_transcripts
 
     def get_transcript_content(self, content_url: str) -> str:
@@ -58,12 +160,10 @@ class GraphTranscriptClient:
         GET transcript content (VTT). content_url is the transcriptContentUrl from callTranscript
         or the full URL to .../transcripts/{id}/content.
         """
-        if not content_url.startswith("http"):
-            content_url = GRAPH_BASE.rstrip("/") + ("/" + content_url.lstrip("/"))
-        with httpx.Client(timeout=30.0) as client:
-            resp = client.get(content_url, headers=self._headers())
-            resp.raise_for_status()
-            return resp.text
+        resp = self.scheduler.request_sync(
+            self._http, "GET", self._absolute_content_url(content_url), self._headers, timeout=30.0
+        )
+        return resp.text
 
     def fetch_transcripts_for_user(
         self,
@@ -81,9 +181,6 @@ class GraphTranscriptClient:
         transcripts_meta = self.get_all_transcripts(user_id, start, end)
         results: list[dict[str, Any]] = []
         for t in transcripts_meta:
-            transcript_id = t.get("id")
-            meeting_id = t.get("meetingId")
-            created = t.get("createdDateTime", "")
             content_url = t.get("transcriptContentUrl")
             if not content_url:
                 continue
@@ -91,18 +188,487 @@ class GraphTranscriptClient:
                 vtt = self.get_transcript_content(content_url)
                 content_text = parse_vtt_to_text(vtt)
             except Exception as e:
-                logger.warning("Failed to fetch transcript content %s: %s", transcript_id, e)
-                content_text = ""
-            results.append(
-                {
-                    "transcript_id": transcript_id,
-                    "meeting_id": meeting_id,
-                    "created_date_time": created,
-                    "content_text": content_text,
-                }
+                logger.warning("Failed to fetch transcript content %s: %s", t.get("id"), e)
+                results.append(self._result(t, "", str(e)))
+                continue
+            results.append(self._result(t, content_text))
+        return results
+
+    async def get_all_transcripts_async(
+        self,
+        user_id: str,
+        start_date_time: str,
+        end_date_time: str,
+    ) -> list[dict[str, Any]]:
+        """Async get_all_transcripts on the pooled AsyncClient (follows @odata.nextLink)."""
+        all_transcripts: list[dict[str, Any]] = []
+        with stage("graph_list"):
+            async for page in self.iter_transcript_pages_async(user_id, start_date_time, end_date_time):
+                all_transcripts.extend(page)
+        return all_transcripts
+
+    async def iter_transcript_pages_async(
+        self,
+        user_id: str,
+        start_date_time: str,
+        end_date_time: str,
+    ) -> AsyncIterator[list[dict[str, Any]]]:
+        """getAllTranscripts one page at a time: each page's callTranscripts as soon as it arrives."""
+        url = self._all_transcripts_url(user_id, start_date_time, end_date_time)
+        while url:
+            resp = await self.scheduler.request(self._async_http, "GET", url, self._headers_async)
+            data = resp.json()
+            yield data.get("value", [])
+            url = data.get("@odata.nextLink")
+
+    async def get_transcript_content_async(self, content_url: str) -> str:
+        """Async get_transcript_content on the pooled AsyncClient."""
+        with stage("graph_download"):
+            resp = await self.scheduler.request(
+                self._async_http,
+                "GET",
+                self._absolute_content_url(content_url),
+                self._headers_async,
+                timeout=30.0,
             )
+        GRAPH_BYTES.inc(len(resp.content))
+        return resp.text
+
+    async def get_transcript_segments_async(self, content_url: str) -> list[TranscriptSegment]:
+        """Stream transcript content (VTT) and parse it as chunks arrive, without buffering the body."""
+        return list(await self.get_transcript_columns_async(content_url))
+
+    async def get_transcript_columns_async(self, content_url: str) -> ColumnarTranscript:
+        """
+        Stream transcript content (VTT) and parse it as chunks arrive into a ColumnarTranscript,
+        without buffering the body or keeping a segment object per cue.
+        """
+        parser = VttStreamParser()
+        columns = ColumnarTranscriptBuilder()
+        parse_seconds = 0.0
+        with stage("graph_download"):
+            async with self.scheduler.stream(
+                self._async_http,
+                "GET",
+                self._absolute_content_url(content_url),
+                self._headers_async,
+                timeout=30.0,
+            ) as resp:
+                async for chunk in resp.aiter_text():
+                    started = time.perf_counter()
+                    columns.add(parser.feed(chunk))
+                    parse_seconds += time.perf_counter() - started
+                GRAPH_BYTES.inc(resp.num_bytes_downloaded)
+        columns.add(parser.close())
+        # Parsing is interleaved with the download (and included in its duration).
+        STAGE_SECONDS.observe(parse_seconds, stage="parse")
+        return columns.build()
+
+    async def _download_all(
+        self, transcripts_meta: list[dict[str, Any]]
+    ) -> list[tuple[dict[str, Any], bool]]:
+        """
+        Download and parse content for each listed transcript; the scheduler bounds how many
+        run at once. Returns (result, ok) in input order; failed downloads (after retries)
+        have empty content_text, a fetch_error and ok=False.
+        """
+        return list(await asyncio.gather(*(self._download_one(t) for t in transcripts_meta)))
+
+    async def _download_one(self, t: dict[str, Any]) -> tuple[dict[str, Any], bool]:
+        try:
+            transcript = await self.get_transcript_columns_async(t["transcriptContentUrl"])
+            return self._result(t, transcript.render(), transcript=transcript), True
+        except Exception as e:
+            logger.warning("Failed to fetch transcript content %s: %s", t.get("id"), e)
+            return self._result(t, "", str(e)), False
+
+    async def fetch_transcripts_for_user_async(
+        self,
+        user_id: str,
+        start_date_time: str | None = None,
+        end_date_time: str | None = None,
+    ) -> list[dict[str, Any]]:
+        """
+        Async fetch_transcripts_for_user: lists transcripts, then downloads and parses content
+        concurrently (bounded by the request scheduler).
+        Same result shape and order as fetch_transcripts_for_user.
+        For the configured window, a transcript store (if any) makes this incremental.
+        """
+        start, end = start_date_time, end_date_time
+        if not start or not end:
+            if self._store is not None:
+                return await self._sync_transcripts_for_user_async(user_id)
+            start, end = self._config.start_end_utc()
+        transcripts_meta = await self.get_all_transcripts_async(user_id, start, end)
+        listed = [t for t in transcripts_meta if t.get("transcriptContentUrl")]
+        results = [result for result, _ in await self._download_all(listed)]
+        TRANSCRIPTS_PER_REQUEST.observe(len(results))
         return results
 
+    async def iter_transcripts_for_user_async(self, user_id: str) -> AsyncIterator[dict[str, Any]]:
+        """
+        Streaming fetch_transcripts_for_user_async for the configured window: yields each
+        transcript result as soon as it is available instead of returning them all at the end.
+        Stored transcripts (with a transcript store) come first, while the listing of new ones
+        is still running; then each new transcript as its download and parse finish, in
+        completion order. Listing pages, downloads and the caller run concurrently, connected
+        by queues of PIPELINE_QUEUE_SIZE transcripts, so a slow caller holds back downloads
+        and a slow listing never holds back work on what is already here. Failed downloads are
+        yielded with fetch_error. The store is updated once the stream is exhausted; a
+        listing failure is raised after the transcripts already yielded.
+        """
+        store = self._store
+        start, end = self._config.window_utc()
+        query_start, known = start, set()
+        if store is not None:
+            query_start = _query_start(start, await asyncio.to_thread(store.watermark, user_id))
+            known = await asyncio.to_thread(store.known_ids, user_id)
+        size = self._config.pipeline_queue_size
+        listed: StageQueue[dict[str, Any]] = StageQueue("listed", size)
+        fetched: StageQueue[dict[str, Any]] = StageQueue("fetched", size)
+        transcripts_meta: list[dict[str, Any]] = []
+        downloaded: list[tuple[dict[str, Any], bool]] = []
+
+        async def list_all() -> None:
+            try:
+                with stage("graph_list"):
+                    async for page in self.iter_transcript_pages_async(
+                        user_id, format_datetime_iso(query_start), format_datetime_iso(end)
+                    ):
+                        transcripts_meta.extend(page)
+                        for t in page:
+                            if t.get("transcriptContentUrl") and t.get("id") not in known:
+                                await listed.put(t)
+            except Exception as e:
+                await listed.close(e)
+                raise
+            await listed.close()
+
+        async def download() -> None:
+            async for t in listed:
+                item = await self._download_one(t)
+                downloaded.append(item)
+                await fetched.put(item[0])
+
+        async def download_all() -> None:
+            # The scheduler bounds the requests in flight; the workers only need to keep it busy.
+            workers = [download() for _ in range(self._config.graph_max_concurrency)]
+            try:
+                await asyncio.gather(*workers)
+            except Exception as e:
+                await fetched.close(e)
+                raise
+            await fetched.close()
+
+        tasks = [asyncio.ensure_future(list_all()), asyncio.ensure_future(download_all())]
+        try:
+            stored: list[dict[str, Any]] = []
+            if store is not None:
+                stored = await asyncio.to_thread(store.transcripts_in_window, user_id, start, end)
+            for result in stored:
+                yield result
+            async for result in fetched:
+                yield result
+            await asyncio.gather(*tasks)
+        finally:
+            for task in tasks:
+                task.cancel()
+            await asyncio.gather(*tasks, return_exceptions=True)
+
+        failed = sum(1 for _, ok in downloaded if not ok)
+        TRANSCRIPTS_PER_REQUEST.observe(len(stored) + len(downloaded))
+        if store is not None:
+            watermark, rewind = _next_watermark(transcripts_meta, downloaded, end)
+            await asyncio.to_thread(
+                store.merge, user_id, [result for result, ok in downloaded if ok], start, watermark, rewind
+            )
+            await asyncio.to_thread(store.prune)
+        logger.info(
+            "Transcript stream for %s: %d stored, %d listed since %s, %d downloaded, %d failed; %s; %s",
+            user_id,
+            len(stored),
+            len(transcripts_meta),
+            format_datetime_iso(query_start),
+            len(downloaded) - failed,
+            failed,
+            listed.stats,
+            fetched.stats,
+        )
+
+    async def _sync_transcripts_for_user_async(self, user_id: str) -> list[dict[str, Any]]:
+        """
+        Incremental fetch for the configured window: list only transcripts created since the
+        organizer's watermark, download the ones not yet stored, merge them into the store,
+        and serve the whole window from the store.
+        """
+        store = self._store
+        assert store is not None
+        start, end = self._config.window_utc()
+        mark = await asyncio.to_thread(store.watermark, user_id)
+        query_start = _query_start(start, mark)
+        known = await asyncio.to_thread(store.known_ids, user_id)
+        transcripts_meta = await self.get_all_transcripts_async(
+            user_id, format_datetime_iso(query_start), format_datetime_iso(end)
+        )
+        new_meta = [
+            t for t in transcripts_meta if t.get("transcriptContentUrl") and t.get("id") not in known
+        ]
+        downloaded = await self._download_all(new_meta)
+
+        watermark, rewind = _next_watermark(transcripts_meta, downloaded, end)
+        await asyncio.to_thread(
+            store.merge, user_id, [result for result, ok in downloaded if ok], start, watermark, rewind
+        )
+        await asyncio.to_thread(store.prune)
+        failed = sum(1 for _, ok in downloaded if not ok)
+        logger.info(
+            "Transcript sync for %s: %d listed since %s, %d downloaded, %d failed",
+            user_id,
+            len(transcripts_meta),
+            format_datetime_iso(query_start),
+            len(downloaded) - failed,
+            failed,
+        )
+        stored = await asyncio.to_thread(store.transcripts_in_window, user_id, start, end)
+        TRANSCRIPTS_PER_REQUEST.observe(len(stored))
+        # Failed downloads are not stored, but are returned so callers can report them.
+        return stored + [result for result, ok in downloaded if not ok]
+
+    async def _batch(self, requests: list[dict[str, Any]]) -> list[dict[str, Any]]:
+        """
+        Send GET sub-requests ({"method", "url"} with url relative to GRAPH_BASE) as Graph
+        $batch calls of up to BATCH_MAX_REQUESTS each, concurrently through the scheduler.
+        Throttled or transient sub-responses are resubmitted (after their Retry-After) up to
+        the scheduler's max_retries. Returns the sub-responses ({"status", "headers", "body"})
+        in input order.
+        """
+        results: list[dict[str, Any] | None] = [None] * len(requests)
+        pending = list(range(len(requests)))
+        attempt = 0
+        while pending:
+            groups = [
+                pending[i : i + BATCH_MAX_REQUESTS] for i in range(0, len(pending), BATCH_MAX_REQUESTS)
+            ]
+            responses = await asyncio.gather(
+                *(
+                    self.scheduler.request(
+                        self._async_http,
+                        "POST",
+                        f"{GRAPH_BASE}/$batch",
+                        self._headers_async,
+                        json={"requests": [{"id": str(i), **requests[i]} for i in group]},
+                    )
+                    for group in groups
+                )
+            )
+            retry: set[int] = set()
+            failed = 0
+            delay = 0.0
+            for resp in responses:
+                for sub in resp.json().get("responses", []):
+                    i = int(sub["id"])
+                    status = sub.get("status", 0)
+                    if status in RETRY_STATUSES and attempt < self.scheduler.max_retries:
+                        wait = parse_retry_after((sub.get("headers") or {}).get("Retry-After"))
+                        if status in THROTTLE_STATUSES:
+                            self.scheduler.record_throttled(wait or self.scheduler.backoff(attempt))
+                        delay = max(delay, wait if wait is not None else self.scheduler.backoff(attempt))
+                        retry.add(i)
+                    else:
+                        # Includes throttled or transient sub-requests that are out of retries.
+                        failed += status >= 400
+                        results[i] = sub
+            for i in pending:
+                if results[i] is None and i not in retry:
+                    # Sub-response missing from the batch; treat as transient.
+                    retry.add(i)
+            if retry and attempt >= self.scheduler.max_retries:
+                for i in retry:
+                    results[i] = {"status": 0, "headers": {}, "body": {"error": {"message": "no response"}}}
+                self.scheduler.record_failures(failed + len(retry))
+                break
+            self.scheduler.record_failures(failed)
+            if retry:
+                self.scheduler.record_retries(len(retry))
+                await asyncio.sleep(delay)
+            pending = sorted(retry)
+            attempt += 1
+        return results  # type: ignore[return-value]
+
+    async def list_transcripts_batched(
+        self, ranges: dict[str, tuple[str, str]]
+    ) -> dict[str, list[dict[str, Any]] | None]:
+        """
+        getAllTranscripts for many organizers ({user_id: (startDateTime, endDateTime)}) via
+        $batch. Each organizer's @odata.nextLink is followed independently; every round
+        batches the next page of all organizers that still have one. Returns
+        {user_id: callTranscript list}, or None for an organizer whose listing failed.
+        """
+        with stage("graph_list"):
+            return await self._list_transcripts_batched(ranges)
+
+    async def _list_transcripts_batched(
+        self, ranges: dict[str, tuple[str, str]]
+    ) -> dict[str, list[dict[str, Any]] | None]:
+        listed: dict[str, list[dict[str, Any]] | None] = {user_id: [] for user_id in ranges}
+        next_urls = {
+            user_id: _relative_url(self._all_transcripts_url(user_id, start, end))
+            for user_id, (start, end) in ranges.items()
+        }
+        while next_urls:
+            user_ids = list(next_urls)
+            subs = await self._batch([{"method": "GET", "url": next_urls[u]} for u in user_ids])
+            next_urls = {}
+            for user_id, sub in zip(user_ids, subs):
+                body = sub.get("body") or {}
+                if sub.get("status") != 200 or not isinstance(body, dict):
+                    logger.warning(
+                        "Failed to list transcripts for %s: %s %s", user_id, sub.get("status"), body
+                    )
+                    listed[user_id] = None
+                    continue
+                listed[user_id].extend(body.get("value", []))  # type: ignore[union-attr]
+                if body.get("@odata.nextLink"):
+                    next_urls[user_id] = _relative_url(body["@odata.nextLink"])
+        return listed
+
+    async def _download_batched(
+        self, transcripts_meta: list[dict[str, Any]]
+    ) -> list[tuple[dict[str, Any], bool]]:
+        """_download_all via $batch: content for up to BATCH_MAX_REQUESTS transcripts per round-trip."""
+        with stage("graph_download"):
+            subs = await self._batch(
+                [{"method": "GET", "url": _relative_url(t["transcriptContentUrl"])} for t in transcripts_meta]
+            )
+        out: list[tuple[dict[str, Any], bool]] = []
+        for t, sub in zip(transcripts_meta, subs):
+            if sub.get("status") == 200:
+                vtt = _batch_body_text(sub.get("body"))
+                GRAPH_BYTES.inc(len(vtt.encode("utf-8")))
+                with stage("parse"):
+                    transcript = ColumnarTranscript.from_vtt((vtt,))
+                out.append((self._result(t, transcript.render(), transcript=transcript), True))
+            else:
+                error = f"HTTP {sub.get('status')}: {sub.get('body')}"
+                logger.warning("Failed to fetch transcript content %s: %s", t.get("id"), error)
+                out.append((self._result(t, "", error), False))
+        return out
+
+    async def fetch_transcripts_for_users_async(
+        self,
+        user_ids: list[str],
+        start_date_time: str | None = None,
+        end_date_time: str | None = None,
+    ) -> dict[str, list[dict[str, Any]]]:
+        """
+        fetch_transcripts_for_user_async for many organizers, packing the listing calls and
+        the content downloads into Graph $batch requests (BATCH_MAX_REQUESTS per request), so
+        round-trips grow with organizers / 20 rather than with organizers. For the configured
+        window, a transcript store (if any) makes each organizer incremental. Returns
+        {user_id: results}; an organizer whose listing failed has an empty list.
+        """
+        user_ids = list(dict.fromkeys(user_ids))
+        store = self._store
+        explicit = bool(start_date_time and end_date_time)
+        if explicit or store is None:
+            if not explicit:
+                start_date_time, end_date_time = self._config.start_end_utc()
+            listed = await self.list_transcripts_batched(
+                {u: (start_date_time, end_date_time) for u in user_ids}  # type: ignore[misc]
+            )
+            flat = [(u, t) for u in user_ids for t in listed[u] or [] if t.get("transcriptContentUrl")]
+            downloaded = await self._download_batched([t for _, t in flat])
+            results: dict[str, list[dict[str, Any]]] = {u: [] for u in user_ids}
+            for (user_id, _), (result, _) in zip(flat, downloaded):
+                results[user_id].append(result)
+            for user_results in results.values():
+                TRANSCRIPTS_PER_REQUEST.observe(len(user_results))
+            return results
+
+        start, end = self._config.window_utc()
+        query_starts: dict[str, datetime] = {}
+        known: dict[str, set[str]] = {}
+        for user_id in user_ids:
+            query_starts[user_id] = _query_start(start, await asyncio.to_thread(store.watermark, user_id))
+            known[user_id] = await asyncio.to_thread(store.known_ids, user_id)
+        listed = await self.list_transcripts_batched(
+            {u: (format_datetime_iso(query_starts[u]), format_datetime_iso(end)) for u in user_ids}
+        )
+        flat = [
+            (u, t)
+            for u in user_ids
+            for t in listed[u] or []
+            if t.get("transcriptContentUrl") and t.get("id") not in known[u]
+        ]
+        downloaded = await self._download_batched([t for _, t in flat])
+        per_user: dict[str, list[tuple[dict[str, Any], bool]]] = {u: [] for u in user_ids}
+        for (user_id, _), item in zip(flat, downloaded):
+            per_user[user_id].append(item)
+
+        results = {}
+        for user_id in user_ids:
+            if listed[user_id] is not None:
+                # A failed listing leaves the organizer's watermark where it was.
+                watermark, rewind = _next_watermark(listed[user_id], per_user[user_id], end)
+                ok_results = [result for result, ok in per_user[user_id] if ok]
+                await asyncio.to_thread(store.merge, user_id, ok_results, start, watermark, rewind)
+            stored = await asyncio.to_thread(store.transcripts_in_window, user_id, start, end)
+            TRANSCRIPTS_PER_REQUEST.observe(len(stored))
+            results[user_id] = stored + [result for result, ok in per_user[user_id] if not ok]
+        await asyncio.to_thread(store.prune)
+        logger.info(
+            "Transcript sync for %d organizer(s): %d listed, %d downloaded, %d failed, %d listing(s) failed",
+            len(user_ids),
+            sum(len(v) for v in listed.values() if v),
+            sum(1 for _, ok in downloaded if ok),
+            sum(1 for _, ok in downloaded if not ok),
+            sum(1 for v in listed.values() if v is None),
+        )
+        return results
+
+
+def _relative_url(url: str) -> str:
+    """Graph URL relative to GRAPH_BASE, as $batch sub-requests require."""
+    if url.startswith(GRAPH_BASE):
+        url = url[len(GRAPH_BASE) :]
+    return "/" + url.lstrip("/")
+
+
+def _batch_body_text(body: Any) -> str:
+    """Text of a $batch sub-response body; Graph base64-encodes non-JSON bodies such as VTT."""
+    if not isinstance(body, str):
+        return ""
+    try:
+        return base64.b64decode(body, validate=True).decode("utf-8")
+    except (binascii.Error, UnicodeDecodeError):
+        return body
+
+
+def _query_start(start: datetime, mark: tuple[datetime, datetime] | None) -> datetime:
+    """Where to start listing: the organizer's watermark (minus overlap) if it covers the window start."""
+    if mark is not None and mark[0] <= start:
+        return max(start, mark[1] - WATERMARK_OVERLAP)
+    return start
+
+
+def _next_watermark(
+    transcripts_meta: list[dict[str, Any]],
+    downloaded: list[tuple[dict[str, Any], bool]],
+    query_end: datetime,
+) -> tuple[datetime, bool]:
+    """
+    (watermark, rewind): past everything listed, or the end of the listing if it was empty;
+    with a failed download, back to that transcript (rewind=True) so it is retried next time.
+    """
+    failed_times = [
+        parse_graph_datetime(result["created_date_time"]) for result, ok in downloaded if not ok
+    ]
+    failed_times = [t for t in failed_times if t is not None]
+    if failed_times:
+        return min(failed_times), True
+    listed_times = [parse_graph_datetime(t.get("createdDateTime", "")) for t in transcripts_meta]
+    return max([t for t in listed_times if t is not None], default=query_end), False
+
 
 def format_datetime_iso(dt: datetime) -> str:
     """Format datetime for Graph API (ISO 8601 UTC)."""
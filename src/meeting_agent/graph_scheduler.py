@@ -0,0 +1,262 @@
+"""Shared scheduler for Microsoft Graph requests: Retry-After, jittered retries, adaptive concurrency."""
+
+import asyncio
+import logging
+import random
+import threading
+import time
+from contextlib import asynccontextmanager
+from datetime import datetime, timezone
+from email.utils import parsedate_to_datetime
+from typing import AsyncIterator, Awaitable, Callable
+
+import httpx
+
+logger = logging.getLogger(__name__)
+
+# Graph signals throttling with 429 and (for some workloads) 503; both carry Retry-After.
+THROTTLE_STATUSES = frozenset({429, 503})
+RETRY_STATUSES = THROTTLE_STATUSES | {500, 502, 504}
+
+BACKOFF_BASE_SECONDS = 0.5
+BACKOFF_MAX_SECONDS = 30.0
+# Successful responses (without throttling) needed before the concurrency limit grows by one.
+INCREASE_AFTER_SUCCESSES = 20
+
+
+def parse_retry_after(value: str | None) -> float | None:
+    """Seconds from a Retry-After value (delta-seconds or HTTP date), or None if absent/invalid."""
+    if not value:
+        return None
+    try:
+        return max(0.0, float(value))
+    except ValueError:
+        pass
+    try:
+        when = parsedate_to_datetime(value)
+    except (TypeError, ValueError):
+        return None
+    if when.tzinfo is None:
+        when = when.replace(tzinfo=timezone.utc)
+    return max(0.0, (when - datetime.now(timezone.utc)).total_seconds())
+
+
+class GraphRequestScheduler:
+    """
+    Every Graph call in the process goes through one scheduler. Requests in flight are
+    capped by an adaptive limit: halved when Graph throttles (429/503), raised by one after
+    a run of clean responses, never above max_concurrency. A throttled response pauses all
+    new requests until its Retry-After has passed. Transient failures (5xx, transport
+    errors) are retried with full-jitter exponential backoff, up to max_retries times.
+    """
+
+    def __init__(self, max_concurrency: int, max_retries: int = 5):
+        self._max_limit = max(1, max_concurrency)
+        self._limit = self._max_limit
+        self._max_retries = max(0, max_retries)
+        self._active = 0
+        self._cond = asyncio.Condition()
+        self._paused_until = 0.0  # time.monotonic(); shared with sync callers
+        self._pause_lock = threading.Lock()
+        self._successes = 0
+        self.requests = 0
+        self.retries = 0
+        self.throttled = 0
+        self.failures = 0
+
+    @property
+    def limit(self) -> int:
+        """Current adaptive concurrency limit."""
+        return self._limit
+
+    @property
+    def max_retries(self) -> int:
+        return self._max_retries
+
+    def backoff(self, attempt: int) -> float:
+        """Full-jitter exponential backoff for the given (0-based) retry attempt."""
+        return random.uniform(0, min(BACKOFF_MAX_SECONDS, BACKOFF_BASE_SECONDS * 2**attempt))
+
+    def _retry_delay(self, response: httpx.Response | None, attempt: int) -> float:
+        delay = parse_retry_after(response.headers.get("Retry-After")) if response is not None else None
+        if delay is None:
+            return self.backoff(attempt)
+        # Small jitter so paused requests do not all resume in the same instant.
+        return delay + random.uniform(0, BACKOFF_BASE_SECONDS)
+
+    def _pause_for(self) -> float:
+        return max(0.0, self._paused_until - time.monotonic())
+
+    def record_throttled(self, delay: float) -> None:
+        """
+        Count a throttled response and pause new requests for delay seconds (also used for
+        throttled $batch sub-requests, which arrive inside a successful batch response).
+        """
+        self.throttled += 1
+        self._successes = 0
+        with self._pause_lock:
+            # Requests throttled by the same burst reduce the limit only once.
+            already_paused = self._pause_for() > 0
+            self._paused_until = max(self._paused_until, time.monotonic() + delay)
+        if already_paused:
+            return
+        new_limit = max(1, self._limit // 2)
+        if new_limit != self._limit:
+            logger.info("Graph throttled; concurrency %d -> %d, pausing %.1fs", self._limit, new_limit, delay)
+        self._limit = new_limit
+
+    def record_retries(self, count: int) -> None:
+        """Count retried $batch sub-requests (plain requests are counted by _record)."""
+        self.retries += count
+
+    def record_failures(self, count: int) -> None:
+        """Count $batch sub-requests that failed for good (error status, or out of retries)."""
+        self.failures += count
+
+    def _on_success(self) -> None:
+        self._successes += 1
+        if self._successes >= INCREASE_AFTER_SUCCESSES and self._limit < self._max_limit:
+            self._successes = 0
+            self._limit += 1
+            logger.debug("Graph concurrency raised to %d", self._limit)
+
+    async def _acquire(self) -> None:
+        async with self._cond:
+            await self._cond.wait_for(lambda: self._active < self._limit)
+            self._active += 1
+
+    async def _release(self) -> None:
+        async with self._cond:
+            self._active -= 1
+            self._cond.notify_all()
+
+    def _record(self, response: httpx.Response | None, attempt: int) -> float | None:
+        """Record one attempt (response None = transport error); return the retry delay, or None to stop."""
+        if response is not None and response.status_code not in RETRY_STATUSES:
+            if response.is_success:
+                self._on_success()
+            elif response.is_error:
+                self.failures += 1
+            return None
+        delay = self._retry_delay(response, attempt)
+        if response is not None and response.status_code in THROTTLE_STATUSES:
+            self.record_throttled(delay)
+        if attempt >= self._max_retries:
+            self.failures += 1
+            return None
+        self.retries += 1
+        return delay
+
+    async def _send(
+        self,
+        client: httpx.AsyncClient,
+        method: str,
+        url: str,
+        headers: Callable[[], Awaitable[dict[str, str]]],
+        stream: bool,
+        **kwargs,
+    ) -> httpx.Response:
+        attempt = 0
+        while True:
+            pause = self._pause_for()
+            if pause:
+                await asyncio.sleep(pause)
+            self.requests += 1
+            try:
+                request = client.build_request(method, url, headers=await headers(), **kwargs)
+                response = await client.send(request, stream=stream)
+            except httpx.TransportError as e:
+                delay = self._record(None, attempt)
+                if delay is None:
+                    raise
+                logger.debug("Graph transport error on %s (attempt %d): %s", url, attempt + 1, e)
+            else:
+                delay = self._record(response, attempt)
+                if delay is None:
+                    if response.is_error:
+                        if stream:
+                            await response.aclose()
+                        response.raise_for_status()
+                    return response
+                if stream:
+                    await response.aclose()
+            attempt += 1
+            # A throttled response paused everyone (waited out at the top); otherwise back off.
+            if not self._pause_for():
+                await asyncio.sleep(delay)
+
+    async def request(
+        self,
+        client: httpx.AsyncClient,
+        method: str,
+        url: str,
+        headers: Callable[[], Awaitable[dict[str, str]]],
+        **kwargs,
+    ) -> httpx.Response:
+        """
+        Send a request (body read) within the concurrency limit, retrying as above.
+        headers is awaited per attempt so retries pick up a refreshed token.
+        Raises httpx.HTTPStatusError once retries are exhausted or for a non-retryable error.
+        """
+        await self._acquire()
+        try:
+            return await self._send(client, method, url, headers, stream=False, **kwargs)
+        finally:
+            await self._release()
+
+    @asynccontextmanager
+    async def stream(
+        self,
+        client: httpx.AsyncClient,
+        method: str,
+        url: str,
+        headers: Callable[[], Awaitable[dict[str, str]]],
+        **kwargs,
+    ) -> AsyncIterator[httpx.Response]:
+        """Like request(), but yields a streaming response; the slot is held until the body is consumed."""
+        await self._acquire()
+        try:
+            response = await self._send(client, method, url, headers, stream=True, **kwargs)
+            try:
+                yield response
+            finally:
+                await response.aclose()
+        finally:
+            await self._release()
+
+    def request_sync(
+        self, client: httpx.Client, method: str, url: str, headers: Callable[[], dict[str, str]], **kwargs
+    ) -> httpx.Response:
+        """Blocking request() for the sync client: same retries and shared throttling pause, no slot."""
+        attempt = 0
+        while True:
+            pause = self._pause_for()
+            if pause:
+                time.sleep(pause)
+            self.requests += 1
+            try:
+                response = client.request(method, url, headers=headers(), **kwargs)
+            except httpx.TransportError:
+                delay = self._record(None, attempt)
+                if delay is None:
+                    raise
+            else:
+                delay = self._record(response, attempt)
+                if delay is None:
+                    response.raise_for_status()
+                    return response
+            attempt += 1
+            if not self._pause_for():
+                time.sleep(delay)
+
+    def stats(self) -> dict[str, int]:
+        """Request/retry/throttle/failure counters plus the current and maximum concurrency."""
+        return {
+            "requests": self.requests,
+            "retries": self.retries,
+            "throttled": self.throttled,
+            "failures": self.failures,
+            "concurrency_limit": self._limit,
+            "max_concurrency": self._max_limit,
+            "in_flight": self._active,
+        }
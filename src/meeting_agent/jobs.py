@@ -0,0 +1,188 @@
+"""Background summary jobs: bounded concurrency, single-flight coalescing, and status lookup."""
+
+import asyncio
+import logging
+import time
+import uuid
+from collections import OrderedDict
+from dataclasses import dataclass, field
+from typing import Any, AsyncIterator, Awaitable, Callable
+
+from meeting_agent.metrics import IN_FLIGHT, stage
+
+logger = logging.getLogger(__name__)
+
+QUEUED = "queued"
+RUNNING = "running"
+DONE = "done"
+FAILED = "failed"
+
+
+@dataclass
+class SummaryJob:
+    """One queued or running pipeline run; all requesters with the same key share it."""
+
+    job_id: str
+    key: tuple[Any, ...]
+    status: str = QUEUED
+    created_at: float = field(default_factory=time.time)
+    started_at: float | None = None
+    finished_at: float | None = None
+    subscribers: int = 1
+    result: str | None = None
+    error: str | None = None
+    # Summary text streamed so far (the result normally starts with it).
+    partial: str = field(default="", repr=False)
+    _done: asyncio.Event = field(default_factory=asyncio.Event, repr=False)
+    # Set (and replaced) on every publish and when the job finishes, waking followers.
+    _changed: asyncio.Event = field(default_factory=asyncio.Event, repr=False)
+
+    def publish(self, delta: str) -> None:
+        """Append streamed summary text for followers."""
+        self.partial += delta
+        self._changed.set()
+        self._changed = asyncio.Event()
+
+    async def follow(self) -> AsyncIterator[str]:
+        """Yield the streamed text (from the start) as it is published, until the job finishes."""
+        sent = 0
+        while True:
+            if len(self.partial) > sent:
+                delta, sent = self.partial[sent:], len(self.partial)
+                yield delta
+                continue
+            if self._done.is_set():
+                return
+            await self._changed.wait()
+
+    async def wait_for_content(self) -> None:
+        """Return once some text has been streamed or the job has finished."""
+        while not self.partial and not self._done.is_set():
+            await self._changed.wait()
+
+    async def wait(self) -> str:
+        """Wait for the job; returns its result or raises RuntimeError with its error."""
+        await self._done.wait()
+        if self.status == FAILED:
+            raise RuntimeError(self.error or "job failed")
+        return self.result or ""
+
+    def to_dict(self) -> dict[str, Any]:
+        """Status view (without the result text)."""
+        return {
+            "job_id": self.job_id,
+            "status": self.status,
+            "subscribers": self.subscribers,
+            "created_at": self.created_at,
+            "started_at": self.started_at,
+            "finished_at": self.finished_at,
+            "error": self.error,
+        }
+
+
+class JobManager:
+    """
+    Runs jobs as asyncio tasks, at most max_concurrent at a time. Submitting a key that
+    is already queued or running returns the existing job (single-flight). Finished jobs
+    are kept for status queries up to max_finished / finished_ttl_seconds.
+    """
+
+    def __init__(self, max_concurrent: int, max_finished: int = 200, finished_ttl_seconds: float = 3600):
+        self._semaphore = asyncio.Semaphore(max_concurrent)
+        self._max_finished = max_finished
+        self._finished_ttl = finished_ttl_seconds
+        self._inflight: dict[tuple[Any, ...], SummaryJob] = {}
+        self._jobs: OrderedDict[str, SummaryJob] = OrderedDict()
+        self._tasks: set[asyncio.Task] = set()
+
+    def submit(
+        self, key: tuple[Any, ...], run: Callable[[SummaryJob], Awaitable[str]]
+    ) -> tuple[SummaryJob, bool]:
+        """
+        Queue run(job) under key, or join the in-flight job with that key. Returns (job, coalesced).
+        run may stream its result through job.publish.
+        """
+        job = self._inflight.get(key)
+        if job is not None:
+            job.subscribers += 1
+            return job, True
+        self._expire()
+        job = SummaryJob(job_id=uuid.uuid4().hex[:12], key=key)
+        self._inflight[key] = job
+        self._jobs[job.job_id] = job
+        self.spawn(self._run(job, run))
+        return job, False
+
+    def spawn(self, coro: Awaitable[Any]) -> asyncio.Task:
+        """Run a coroutine in the background; it is cancelled by close()."""
+        task = asyncio.ensure_future(coro)
+        self._tasks.add(task)
+        task.add_done_callback(self._tasks.discard)
+        return task
+
+    async def _run(self, job: SummaryJob, run: Callable[[SummaryJob], Awaitable[str]]) -> None:
+        try:
+            async with self._semaphore:
+                job.status = RUNNING
+                job.started_at = time.time()
+                with IN_FLIGHT.track_in_progress(operation="summary_job"), stage("summary_job"):
+                    job.result = await run(job)
+                job.status = DONE
+        except asyncio.CancelledError:
+            job.status, job.error = FAILED, "cancelled"
+            raise
+        except Exception as e:
+            logger.exception("Summary job %s failed: %s", job.job_id, e)
+            job.status, job.error = FAILED, str(e)
+        finally:
+            job.finished_at = time.time()
+            self._inflight.pop(job.key, None)
+            job._done.set()
+            job._changed.set()
+            logger.info(
+                "Summary job %s %s in %.2fs (%d subscriber(s))",
+                job.job_id,
+                job.status,
+                job.finished_at - job.created_at,
+                job.subscribers,
+            )
+
+    def _expire(self) -> None:
+        cutoff = time.time() - self._finished_ttl
+        finished = [j for j in self._jobs.values() if j.finished_at is not None]
+        excess = len(finished) - self._max_finished
+        for job in finished:
+            if excess > 0 or job.finished_at < cutoff:
+                del self._jobs[job.job_id]
+                excess -= 1
+
+    def get(self, job_id: str) -> SummaryJob | None:
+        return self._jobs.get(job_id)
+
+    def jobs(self, key_prefix: tuple[Any, ...] = ()) -> list[SummaryJob]:
+        """Known jobs (newest first), optionally only those whose key starts with key_prefix."""
+        return [
+            j for j in reversed(self._jobs.values()) if j.key[: len(key_prefix)] == key_prefix
+        ]
+
+    def stats(self) -> dict[str, int]:
+        counts = {QUEUED: 0, RUNNING: 0, DONE: 0, FAILED: 0}
+        for job in self._jobs.values():
+            counts[job.status] += 1
+        return counts
+
+    async def drain(self, timeout: float) -> bool:
+        """Wait up to timeout seconds for queued/running jobs and deliveries. True if all finished."""
+        tasks = list(self._tasks)
+        if not tasks:
+            return True
+        logger.info("Waiting up to %.0fs for %d background task(s)", timeout, len(tasks))
+        _, pending = await asyncio.wait(tasks, timeout=timeout)
+        return not pending
+
+    async def close(self) -> None:
+        """Cancel every running job and delivery task."""
+        tasks = list(self._tasks)
+        for task in tasks:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
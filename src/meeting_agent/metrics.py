@@ -0,0 +1,311 @@
+"""
+In-process metrics (counters, gauges, histograms) rendered in the Prometheus text format for
+GET /metrics, plus correlation IDs for log records. Dependency-free; thread-safe.
+"""
+
+import contextvars
+import logging
+import math
+import threading
+import time
+import uuid
+from contextlib import contextmanager
+from typing import Callable, Iterator
+
+# Seconds; covers cache lookups (sub-millisecond) up to multi-minute map-reduce runs.
+DEFAULT_BUCKETS = (0.001, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1, 2.5, 5, 10, 30, 60, 120, 300)
+
+LabelValues = tuple[str, ...]
+
+_INF_BUCKET = 'le="+Inf"'
+
+
+def _escape(value: str) -> str:
+    return value.replace("\\", "\\\\").replace("\n", "\\n").replace('"', '\\"')
+
+
+def _format_labels(names: tuple[str, ...], values: LabelValues, *extra: str) -> str:
+    parts = [f'{n}="{_escape(v)}"' for n, v in zip(names, values)]
+    parts.extend(e for e in extra if e)
+    return "{" + ",".join(parts) + "}" if parts else ""
+
+
+def _format_value(value: float) -> str:
+    if math.isinf(value):
+        return "+Inf" if value > 0 else "-Inf"
+    return repr(float(value)) if not float(value).is_integer() else str(int(value))
+
+
+class _Metric:
+    kind = ""
+
+    def __init__(self, name: str, documentation: str, labelnames: tuple[str, ...] = ()):
+        self.name = name
+        self.documentation = documentation
+        self.labelnames = labelnames
+        self._lock = threading.Lock()
+
+    def _key(self, labels: dict[str, str]) -> LabelValues:
+        return tuple(str(labels.get(n, "")) for n in self.labelnames)
+
+    def _header(self) -> list[str]:
+        return [f"# HELP {self.name} {self.documentation}", f"# TYPE {self.name} {self.kind}"]
+
+    def render(self, const: str = "") -> list[str]:
+        """Sample lines; const is a formatted label list added to every sample (see Registry)."""
+        raise NotImplementedError
+
+
+class Counter(_Metric):
+    kind = "counter"
+
+    def __init__(self, name: str, documentation: str, labelnames: tuple[str, ...] = ()):
+        super().__init__(name, documentation, labelnames)
+        self._values: dict[LabelValues, float] = {}
+
+    def inc(self, amount: float = 1.0, **labels: str) -> None:
+        key = self._key(labels)
+        with self._lock:
+            self._values[key] = self._values.get(key, 0.0) + amount
+
+    def render(self, const: str = "") -> list[str]:
+        with self._lock:
+            items = sorted(self._values.items())
+        return self._header() + [
+            f"{self.name}{_format_labels(self.labelnames, k, const)} {_format_value(v)}" for k, v in items
+        ]
+
+
+class Gauge(_Metric):
+    kind = "gauge"
+
+    def __init__(self, name: str, documentation: str, labelnames: tuple[str, ...] = ()):
+        super().__init__(name, documentation, labelnames)
+        self._values: dict[LabelValues, float] = {}
+
+    def set(self, value: float, **labels: str) -> None:
+        with self._lock:
+            self._values[self._key(labels)] = value
+
+    def inc(self, amount: float = 1.0, **labels: str) -> None:
+        key = self._key(labels)
+        with self._lock:
+            self._values[key] = self._values.get(key, 0.0) + amount
+
+    def dec(self, amount: float = 1.0, **labels: str) -> None:
+        self.inc(-amount, **labels)
+
+    @contextmanager
+    def track_in_progress(self, **labels: str) -> Iterator[None]:
+        self.inc(**labels)
+        try:
+            yield
+        finally:
+            self.dec(**labels)
+
+    def render(self, const: str = "") -> list[str]:
+        with self._lock:
+            items = sorted(self._values.items())
+        return self._header() + [
+            f"{self.name}{_format_labels(self.labelnames, k, const)} {_format_value(v)}" for k, v in items
+        ]
+
+
+class Histogram(_Metric):
+    kind = "histogram"
+
+    def __init__(
+        self,
+        name: str,
+        documentation: str,
+        labelnames: tuple[str, ...] = (),
+        buckets: tuple[float, ...] = DEFAULT_BUCKETS,
+    ):
+        super().__init__(name, documentation, labelnames)
+        self._buckets = tuple(sorted(buckets))
+        # labels -> (per-bucket counts, sum, count)
+        self._values: dict[LabelValues, tuple[list[int], float, int]] = {}
+
+    def observe(self, value: float, **labels: str) -> None:
+        key = self._key(labels)
+        with self._lock:
+            counts, total, count = self._values.get(key) or ([0] * len(self._buckets), 0.0, 0)
+            for i, bound in enumerate(self._buckets):
+                if value <= bound:
+                    counts[i] += 1
+                    break
+            self._values[key] = (counts, total + value, count + 1)
+
+    @contextmanager
+    def time(self, **labels: str) -> Iterator[None]:
+        """Observe the wall time of the block (also when it raises)."""
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.observe(time.perf_counter() - start, **labels)
+
+    def render(self, const: str = "") -> list[str]:
+        with self._lock:
+            items = sorted((k, (list(c), s, n)) for k, (c, s, n) in self._values.items())
+        lines = self._header()
+        for key, (counts, total, count) in items:
+            cumulative = 0
+            for bound, bucket_count in zip(self._buckets, counts):
+                cumulative += bucket_count
+                le = f'le="{_format_value(bound)}"'
+                lines.append(f"{self.name}_bucket{_format_labels(self.labelnames, key, const, le)} {cumulative}")
+            lines.append(f"{self.name}_bucket{_format_labels(self.labelnames, key, const, _INF_BUCKET)} {count}")
+            lines.append(f"{self.name}_sum{_format_labels(self.labelnames, key, const)} {_format_value(total)}")
+            lines.append(f"{self.name}_count{_format_labels(self.labelnames, key, const)} {count}")
+        return lines
+
+
+class CallbackGauge(_Metric):
+    """Gauge (or counter, kind="counter") whose samples are read from a callback at scrape time."""
+
+    def __init__(
+        self,
+        name: str,
+        documentation: str,
+        labelnames: tuple[str, ...],
+        collect: Callable[[], dict[LabelValues, float]],
+        kind: str = "gauge",
+    ):
+        super().__init__(name, documentation, labelnames)
+        self.kind = kind
+        self._collect = collect
+
+    def render(self, const: str = "") -> list[str]:
+        try:
+            items = sorted(self._collect().items())
+        except Exception:
+            logging.getLogger(__name__).exception("Metric callback %s failed", self.name)
+            items = []
+        return self._header() + [
+            f"{self.name}{_format_labels(self.labelnames, k, const)} {_format_value(v)}" for k, v in items
+        ]
+
+
+class Registry:
+    def __init__(self) -> None:
+        self._metrics: dict[str, _Metric] = {}
+        self._lock = threading.Lock()
+        self._const = ""
+
+    def set_const_labels(self, **labels: str) -> None:
+        """Labels added to every sample, e.g. worker="1" in a multi-process server."""
+        names = tuple(labels)
+        self._const = _format_labels(names, tuple(str(labels[n]) for n in names))[1:-1]
+
+    def register(self, metric: _Metric) -> _Metric:
+        """Add (or replace, e.g. for a rebuilt runtime's callbacks) a metric by name."""
+        with self._lock:
+            self._metrics[metric.name] = metric
+        return metric
+
+    def unregister(self, name: str) -> None:
+        with self._lock:
+            self._metrics.pop(name, None)
+
+    def render(self) -> str:
+        with self._lock:
+            metrics = list(self._metrics.values())
+        lines: list[str] = []
+        for metric in metrics:
+            lines.extend(metric.render(self._const))
+        return "\n".join(lines) + "\n"
+
+
+REGISTRY = Registry()
+
+
+def _counter(name: str, documentation: str, labelnames: tuple[str, ...] = ()) -> Counter:
+    return REGISTRY.register(Counter(name, documentation, labelnames))  # type: ignore[return-value]
+
+
+def _gauge(name: str, documentation: str, labelnames: tuple[str, ...] = ()) -> Gauge:
+    return REGISTRY.register(Gauge(name, documentation, labelnames))  # type: ignore[return-value]
+
+
+def _histogram(
+    name: str, documentation: str, labelnames: tuple[str, ...] = (), buckets: tuple[float, ...] = DEFAULT_BUCKETS
+) -> Histogram:
+    return REGISTRY.register(Histogram(name, documentation, labelnames, buckets))  # type: ignore[return-value]
+
+
+# Stages: graph_token, graph_list, graph_download, parse, summarize_map, summarize_reduce,
+# openai_completion, summary_job, message.
+STAGE_SECONDS = _histogram(
+    "meeting_agent_stage_duration_seconds", "Duration of one pipeline stage.", ("stage",)
+)
+STAGE_ERRORS = _counter("meeting_agent_stage_errors_total", "Failed pipeline stage runs.", ("stage",))
+GRAPH_BYTES = _counter(
+    "meeting_agent_graph_downloaded_bytes_total", "Transcript content bytes downloaded from Graph."
+)
+TRANSCRIPTS_PER_REQUEST = _histogram(
+    "meeting_agent_transcripts_per_request",
+    "Transcripts returned per organizer fetch.",
+    buckets=(0, 1, 2, 5, 10, 20, 50, 100, 200, 500),
+)
+TRANSCRIPT_TOKENS = _counter(
+    "meeting_agent_transcript_tokens_total",
+    "Transcript tokens sent to summarization, before (raw) and after (compacted) compaction.",
+    ("state",),
+)
+OPENAI_TOKENS = _counter(
+    "meeting_agent_openai_tokens_total", "Azure OpenAI token usage (from the response).", ("kind",)
+)
+SUMMARY_CACHE_LOOKUPS = _counter(
+    "meeting_agent_summary_cache_lookups_total", "Summary cache lookups by result.", ("result",)
+)
+PIPELINE_QUEUE_WAIT = _histogram(
+    "meeting_agent_pipeline_queue_wait_seconds",
+    "Time a streaming pipeline stage waited on a queue: to put (queue full) or to get (queue empty).",
+    ("queue", "side"),
+)
+PIPELINE_QUEUE_DEPTH = _histogram(
+    "meeting_agent_pipeline_queue_depth",
+    "Items waiting in a streaming pipeline queue, sampled on every put.",
+    ("queue",),
+    buckets=(0, 1, 2, 4, 8, 16, 32, 64),
+)
+IN_FLIGHT = _gauge("meeting_agent_in_flight", "Operations currently in flight.", ("operation",))
+MESSAGES = _counter("meeting_agent_messages_total", "Handled messages by command.", ("command",))
+
+
+@contextmanager
+def stage(name: str) -> Iterator[None]:
+    """Time a pipeline stage into STAGE_SECONDS and count it in STAGE_ERRORS if it raises."""
+    start = time.perf_counter()
+    try:
+        yield
+    except BaseException:
+        STAGE_ERRORS.inc(stage=name)
+        raise
+    finally:
+        STAGE_SECONDS.observe(time.perf_counter() - start, stage=name)
+
+
+# Correlation IDs
+
+_correlation_id: contextvars.ContextVar[str] = contextvars.ContextVar("correlation_id", default="-")
+
+
+def new_correlation_id(value: str | None = None) -> str:
+    """Set the correlation ID for this context (and tasks created from it); returns it."""
+    cid = value or uuid.uuid4().hex[:12]
+    _correlation_id.set(cid)
+    return cid
+
+
+def correlation_id() -> str:
+    return _correlation_id.get()
+
+
+class CorrelationIdFilter(logging.Filter):
+    """Adds %(correlation_id)s to every record passing through the handler."""
+
+    def filter(self, record: logging.LogRecord) -> bool:
+        record.correlation_id = _correlation_id.get()
+        return True
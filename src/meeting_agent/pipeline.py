@@ -0,0 +1,79 @@
+"""
+Bounded queues between the stages of the streaming summary pipeline (list -> download and
+parse -> map summarization), with depth and wait-time stats for tuning PIPELINE_QUEUE_SIZE.
+"""
+
+import asyncio
+import time
+from dataclasses import dataclass
+from typing import AsyncIterator, Generic, TypeVar
+
+from meeting_agent.metrics import PIPELINE_QUEUE_DEPTH, PIPELINE_QUEUE_WAIT
+
+T = TypeVar("T")
+
+_CLOSED = object()
+
+
+@dataclass
+class QueueStats:
+    """
+    One queue over one pipeline run. put_wait is time producers were blocked on a full queue
+    (the next stage is the bottleneck); get_wait is time consumers waited on an empty one
+    (the previous stage is).
+    """
+
+    name: str
+    items: int = 0
+    max_depth: int = 0
+    put_wait_seconds: float = 0.0
+    get_wait_seconds: float = 0.0
+
+    def __str__(self) -> str:
+        return (
+            f"{self.name}: {self.items} item(s), max depth {self.max_depth}, "
+            f"put wait {self.put_wait_seconds:.2f}s, get wait {self.get_wait_seconds:.2f}s"
+        )
+
+
+class StageQueue(Generic[T]):
+    """
+    asyncio.Queue of at most maxsize items between two stages; any number of producers and
+    consumers. Consumers iterate it (async for) until a producer calls close(); close(error)
+    makes every consumer raise error instead.
+    """
+
+    def __init__(self, name: str, maxsize: int):
+        self._queue: asyncio.Queue = asyncio.Queue(maxsize)
+        self._error: BaseException | None = None
+        self.stats = QueueStats(name)
+
+    async def put(self, item: T) -> None:
+        started = time.perf_counter()
+        await self._queue.put(item)
+        waited = time.perf_counter() - started
+        self.stats.put_wait_seconds += waited
+        self.stats.items += 1
+        self.stats.max_depth = max(self.stats.max_depth, self._queue.qsize())
+        PIPELINE_QUEUE_WAIT.observe(waited, queue=self.stats.name, side="put")
+        PIPELINE_QUEUE_DEPTH.observe(self._queue.qsize(), queue=self.stats.name)
+
+    async def close(self, error: BaseException | None = None) -> None:
+        """End the stream (after the items already queued), or fail it with error."""
+        self._error = error
+        await self._queue.put(_CLOSED)
+
+    async def __aiter__(self) -> AsyncIterator[T]:
+        while True:
+            started = time.perf_counter()
+            item = await self._queue.get()
+            waited = time.perf_counter() - started
+            self.stats.get_wait_seconds += waited
+            PIPELINE_QUEUE_WAIT.observe(waited, queue=self.stats.name, side="get")
+            if item is _CLOSED:
+                # Leave the marker for the other consumers.
+                self._queue.put_nowait(_CLOSED)
+                if self._error is not None:
+                    raise self._error
+                return
+            yield item
@@ -0,0 +1,60 @@
+"""Pre-computed summaries (SQLite) so interactive requests can be answered without live work."""
+
+import logging
+import sqlite3
+import threading
+import time
+from pathlib import Path
+
+logger = logging.getLogger(__name__)
+
+
+def organizer_key(user_id: str, days: int) -> str:
+    return f"organizer:{user_id}:{days}"
+
+
+def digest_key(user_ids: tuple[str, ...], days: int) -> str:
+    return f"digest:{','.join(sorted(user_ids))}:{days}"
+
+
+class PrecomputedSummaryStore:
+    """
+    Latest finished summary per key (organizer or digest, and window), with the time it
+    was computed. Written by the scheduled precompute pass and by live jobs. Thread-safe.
+    """
+
+    def __init__(self, path: str | Path):
+        self._path = Path(path)
+        self._path.parent.mkdir(parents=True, exist_ok=True)
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(self._path, check_same_thread=False)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute(
+            "CREATE TABLE IF NOT EXISTS precomputed ("
+            " key TEXT PRIMARY KEY,"
+            " summary TEXT NOT NULL,"
+            " computed_at REAL NOT NULL)"
+        )
+        self._conn.commit()
+
+    def get(self, key: str, max_age_seconds: float) -> tuple[str, float] | None:
+        """(summary, computed_at) if one was computed within max_age_seconds, else None."""
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT summary, computed_at FROM precomputed WHERE key = ?", (key,)
+            ).fetchone()
+        if row is None or time.time() - row[1] > max_age_seconds:
+            return None
+        return row[0], row[1]
+
+    def put(self, key: str, summary: str, computed_at: float | None = None) -> None:
+        with self._lock:
+            self._conn.execute(
+                "INSERT OR REPLACE INTO precomputed (key, summary, computed_at) VALUES (?, ?, ?)",
+                (key, summary, computed_at if computed_at is not None else time.time()),
+            )
+            self._conn.commit()
+
+    def close(self) -> None:
+        with self._lock:
+            self._conn.close()
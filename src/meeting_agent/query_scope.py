@@ -0,0 +1,207 @@
+"""
+Scope of a free-text request ("what did we decide about the budget", "summary of yesterday's
+standup"): date range, meetings, speakers and topic terms, parsed with simple rules.
+"""
+
+import re
+from dataclasses import dataclass
+from datetime import datetime, timedelta, timezone
+from typing import Callable, Iterable
+
+_WORD_RE = re.compile(r"[a-z0-9][a-z0-9_'-]*")
+_ISO_DATE_RE = re.compile(r"\b(\d{4}-\d{2}-\d{2})\b")
+_LAST_DAYS_RE = re.compile(r"\b(?:last|past) (\d{1,2}) days?\b")
+_LAST_WEEKDAY_RE = re.compile(r"\b(?:last|on) (monday|tuesday|wednesday|thursday|friday|saturday|sunday)\b")
+
+WEEKDAYS = ("monday", "tuesday", "wednesday", "thursday", "friday", "saturday", "sunday")
+QUESTION_WORDS = frozenset(
+    "what who whom whose when where why how which did does do was were is are has have any anything".split()
+)
+# Words that never narrow the search (command words, question words, greetings and politeness,
+# filler, words describing the summary itself, date words).
+STOPWORDS = QUESTION_WORDS | frozenset(
+    """
+    a about after again all also am an and as at be been before being bot brief but by can
+    complete could daily day days discuss discussed discussion everything for from full get give
+    go going hello hey hi i in into it its just latest let me meeting meetings monthly my need
+    now of on or our overall please provide quick recap recent said say says send share short
+    should show so summaries summarise summarize summary talk talked tell thank thanks than that
+    the their them then there these they this those to today up us want we week weekly what's
+    whole with would yesterday you your last past s
+    """.split()
+) | frozenset(WEEKDAYS)
+
+# Search terms kept per request.
+MAX_TERMS = 12
+
+
+@dataclass(frozen=True)
+class QueryScope:
+    """Parsed request scope; start/end are clamped to the transcript window (UTC)."""
+
+    start: datetime
+    end: datetime
+    speakers: tuple[str, ...] = ()
+    meeting_ids: tuple[str, ...] = ()
+    terms: tuple[str, ...] = ()
+    # True if the dates narrow the window.
+    dated: bool = False
+
+    @property
+    def scoped(self) -> bool:
+        """False for a plain "summary": nothing narrows it, so the whole window is summarized."""
+        return bool(self.dated or self.speakers or self.meeting_ids or self.terms)
+
+    def describe(self) -> str:
+        parts = [f"{self.start:%Y-%m-%d} to {self.end:%Y-%m-%d}"]
+        if self.meeting_ids:
+            parts.append(f"meeting {', '.join(self.meeting_ids)}")
+        if self.speakers:
+            parts.append(f"speaker {', '.join(self.speakers)}")
+        if self.terms:
+            parts.append(f"about: {' '.join(self.terms)}")
+        return "; ".join(parts)
+
+
+def is_question(text: str) -> bool:
+    """True for text phrased as a question ("?" or a leading question word)."""
+    words = _WORD_RE.findall(text.lower())
+    return text.rstrip().endswith("?") or bool(words and words[0] in QUESTION_WORDS)
+
+
+def asks_for_summary(text: str) -> bool:
+    """True if text mentions a summary ("summary", "summarize", "summarise")."""
+    return "summary" in text or "summarize" in text or "summarise" in text
+
+
+def is_scoped_request(
+    text: str, scope: QueryScope, has_matches: Callable[[tuple[str, ...]], bool] | None
+) -> bool:
+    """
+    True if text should be answered from matching excerpts (a query job) rather than the full
+    summary or the help reply. has_matches(terms) tells whether an indexed segment in scope
+    matches one of terms (any segment in scope for no terms); None without an index.
+    A summary request ("can I get the weekly summary?" included) is scoped only when it names
+    a date, speaker or meeting, or its topic terms occur in the transcripts. A question is
+    scoped only when it names a speaker or meeting, or its topic terms (or the dates it names)
+    match indexed segments; without an index, when it has topic terms or dates. Leftover words
+    ("send me the summary") and small talk ("what can you do?") narrow nothing.
+    """
+    if asks_for_summary(text):
+        if scope.dated or scope.speakers or scope.meeting_ids:
+            return True
+        return bool(scope.terms) and has_matches is not None and has_matches(scope.terms)
+    if not is_question(text):
+        return False
+    if scope.speakers or scope.meeting_ids:
+        return True
+    if not (scope.terms or scope.dated):
+        return False
+    if has_matches is None:
+        return True
+    return (bool(scope.terms) and has_matches(scope.terms)) or (scope.dated and has_matches(()))
+
+
+def _day_start(dt: datetime) -> datetime:
+    return dt.replace(hour=0, minute=0, second=0, microsecond=0)
+
+
+def _dates(text: str, now: datetime) -> tuple[datetime, datetime] | None:
+    """Date range named in text (UTC days), or None."""
+    today = _day_start(now)
+    if match := _ISO_DATE_RE.search(text):
+        try:
+            day = datetime.strptime(match.group(1), "%Y-%m-%d").replace(tzinfo=timezone.utc)
+        except ValueError:
+            day = None
+        if day is not None:
+            return day, day + timedelta(days=1)
+    if match := _LAST_DAYS_RE.search(text):
+        return now - timedelta(days=int(match.group(1))), now
+    words = set(_WORD_RE.findall(text))
+    if "yesterday" in words or "yesterday's" in words:
+        return today - timedelta(days=1), today
+    if "today" in words or "today's" in words:
+        return today, now
+    monday = today - timedelta(days=today.weekday())
+    if "last week" in text:
+        return monday - timedelta(days=7), monday
+    if "this week" in text:
+        return monday, now
+    if match := _LAST_WEEKDAY_RE.search(text):
+        weekday = WEEKDAYS.index(match.group(1))
+    else:
+        weekday = next((WEEKDAYS.index(w.removesuffix("'s")) for w in words if w.removesuffix("'s") in WEEKDAYS), None)
+    if weekday is not None:
+        # The most recent such day, today included.
+        day = today - timedelta(days=(today.weekday() - weekday) % 7)
+        return day, day + timedelta(days=1)
+    return None
+
+
+def _names(text: str, speakers: Iterable[str]) -> tuple[list[str], set[str]]:
+    """Speakers named in text (full name, or a first name unique among them) and the words that named them."""
+    speakers = list(speakers)
+    first_names: dict[str, list[str]] = {}
+    for name in speakers:
+        first = name.split()[0].lower() if name.split() else ""
+        first_names.setdefault(first, []).append(name)
+    found: list[str] = []
+    used: set[str] = set()
+    for name in speakers:
+        lowered = name.lower()
+        first = lowered.split()[0] if lowered.split() else ""
+        if re.search(rf"\b{re.escape(lowered)}(?:'s)?\b", text):
+            found.append(name)
+            used.update(_WORD_RE.findall(lowered))
+        elif len(first) >= 3 and len(first_names.get(first, ())) == 1 and re.search(rf"\b{re.escape(first)}(?:'s)?\b", text):
+            found.append(name)
+            used.add(first)
+    return found, used
+
+
+def parse_query(
+    text: str,
+    window_start: datetime,
+    window_end: datetime,
+    speakers: Iterable[str] = (),
+    meeting_ids: Iterable[str] = (),
+    now: datetime | None = None,
+) -> QueryScope:
+    """
+    Scope of a request, within [window_start, window_end]. Speakers and meetings are only
+    recognized among the given ones (meeting IDs by a prefix of at least 6 characters);
+    remaining content words become search terms.
+    """
+    text = text.lower()
+    now = now or window_end
+    start, end, dated = window_start, window_end, False
+    if dates := _dates(text, now):
+        start, end, dated = max(window_start, dates[0]), min(window_end, dates[1]), True
+        end = max(start, end)
+    found_speakers, name_words = _names(text, speakers)
+    words = [w.removesuffix("'s") for w in _WORD_RE.findall(text)]
+    found_meetings = []
+    for meeting_id in meeting_ids:
+        if any(len(w) >= 6 and meeting_id.lower().startswith(w) for w in words):
+            found_meetings.append(meeting_id)
+    terms: list[str] = []
+    for word in words:
+        if (
+            word in STOPWORDS
+            or word in name_words
+            or word.isdigit()
+            or _ISO_DATE_RE.fullmatch(word)
+            or any(len(word) >= 6 and m.lower().startswith(word) for m in found_meetings)
+            or word in terms
+        ):
+            continue
+        terms.append(word)
+    return QueryScope(
+        start=start,
+        end=end,
+        speakers=tuple(found_speakers),
+        meeting_ids=tuple(found_meetings),
+        terms=tuple(terms[:MAX_TERMS]),
+        dated=dated,
+    )
@@ -0,0 +1,84 @@
+"""Split (streamed) Markdown replies into channel-sized messages at block boundaries, paced."""
+
+import asyncio
+import time
+
+# Teams renders messages up to ~28 KB, but long single messages are hard to read and some
+# channels cut earlier; keep each message well under that.
+MAX_MESSAGE_CHARS = 4000
+# While streaming, don't post a message until at least this much text is ready...
+MIN_STREAM_MESSAGE_CHARS = 300
+# ...and post at most one message per conversation this often (Teams throttles bots that
+# send faster than a few messages per second per conversation).
+STREAM_MESSAGE_INTERVAL_SECONDS = 1.5
+
+
+def _split_point(text: str, limit: int) -> int:
+    """Index to cut text at (<= limit): paragraph break, then line break, then space, then hard."""
+    for separator in ("\n\n", "\n", " "):
+        cut = text.rfind(separator, 0, limit)
+        if cut > 0:
+            return cut + len(separator)
+    return limit
+
+
+def split_markdown(text: str, limit: int = MAX_MESSAGE_CHARS) -> list[str]:
+    """Split text into pieces of at most limit characters, preferring Markdown block boundaries."""
+    pieces: list[str] = []
+    text = text.strip()
+    while len(text) > limit:
+        cut = _split_point(text, limit)
+        pieces.append(text[:cut].rstrip())
+        text = text[cut:].lstrip()
+    if text:
+        pieces.append(text)
+    return pieces
+
+
+class MarkdownStreamBuffer:
+    """
+    Accumulates streamed text and releases it in whole Markdown blocks: up to the last
+    paragraph break that is not inside a fenced code block. sent holds everything released.
+    """
+
+    def __init__(self) -> None:
+        self._pending = ""
+        self.sent = ""
+
+    def feed(self, delta: str) -> None:
+        self._pending += delta
+
+    def take_ready(self, min_chars: int = MIN_STREAM_MESSAGE_CHARS) -> str | None:
+        """Complete blocks ready to post (at least min_chars of them), or None."""
+        cut = self._pending.rfind("\n\n")
+        while cut > 0 and self._pending.count("```", 0, cut) % 2:
+            cut = self._pending.rfind("\n\n", 0, cut)
+        if cut <= 0 or cut < min_chars:
+            return None
+        ready, self._pending = self._pending[: cut + 2], self._pending[cut + 2 :]
+        self.sent += ready
+        return ready
+
+    def flush(self) -> str:
+        """Everything not yet released."""
+        rest, self._pending = self._pending, ""
+        self.sent += rest
+        return rest
+
+
+class MessagePacer:
+    """Spaces out the messages sent to one conversation by at least interval seconds."""
+
+    def __init__(self, interval: float = STREAM_MESSAGE_INTERVAL_SECONDS):
+        self._interval = interval
+        self._last = float("-inf")
+
+    def ready(self) -> bool:
+        return time.monotonic() - self._last >= self._interval
+
+    async def wait(self) -> None:
+        """Sleep until the next message may be sent, and claim that slot."""
+        delay = self._last + self._interval - time.monotonic()
+        if delay > 0:
+            await asyncio.sleep(delay)
+        self._last = time.monotonic()
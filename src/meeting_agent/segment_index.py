@@ -0,0 +1,318 @@
+"""
+Local search index of transcript segments (SQLite FTS5, BM25 ranking) with organizer, meeting,
+speaker and cue time metadata, so a question is answered from the relevant segments only.
+"""
+
+import logging
+import sqlite3
+import threading
+import time
+from collections import defaultdict
+from dataclasses import dataclass
+from datetime import datetime, timedelta, timezone
+from pathlib import Path
+from typing import Any, Iterable
+
+from meeting_agent.chunking import estimate_tokens
+from meeting_agent.transcript_parser import TranscriptSegment, parse_text_to_segments, segment_line
+from meeting_agent.transcript_store import parse_graph_datetime
+
+logger = logging.getLogger(__name__)
+
+# Ranked candidates read per search (the token budget usually stops well before).
+MAX_CANDIDATES = 500
+# Marks left-out segments between two excerpts of the same meeting.
+GAP_LINE = "[...]"
+# add() prunes expired segments at most this often (and on open), not on every call.
+PRUNE_INTERVAL_SECONDS = 3600.0
+
+
+@dataclass
+class IndexedSegment:
+    """
+    One stored segment; seq is its position in the transcript, offset its cue start in seconds
+    from the start of the meeting (None if the cue times were not kept).
+    """
+
+    transcript_id: str
+    meeting_id: str
+    created_date_time: str
+    created_ts: float
+    seq: int
+    offset: float | None
+    speaker: str
+    text: str
+
+
+_COLUMNS = "s.transcript_id, s.meeting_id, s.created_date_time, s.created_ts, s.seq, s.offset_s, s.speaker, s.text"
+
+
+class SegmentIndex:
+    """
+    Segments of every stored transcript, one row each, with a full-text index over their
+    text and speaker (porter-stemmed, so "decided" finds "decide"). Each row has the time it
+    was spoken (meeting creation time plus the cue start, from cue_starts_ms), which time
+    filters use. Transcripts are added once, as they are fetched; rows older than
+    retention_days are pruned on open and by add() every PRUNE_INTERVAL_SECONDS. Raises sqlite3.OperationalError if this SQLite build lacks
+    FTS5. Thread-safe.
+    """
+
+    def __init__(self, path: str | Path, retention_days: int):
+        self._path = Path(path)
+        self._path.parent.mkdir(parents=True, exist_ok=True)
+        self._retention = timedelta(days=retention_days)
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(self._path, check_same_thread=False)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        columns = {r[1] for r in self._conn.execute("PRAGMA table_info(segments)")}
+        if columns and "spoken_ts" not in columns:
+            # Index built before cue times were kept: rebuild it (transcripts are re-added on fetch).
+            self._conn.executescript(
+                "DROP TABLE segments; DROP TABLE IF EXISTS segments_fts;"
+                " DROP TRIGGER IF EXISTS segments_ai; DROP TRIGGER IF EXISTS segments_ad;"
+            )
+        self._conn.executescript(
+            """
+            CREATE TABLE IF NOT EXISTS segments (
+                id INTEGER PRIMARY KEY,
+                transcript_id TEXT NOT NULL,
+                organizer_id TEXT NOT NULL,
+                meeting_id TEXT NOT NULL,
+                created_date_time TEXT NOT NULL,
+                created_ts REAL NOT NULL,
+                seq INTEGER NOT NULL,
+                offset_s REAL,
+                spoken_ts REAL NOT NULL,
+                speaker TEXT NOT NULL,
+                text TEXT NOT NULL);
+            CREATE INDEX IF NOT EXISTS segments_organizer_spoken ON segments (organizer_id, spoken_ts);
+            CREATE INDEX IF NOT EXISTS segments_transcript_seq ON segments (transcript_id, seq);
+            CREATE INDEX IF NOT EXISTS segments_created ON segments (created_ts);
+            CREATE VIRTUAL TABLE IF NOT EXISTS segments_fts USING fts5(
+                text, speaker, content='segments', content_rowid='id', tokenize='porter unicode61');
+            CREATE TRIGGER IF NOT EXISTS segments_ai AFTER INSERT ON segments BEGIN
+                INSERT INTO segments_fts (rowid, text, speaker) VALUES (new.id, new.text, new.speaker);
+            END;
+            CREATE TRIGGER IF NOT EXISTS segments_ad AFTER DELETE ON segments BEGIN
+                INSERT INTO segments_fts (segments_fts, rowid, text, speaker)
+                VALUES ('delete', old.id, old.text, old.speaker);
+            END;
+            """
+        )
+        self._conn.commit()
+        self._pruned_at = 0.0
+        self.prune()
+
+    def add(self, organizer_id: str, transcripts: list[dict[str, Any]]) -> int:
+        """Index transcripts (fetch_transcripts_for_user shape) not indexed yet. Returns segments added."""
+        if time.monotonic() - self._pruned_at >= PRUNE_INTERVAL_SECONDS:
+            self.prune()
+        with self._lock:
+            known = {
+                r[0]
+                for r in self._conn.execute(
+                    "SELECT DISTINCT transcript_id FROM segments WHERE organizer_id = ?", (organizer_id,)
+                )
+            }
+        rows = []
+        for t in transcripts:
+            transcript_id = t.get("transcript_id")
+            created = parse_graph_datetime(t.get("created_date_time", ""))
+            if not transcript_id or transcript_id in known or created is None or t.get("fetch_error"):
+                continue
+            segments = parse_text_to_segments(t.get("content_text", "") or "")
+            starts = t.get("cue_starts_ms")
+            if starts is not None and len(starts) != len(segments):
+                logger.warning("Transcript %s: cue times do not match its lines; indexing without them", transcript_id)
+                starts = None
+            for seq, seg in enumerate(segments):
+                offset = starts[seq] / 1000 if starts is not None else None
+                rows.append(
+                    (
+                        transcript_id,
+                        organizer_id,
+                        t.get("meeting_id") or "unknown",
+                        t.get("created_date_time", ""),
+                        created.timestamp(),
+                        seq,
+                        offset,
+                        created.timestamp() + (offset or 0.0),
+                        seg.speaker,
+                        seg.text,
+                    )
+                )
+        if not rows:
+            return 0
+        with self._lock:
+            self._conn.executemany(
+                "INSERT INTO segments (transcript_id, organizer_id, meeting_id, created_date_time,"
+                " created_ts, seq, offset_s, spoken_ts, speaker, text) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)",
+                rows,
+            )
+            self._conn.commit()
+        logger.info("Segment index: added %d segments for organizer %s", len(rows), organizer_id)
+        return len(rows)
+
+    @staticmethod
+    def _filters(
+        organizer_id: str,
+        start: datetime,
+        end: datetime,
+        speakers: Iterable[str] = (),
+        meeting_ids: Iterable[str] = (),
+    ) -> tuple[str, list[Any]]:
+        clauses = ["s.organizer_id = ?", "s.spoken_ts >= ?", "s.spoken_ts < ?"]
+        params: list[Any] = [organizer_id, start.timestamp(), end.timestamp()]
+        for column, values in (("speaker", tuple(speakers)), ("meeting_id", tuple(meeting_ids))):
+            if values:
+                clauses.append(f"s.{column} IN ({','.join('?' * len(values))})")
+                params.extend(values)
+        return " AND ".join(clauses), params
+
+    def speakers(self, organizer_id: str, start: datetime, end: datetime) -> list[str]:
+        """Distinct named speakers of the organizer's segments spoken in [start, end)."""
+        where, params = self._filters(organizer_id, start, end)
+        with self._lock:
+            rows = self._conn.execute(
+                f"SELECT DISTINCT s.speaker FROM segments s WHERE {where} AND s.speaker != ''", params
+            ).fetchall()
+        return sorted(r[0] for r in rows)
+
+    def meeting_ids(self, organizer_id: str, start: datetime, end: datetime) -> list[str]:
+        where, params = self._filters(organizer_id, start, end)
+        with self._lock:
+            rows = self._conn.execute(f"SELECT DISTINCT s.meeting_id FROM segments s WHERE {where}", params).fetchall()
+        return sorted(r[0] for r in rows)
+
+    def _select(self, sql: str, params: list[Any]) -> list[IndexedSegment]:
+        with self._lock:
+            rows = self._conn.execute(sql, params).fetchall()
+        return [IndexedSegment(*row) for row in rows]
+
+    def search(
+        self,
+        organizer_id: str,
+        start: datetime,
+        end: datetime,
+        terms: Iterable[str] = (),
+        speakers: Iterable[str] = (),
+        meeting_ids: Iterable[str] = (),
+        limit: int = MAX_CANDIDATES,
+    ) -> list[IndexedSegment]:
+        """
+        Segments spoken in [start, end) matching the filters, best BM25 match for any of terms
+        first; without terms, all of them in meeting order.
+        """
+        where, params = self._filters(organizer_id, start, end, speakers, meeting_ids)
+        columns = _COLUMNS
+        # Terms are quoted as FTS5 strings, so user text never reaches the query syntax.
+        match = " OR ".join('"{}"'.format(term.replace('"', '""')) for term in terms)
+        if not match:
+            return self._select(
+                f"SELECT {columns} FROM segments s WHERE {where} ORDER BY s.created_ts, s.transcript_id, s.seq"
+                " LIMIT ?",
+                [*params, limit],
+            )
+        return self._select(
+            f"SELECT {columns} FROM segments_fts JOIN segments s ON s.id = segments_fts.rowid"
+            f" WHERE segments_fts MATCH ? AND {where} ORDER BY bm25(segments_fts) LIMIT ?",
+            [match, *params, limit],
+        )
+
+    def has_matches(self, organizer_id: str, start: datetime, end: datetime, terms: Iterable[str]) -> bool:
+        """
+        True if any of the organizer's segments spoken in [start, end) matches one of terms
+        (without terms: if there is any).
+        """
+        return bool(self.search(organizer_id, start, end, tuple(terms), limit=1))
+
+    def neighbours(self, transcript_id: str, seq: int, radius: int) -> list[IndexedSegment]:
+        """The segments up to radius positions before and after seq in the same transcript."""
+        return self._select(
+            f"SELECT {_COLUMNS} FROM segments s WHERE s.transcript_id = ? AND s.seq BETWEEN ? AND ? ORDER BY s.seq",
+            [transcript_id, seq - radius, seq + radius],
+        )
+
+    def excerpts(
+        self,
+        organizer_id: str,
+        start: datetime,
+        end: datetime,
+        terms: Iterable[str] = (),
+        speakers: Iterable[str] = (),
+        meeting_ids: Iterable[str] = (),
+        max_tokens: int = 6000,
+        context: int = 1,
+    ) -> list[dict[str, Any]]:
+        """
+        The best-ranked segments (each with context segments around it) until max_tokens is
+        reached, as one transcript result per meeting in meeting order (fetch_transcripts_for_user
+        shape); left-out stretches are marked with GAP_LINE, and lines start with the cue's time
+        in the meeting ("[00:12:34]") when it is known. Without terms, segments are taken in
+        meeting order.
+        """
+        terms = tuple(terms)
+        chosen: dict[tuple[str, int], IndexedSegment] = {}
+        tokens = 0
+        for hit in self.search(organizer_id, start, end, terms, speakers, meeting_ids):
+            if (hit.transcript_id, hit.seq) in chosen:
+                continue
+            around = self.neighbours(hit.transcript_id, hit.seq, context) if terms and context else [hit]
+            new = [s for s in around if (s.transcript_id, s.seq) not in chosen]
+            cost = sum(estimate_tokens(_line(s) + "\n") for s in new)
+            if chosen and tokens + cost > max_tokens:
+                break
+            for s in new:
+                chosen[(s.transcript_id, s.seq)] = s
+            tokens += cost
+        by_transcript: dict[str, list[IndexedSegment]] = defaultdict(list)
+        for s in chosen.values():
+            by_transcript[s.transcript_id].append(s)
+        results = []
+        for segments in sorted(by_transcript.values(), key=lambda ss: (ss[0].created_ts, ss[0].transcript_id)):
+            segments.sort(key=lambda s: s.seq)
+            lines: list[str] = []
+            for previous, s in zip([None, *segments], segments):
+                if previous is not None and s.seq != previous.seq + 1:
+                    lines.append(GAP_LINE)
+                lines.append(_line(s))
+            first = segments[0]
+            results.append(
+                {
+                    "transcript_id": first.transcript_id,
+                    "meeting_id": first.meeting_id,
+                    "created_date_time": first.created_date_time,
+                    "content_text": "\n".join(lines),
+                }
+            )
+        return results
+
+    def prune(self) -> int:
+        """Drop segments of transcripts older than the retention window."""
+        cutoff = (datetime.now(timezone.utc) - self._retention).timestamp()
+        with self._lock:
+            self._pruned_at = time.monotonic()
+            removed = self._conn.execute("DELETE FROM segments WHERE created_ts < ?", (cutoff,)).rowcount
+            self._conn.commit()
+        if removed:
+            logger.info("Segment index pruned %d segments", removed)
+        return removed
+
+    def stats(self) -> dict[str, int]:
+        with self._lock:
+            segments, transcripts = self._conn.execute(
+                "SELECT COUNT(*), COUNT(DISTINCT transcript_id) FROM segments"
+            ).fetchone()
+        return {"segments": segments, "transcripts": transcripts}
+
+    def close(self) -> None:
+        with self._lock:
+            self._conn.close()
+
+
+def _line(segment: IndexedSegment) -> str:
+    line = segment_line(TranscriptSegment(speaker=segment.speaker, text=segment.text))
+    if segment.offset is None:
+        return line
+    minutes, seconds = divmod(int(segment.offset), 60)
+    return f"[{minutes // 60:02d}:{minutes % 60:02d}:{seconds:02d}] {line}"
@@ -0,0 +1,238 @@
+"""
+Persistent turn-state storage for AgentApplication (replaces MemoryStorage): SQLite in WAL
+mode behind a bounded LRU cache, with batched writes and TTL expiry of idle conversations.
+"""
+
+import asyncio
+import json
+import logging
+import sqlite3
+import threading
+import time
+from collections import OrderedDict
+from pathlib import Path
+from typing import TypeVar
+
+from microsoft_agents.hosting.core import Storage, StoreItem
+
+logger = logging.getLogger(__name__)
+
+StoreItemT = TypeVar("StoreItemT", bound=StoreItem)
+
+# Expired rows are deleted at most this often (and on open).
+EXPIRE_EVERY_SECONDS = 600
+
+
+class SqliteStorage(Storage):
+    """
+    Storage on a local SQLite file. Values are kept as JSON text; up to max_cached of them
+    are also held in an LRU cache, so memory stays flat however many conversations there are.
+    Writes and deletes are applied to the cache at once and flushed to disk in one transaction
+    every flush_interval seconds (and on close), so a crash can lose at most that much; with
+    flush_interval 0, write() and delete() commit before they return (write-through).
+    Entries not read or written for ttl_seconds are treated as missing and deleted. When another
+    process writes the same file, the cache is dropped (PRAGMA data_version), so several
+    instances on one host can share it.
+    """
+
+    def __init__(
+        self,
+        path: str | Path,
+        max_cached: int = 1000,
+        ttl_seconds: float = 7 * 86400,
+        flush_interval: float = 1.0,
+    ):
+        self._path = Path(path)
+        self._path.parent.mkdir(parents=True, exist_ok=True)
+        self._max_cached = max_cached
+        self._ttl = ttl_seconds
+        self._flush_interval = flush_interval
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(self._path, check_same_thread=False)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+        self._conn.execute(
+            "CREATE TABLE IF NOT EXISTS turn_state ("
+            " key TEXT PRIMARY KEY,"
+            " value TEXT NOT NULL,"
+            " last_used_at REAL NOT NULL)"
+        )
+        self._conn.execute("CREATE INDEX IF NOT EXISTS turn_state_last_used ON turn_state (last_used_at)")
+        self._conn.commit()
+        self._data_version = self._conn.execute("PRAGMA data_version").fetchone()[0]
+        # key -> (JSON text, last used)
+        self._cache: OrderedDict[str, tuple[str, float]] = OrderedDict()
+        # Not yet on disk: key -> JSON text, or None for a delete; and keys only read (touched).
+        self._pending: dict[str, str | None] = {}
+        self._touched: dict[str, float] = {}
+        self._flush_task: asyncio.Task | None = None
+        self._last_expire = 0.0
+        self.reads = 0
+        self.cache_hits = 0
+        self.flushes = 0
+        self._expire()
+
+    @staticmethod
+    def _check_keys(keys, operation: str) -> None:
+        # Same contract as MemoryStorage.
+        if not keys:
+            raise ValueError(f"SqliteStorage.{operation}(): keys are required")
+        if any(key == "" for key in keys):
+            raise ValueError(f"SqliteStorage.{operation}(): key cannot be empty")
+
+    def _cache_put(self, key: str, value: str, used_at: float) -> None:
+        self._cache[key] = (value, used_at)
+        self._cache.move_to_end(key)
+        while len(self._cache) > self._max_cached:
+            self._cache.popitem(last=False)
+
+    def _sync_other_writers(self) -> None:
+        """Drop the cache if another connection committed since the last check (ours do not count)."""
+        version = self._conn.execute("PRAGMA data_version").fetchone()[0]
+        if version != self._data_version:
+            self._data_version = version
+            self._cache.clear()
+
+    def _read_sync(self, keys: list[str]) -> dict[str, str]:
+        now = time.time()
+        found: dict[str, str] = {}
+        with self._lock:
+            self._sync_other_writers()
+            missing = []
+            for key in keys:
+                if key in self._pending:
+                    value = self._pending[key]
+                    if value is not None:
+                        found[key] = value
+                        self._cache_put(key, value, now)
+                    continue
+                cached = self._cache.get(key)
+                if cached is not None and now - cached[1] <= self._ttl:
+                    found[key] = cached[0]
+                    self._cache_put(key, cached[0], now)
+                    self._touched[key] = now
+                    self.cache_hits += 1
+                else:
+                    missing.append(key)
+            if missing:
+                placeholders = ",".join("?" * len(missing))
+                rows = self._conn.execute(
+                    f"SELECT key, value, last_used_at FROM turn_state WHERE key IN ({placeholders})",
+                    missing,
+                ).fetchall()
+                for key, value, last_used_at in rows:
+                    if now - last_used_at > self._ttl:
+                        continue
+                    found[key] = value
+                    self._cache_put(key, value, now)
+                    self._touched[key] = now
+            self.reads += len(keys)
+        return found
+
+    async def read(
+        self, keys: list[str], *, target_cls: type[StoreItemT], **kwargs
+    ) -> dict[str, StoreItemT]:
+        """Read items; keys that are missing or expired are left out."""
+        self._check_keys(keys, "read")
+        found = await asyncio.to_thread(self._read_sync, keys)
+        if self._touched:
+            # Reads keep a conversation alive, too.
+            self._schedule_flush()
+        return {key: target_cls.from_json_to_store_item(json.loads(value)) for key, value in found.items()}
+
+    async def write(self, changes: dict[str, StoreItem]) -> None:
+        """Write items (to the cache now, to disk with the next flush, or at once with flush_interval 0)."""
+        self._check_keys(changes, "write")
+        now = time.time()
+        encoded = {key: json.dumps(item.store_item_to_json()) for key, item in changes.items()}
+        with self._lock:
+            for key, value in encoded.items():
+                self._pending[key] = value
+                self._touched.pop(key, None)
+                self._cache_put(key, value, now)
+        await self._flush_or_schedule()
+
+    async def delete(self, keys: list[str]) -> None:
+        """Delete items (missing keys are ignored)."""
+        self._check_keys(keys, "delete")
+        with self._lock:
+            for key in keys:
+                self._pending[key] = None
+                self._touched.pop(key, None)
+                self._cache.pop(key, None)
+        await self._flush_or_schedule()
+
+    async def _flush_or_schedule(self) -> None:
+        if self._flush_interval <= 0:
+            await asyncio.to_thread(self.flush)
+        else:
+            self._schedule_flush()
+
+    def _schedule_flush(self) -> None:
+        if self._flush_task is None or self._flush_task.done():
+            self._flush_task = asyncio.get_running_loop().create_task(self._flush_later())
+
+    async def _flush_later(self) -> None:
+        await asyncio.sleep(self._flush_interval)
+        try:
+            await asyncio.to_thread(self.flush)
+        except Exception as e:
+            logger.exception("Turn state flush failed: %s", e)
+
+    def flush(self) -> None:
+        """Write pending changes and access times to disk in one transaction; expire idle rows."""
+        now = time.time()
+        with self._lock:
+            pending, self._pending = self._pending, {}
+            touched, self._touched = self._touched, {}
+            if pending or touched:
+                try:
+                    with self._conn:
+                        self._conn.executemany(
+                            "INSERT OR REPLACE INTO turn_state (key, value, last_used_at) VALUES (?, ?, ?)",
+                            [(k, v, now) for k, v in pending.items() if v is not None],
+                        )
+                        self._conn.executemany(
+                            "DELETE FROM turn_state WHERE key = ?",
+                            [(k,) for k, v in pending.items() if v is None],
+                        )
+                        self._conn.executemany(
+                            "UPDATE turn_state SET last_used_at = ? WHERE key = ?",
+                            [(t, k) for k, t in touched.items()],
+                        )
+                except Exception:
+                    # Keep them for the next flush (newer changes win).
+                    self._pending = {**pending, **self._pending}
+                    raise
+                self.flushes += 1
+        if now - self._last_expire >= EXPIRE_EVERY_SECONDS:
+            self._expire()
+
+    def _expire(self) -> None:
+        now = time.time()
+        with self._lock:
+            cur = self._conn.execute("DELETE FROM turn_state WHERE last_used_at < ?", (now - self._ttl,))
+            self._conn.commit()
+            self._last_expire = now
+        if cur.rowcount:
+            logger.info("Turn state: expired %d idle conversation entries", cur.rowcount)
+
+    def stats(self) -> dict[str, int]:
+        with self._lock:
+            entries = self._conn.execute("SELECT COUNT(*) FROM turn_state").fetchone()[0]
+            return {
+                "entries": entries,
+                "cached": len(self._cache),
+                "pending": len(self._pending),
+                "reads": self.reads,
+                "cache_hits": self.cache_hits,
+                "flushes": self.flushes,
+            }
+
+    async def aclose(self) -> None:
+        """Flush pending writes and close the database."""
+        if self._flush_task is not None and not self._flush_task.done():
+            self._flush_task.cancel()
+        await asyncio.to_thread(self.flush)
+        with self._lock:
+            self._conn.close()
@@ -1,13 +1,29 @@
 """Summarize meeting transcripts using Azure OpenAI."""
 
+import asyncio
 import logging
 import os
-from pathlib import Path
-from typing import Any
+import time
+import warnings
+from dataclasses import dataclass, field
+from typing import Any, AsyncIterable, AsyncIterator, Awaitable, Callable
 
-from openai import AzureOpenAI
+from openai import AsyncAzureOpenAI, AzureOpenAI
 
+from meeting_agent.archive import ArchiveScope, SummaryArchive, write_flat_summary
+from meeting_agent.chunking import chunk_transcripts, estimate_tokens, group_for_reduce
+from meeting_agent.compaction import compaction_options
 from meeting_agent.config import Config
+from meeting_agent.metrics import (
+    IN_FLIGHT,
+    OPENAI_TOKENS,
+    PIPELINE_QUEUE_DEPTH,
+    PIPELINE_QUEUE_WAIT,
+    STAGE_SECONDS,
+    SUMMARY_CACHE_LOOKUPS,
+    stage,
+)
+from meeting_agent.summary_cache import SummaryCache, cache_key, sha256_hex
 
 logger = logging.getLogger(__name__)
 
@@ -21,79 +37,655 @@ USER_PROMPT_TEMPLATE = """Summarize the following meeting transcript(s):
 
 Summary:"""
 
+REDUCE_PROMPT_TEMPLATE = """Combine the following partial meeting summaries into one summary. Merge repeated topics, keep every decision and action item, and keep the meeting each item came from:
+
+---
+{text}
+---
+
+Summary:"""
+
+# Prepended to map and reduce prompts when the user asked something narrower than "summary".
+FOCUS_PROMPT_TEMPLATE = """Answer this request from the meeting transcript excerpts below; "[...]" marks left-out parts. Say so if the excerpts do not answer it.
+Request: {focus}
+
+"""
+
+NO_TRANSCRIPTS = "No transcripts found for the selected period."
+EMPTY_TEXT_SUMMARY = "(No transcript content to summarize.)"
+NO_SUMMARY = "(No summary generated.)"
+
+# Changes to any prompt invalidate cached summaries.
+PROMPT_HASH = sha256_hex(SYSTEM_PROMPT + USER_PROMPT_TEMPLATE + REDUCE_PROMPT_TEMPLATE + FOCUS_PROMPT_TEMPLATE)
+
+# (messages, max_tokens) -> (summary, prompt_tokens, completion_tokens)
+Completion = Callable[[list[dict[str, str]], int], Awaitable[tuple[str, int, int]]]
+# Receives the final summary's text as it is generated.
+OnDelta = Callable[[str], None]
+
+# Hard cap for a single summarize_text call; summarize_transcripts chunks instead of truncating
+# (config.MAX_CHUNK_TOKENS keeps chunks under it).
+MAX_SINGLE_CALL_CHARS = 50000
+# Room left in a call for the prompt templates and the focus request.
+PROMPT_RESERVE_CHARS = 2000
+
+
+def _messages(
+    text: str, template: str = USER_PROMPT_TEMPLATE, focus: str | None = None
+) -> list[dict[str, str]]:
+    if len(text) > MAX_SINGLE_CALL_CHARS:
+        logger.warning(
+            "Truncating %d characters to %d for a single completion", len(text), MAX_SINGLE_CALL_CHARS
+        )
+    prefix = FOCUS_PROMPT_TEMPLATE.format(focus=focus.strip()) if focus else ""
+    return [
+        {"role": "system", "content": SYSTEM_PROMPT},
+        {"role": "user", "content": prefix + template.format(text=text[:MAX_SINGLE_CALL_CHARS])},
+    ]
+
+
+def _split_for_call(text: str) -> list[str]:
+    """
+    text in pieces that fit one completion with its prompt, cut between lines (or anywhere in
+    a single over-long line); usually just [text]. Keeps a chunk whose token estimate
+    undercounts its characters from being truncated by _messages.
+    """
+    limit = MAX_SINGLE_CALL_CHARS - PROMPT_RESERVE_CHARS
+    if len(text) <= limit:
+        return [text]
+    pieces: list[str] = []
+    current = ""
+    for line in text.split("\n"):
+        while len(line) > limit:
+            if current:
+                pieces.append(current)
+                current = ""
+            pieces.append(line[:limit])
+            line = line[limit:]
+        if current and len(current) + 1 + len(line) > limit:
+            pieces.append(current)
+            current = line
+        else:
+            current = f"{current}\n{line}" if current else line
+    if current:
+        pieces.append(current)
+    return pieces
+
+
+def _summary_from_response(resp: Any) -> str:
+    choice = resp.choices[0] if resp.choices else None
+    if choice and choice.message and choice.message.content:
+        return choice.message.content.strip()
+    return NO_SUMMARY
+
+
+def _usage(resp: Any, messages: list[dict[str, str]], summary: str) -> tuple[int, int]:
+    """(prompt_tokens, completion_tokens) from the response, estimated if the service omits usage."""
+    usage = getattr(resp, "usage", None)
+    if usage is not None:
+        return usage.prompt_tokens or 0, usage.completion_tokens or 0
+    return sum(estimate_tokens(m["content"]) for m in messages), estimate_tokens(summary)
+
+
+def _record_usage(prompt_tokens: int, completion_tokens: int) -> None:
+    OPENAI_TOKENS.inc(prompt_tokens, kind="prompt")
+    OPENAI_TOKENS.inc(completion_tokens, kind="completion")
+
+
+def _meeting_heading(t: dict[str, Any]) -> str:
+    return f"**Meeting {t.get('meeting_id', '') or 'unknown'}** ({t.get('created_date_time', '')}):"
+
+
+def _warn_output_dir() -> None:
+    warnings.warn(
+        "output_dir is deprecated; pass archive and scope to file summaries in a SummaryArchive",
+        DeprecationWarning,
+        stacklevel=3,
+    )
+
+
+@dataclass
+class StageStats:
+    """Token usage and wall time of one map-reduce stage."""
+
+    stage: str
+    calls: int = 0
+    prompt_tokens: int = 0
+    completion_tokens: int = 0
+    cache_hits: int = 0
+    seconds: float = 0.0
+
+
+@dataclass
+class MapReduceSummary:
+    """Final summary plus per-stage stats (map, reduce-1, reduce-2, ...)."""
+
+    summary: str
+    stages: list[StageStats] = field(default_factory=list)
+
 
 class TranscriptSummarizer:
     """Summarize transcripts using Azure OpenAI chat completions."""
 
-    def __init__(self, config: Config):
+    def __init__(self, config: Config, cache: SummaryCache | None = None):
         self._config = config
+        self._cache = cache
         self._client = AzureOpenAI(
             api_key=config.azure_openai_api_key,
             api_version=config.azure_openai_api_version,
             azure_endpoint=config.azure_openai_endpoint,
         )
+        self._async_client = AsyncAzureOpenAI(
+            api_key=config.azure_openai_api_key,
+            api_version=config.azure_openai_api_version,
+            azure_endpoint=config.azure_openai_endpoint,
+        )
         self._deployment = config.azure_openai_deployment
+        self._compaction = compaction_options(config)
+        # Caps completions in flight across all concurrent summaries in this process.
+        self._semaphore = asyncio.Semaphore(config.openai_max_concurrency)
+
+    def close(self) -> None:
+        """Close the underlying sync HTTP client."""
+        self._client.close()
+
+    async def aclose(self) -> None:
+        """Close both underlying HTTP clients."""
+        self._client.close()
+        await self._async_client.close()
+
+    def _complete(self, messages: list[dict[str, str]], max_tokens: int) -> tuple[str, int, int]:
+        with stage("openai_completion"):
+            resp = self._client.chat.completions.create(
+                model=self._deployment, messages=messages, max_tokens=max_tokens
+            )
+        summary = _summary_from_response(resp)
+        usage = _usage(resp, messages, summary)
+        _record_usage(*usage)
+        return (summary, *usage)
+
+    async def _complete_async(
+        self, messages: list[dict[str, str]], max_tokens: int
+    ) -> tuple[str, int, int]:
+        async with self._semaphore:
+            with IN_FLIGHT.track_in_progress(operation="openai_completion"), stage("openai_completion"):
+                resp = await self._async_client.chat.completions.create(
+                    model=self._deployment, messages=messages, max_tokens=max_tokens
+                )
+        summary = _summary_from_response(resp)
+        usage = _usage(resp, messages, summary)
+        _record_usage(*usage)
+        return (summary, *usage)
+
+    async def _complete_stream_async(
+        self, messages: list[dict[str, str]], max_tokens: int, on_delta: OnDelta
+    ) -> tuple[str, int, int]:
+        """_complete_async with stream=True: passes each content delta to on_delta as it arrives."""
+        parts: list[str] = []
+        usage = None
+        async with self._semaphore:
+            with IN_FLIGHT.track_in_progress(operation="openai_completion"), stage("openai_completion"):
+                stream = await self._async_client.chat.completions.create(
+                    model=self._deployment,
+                    messages=messages,
+                    max_tokens=max_tokens,
+                    stream=True,
+                    # Usage arrives in one final chunk without choices.
+                    stream_options={"include_usage": True},
+                )
+                async for chunk in stream:
+                    usage = getattr(chunk, "usage", None) or usage
+                    # Azure also sends content-filter results as chunks without choices.
+                    delta = chunk.choices[0].delta.content if chunk.choices else None
+                    if not delta:
+                        continue
+                    if not parts:
+                        # Match the stripped summary, so the streamed text is a prefix of it.
+                        delta = delta.lstrip()
+                        if not delta:
+                            continue
+                    parts.append(delta)
+                    on_delta(delta)
+        summary = "".join(parts).strip() or NO_SUMMARY
+        if usage is not None:
+            prompt_tokens, completion_tokens = usage.prompt_tokens or 0, usage.completion_tokens or 0
+        else:
+            # Only if the service (e.g. an older API version) sent no usage chunk.
+            prompt_tokens = sum(estimate_tokens(m["content"]) for m in messages)
+            completion_tokens = estimate_tokens(summary)
+        _record_usage(prompt_tokens, completion_tokens)
+        return summary, prompt_tokens, completion_tokens
 
     def summarize_text(self, text: str, max_tokens: int = 1000) -> str:
         """Summarize a single block of transcript text."""
         if not text or not text.strip():
-            return "(No transcript content to summarize.)"
-        user_content = USER_PROMPT_TEMPLATE.format(text=text[:50000])
+            return EMPTY_TEXT_SUMMARY
         try:
-            resp = self._client.chat.completions.create(
-                model=self._deployment,
-                messages=[
-                    {"role": "system", "content": SYSTEM_PROMPT},
-                    {"role": "user", "content": user_content},
-                ],
-                max_tokens=max_tokens,
+            return self._complete(_messages(text), max_tokens)[0]
+        except Exception as e:
+            logger.exception("Azure OpenAI summarization failed: %s", e)
+            return f"(Summarization failed: {e})"
+
+    async def summarize_text_async(self, text: str, max_tokens: int = 1000) -> str:
+        """Async summarize_text on AsyncAzureOpenAI."""
+        if not text or not text.strip():
+            return EMPTY_TEXT_SUMMARY
+        try:
+            return (await self._complete_async(_messages(text), max_tokens))[0]
+        except Exception as e:
+            logger.exception("Azure OpenAI summarization failed: %s", e)
+            return f"(Summarization failed: {e})"
+
+    def _log_stage(self, stats: StageStats) -> None:
+        logger.info(
+            "Summary stage %s: %d call(s), %d cached, %d prompt + %d completion tokens, %.2fs",
+            stats.stage,
+            stats.calls,
+            stats.cache_hits,
+            stats.prompt_tokens,
+            stats.completion_tokens,
+            stats.seconds,
+        )
+
+    def _finish_stage(self, stats: StageStats, level: int, started: float, result: MapReduceSummary) -> None:
+        stats.seconds = time.perf_counter() - started
+        STAGE_SECONDS.observe(stats.seconds, stage="summarize_map" if level == 0 else "summarize_reduce")
+        self._log_stage(stats)
+        result.stages.append(stats)
+
+    def _map_calls(
+        self, transcripts: list[dict[str, Any]], focus: str | None
+    ) -> list[tuple[str | None, list[dict[str, str]]]]:
+        return [
+            (t.get("transcript_id"), _messages(piece, focus=focus))
+            for t in transcripts
+            for chunk in chunk_transcripts([t], self._config.summary_chunk_tokens, self._compaction)
+            for piece in _split_for_call(chunk.render())
+        ]
+
+    def _reduce_calls(
+        self, partials: list[str], focus: str | None
+    ) -> list[tuple[str | None, list[dict[str, str]]]]:
+        groups = group_for_reduce(partials, self._config.summary_reduce_fan_out, self._config.summary_chunk_tokens)
+        return [(None, _messages("\n\n---\n\n".join(g), REDUCE_PROMPT_TEMPLATE, focus)) for g in groups]
+
+    def _cache_lookup(
+        self, transcript_id: str | None, messages: list[dict[str, str]], max_tokens: int, stats: StageStats
+    ) -> tuple[str | None, str | None]:
+        """(cache key, cached summary); both None without a cache. Blocking."""
+        if self._cache is None:
+            return None, None
+        content_hash = sha256_hex(messages[-1]["content"])
+        key = cache_key(transcript_id, content_hash, self._deployment, PROMPT_HASH, max_tokens)
+        cached = self._cache.get(key)
+        SUMMARY_CACHE_LOOKUPS.inc(result="hit" if cached is not None else "miss")
+        if cached is not None:
+            stats.cache_hits += 1
+        return key, cached
+
+    def _cached_completion_sync(
+        self,
+        transcript_id: str | None,
+        messages: list[dict[str, str]],
+        max_tokens: int,
+        stats: StageStats,
+    ) -> str:
+        """_cached_completion on the sync client. Blocking."""
+        key, cached = self._cache_lookup(transcript_id, messages, max_tokens, stats)
+        if cached is not None:
+            return cached
+        summary, prompt_tokens, completion_tokens = self._complete(messages, max_tokens)
+        stats.calls += 1
+        stats.prompt_tokens += prompt_tokens
+        stats.completion_tokens += completion_tokens
+        if key is not None and summary != NO_SUMMARY:
+            self._cache.put(key, summary, transcript_id)
+        return summary
+
+    async def _cached_completion(
+        self,
+        transcript_id: str | None,
+        messages: list[dict[str, str]],
+        max_tokens: int,
+        complete: Completion,
+        stats: StageStats,
+        on_delta: OnDelta | None = None,
+    ) -> str:
+        """
+        Run one completion unless the cache already holds it for this content, deployment and
+        prompts. With on_delta, the completion is streamed into it (a cached one is passed whole).
+        """
+        key, cached = await asyncio.to_thread(self._cache_lookup, transcript_id, messages, max_tokens, stats)
+        if cached is not None:
+            if on_delta is not None:
+                on_delta(cached)
+            return cached
+        if on_delta is not None:
+            summary, prompt_tokens, completion_tokens = await self._complete_stream_async(
+                messages, max_tokens, on_delta
             )
-            choice = resp.choices[0] if resp.choices else None
-            if choice and choice.message and choice.message.content:
-                return choice.message.content.strip()
+        else:
+            summary, prompt_tokens, completion_tokens = await complete(messages, max_tokens)
+        stats.calls += 1
+        stats.prompt_tokens += prompt_tokens
+        stats.completion_tokens += completion_tokens
+        if key is not None and summary != NO_SUMMARY:
+            await asyncio.to_thread(self._cache.put, key, summary, transcript_id)
+        return summary
+
+    async def _map_reduce(
+        self,
+        transcripts: list[dict[str, Any]],
+        max_tokens: int,
+        complete: Completion,
+        on_delta: OnDelta | None = None,
+        focus: str | None = None,
+    ) -> MapReduceSummary:
+        map_calls = self._map_calls(transcripts, focus)
+        if not map_calls:
+            return MapReduceSummary(EMPTY_TEXT_SUMMARY)
+        return await self._run_stages(map_calls, 0, MapReduceSummary(""), max_tokens, complete, on_delta, focus)
+
+    def _map_reduce_sync(self, transcripts: list[dict[str, Any]], max_tokens: int) -> MapReduceSummary:
+        """_map_reduce on the sync client, one call at a time."""
+        calls = self._map_calls(transcripts, None)
+        if not calls:
+            return MapReduceSummary(EMPTY_TEXT_SUMMARY)
+        result = MapReduceSummary("")
+        level = 0
+        while True:
+            stats = StageStats("map" if level == 0 else f"reduce-{level}")
+            started = time.perf_counter()
+            partials = [self._cached_completion_sync(tid, messages, max_tokens, stats) for tid, messages in calls]
+            self._finish_stage(stats, level, started, result)
+            if len(partials) == 1:
+                result.summary = partials[0]
+                return result
+            calls = self._reduce_calls(partials, None)
+            level += 1
+
+    async def _run_stages(
+        self,
+        map_calls: list[tuple[str | None, list[dict[str, str]]]],
+        level: int,
+        result: MapReduceSummary,
+        max_tokens: int,
+        complete: Completion,
+        on_delta: OnDelta | None,
+        focus: str | None,
+    ) -> MapReduceSummary:
+        """Run the calls of stage level, then reduce their outputs level by level until one remains."""
+        while True:
+            stats = StageStats("map" if level == 0 else f"reduce-{level}")
+            started = time.perf_counter()
+            # A single call is the final summary: stream it.
+            final_delta = on_delta if len(map_calls) == 1 else None
+            partials = list(
+                await asyncio.gather(
+                    *(
+                        self._cached_completion(tid, messages, max_tokens, complete, stats, final_delta)
+                        for tid, messages in map_calls
+                    )
+                )
+            )
+            self._finish_stage(stats, level, started, result)
+            if len(partials) == 1:
+                result.summary = partials[0]
+                return result
+            map_calls = self._reduce_calls(partials, focus)
+            level += 1
+
+    async def _map_reduce_stream(
+        self,
+        transcripts: AsyncIterable[dict[str, Any]],
+        max_tokens: int,
+        on_delta: OnDelta | None,
+        focus: str | None,
+    ) -> MapReduceSummary:
+        """
+        _map_reduce over transcripts as they arrive: each transcript's map calls start as soon
+        as it is received, at most config.pipeline_queue_size outstanding (taking the next
+        transcript waits for one to finish). The first call is held back until a second one
+        exists, so that a single call is still streamed as the final summary. Map outputs are
+        reduced in meeting order.
+        """
+        chunk_tokens = self._config.summary_chunk_tokens
+        slots = asyncio.Semaphore(self._config.pipeline_queue_size)
+        stats = StageStats("map")
+        start = time.perf_counter()
+        # (meeting order key, map output) as calls finish
+        partials: list[tuple[tuple[str, str, int], str]] = []
+        tasks: set[asyncio.Task] = set()
+        held: tuple[tuple[str, str, int], str | None, list[dict[str, str]]] | None = None
+
+        async def run(order: tuple[str, str, int], tid: str | None, messages: list[dict[str, str]]) -> None:
+            try:
+                summary = await self._cached_completion(tid, messages, max_tokens, self._complete_async, stats)
+                partials.append((order, summary))
+            finally:
+                slots.release()
+
+        async def launch(call: tuple[tuple[str, str, int], str | None, list[dict[str, str]]]) -> None:
+            waited = time.perf_counter()
+            await slots.acquire()
+            PIPELINE_QUEUE_WAIT.observe(time.perf_counter() - waited, queue="map", side="put")
+            PIPELINE_QUEUE_DEPTH.observe(len(tasks), queue="map")
+            task = asyncio.ensure_future(run(*call))
+            tasks.add(task)
+            task.add_done_callback(tasks.discard)
+
+        try:
+            async for t in transcripts:
+                order = (t.get("created_date_time", ""), t.get("transcript_id") or "")
+                pieces = (
+                    piece
+                    for chunk in chunk_transcripts([t], chunk_tokens, self._compaction)
+                    for piece in _split_for_call(chunk.render())
+                )
+                for i, piece in enumerate(pieces):
+                    call = ((*order, i), t.get("transcript_id"), _messages(piece, focus=focus))
+                    if held is None and not partials and not tasks:
+                        held = call
+                        continue
+                    if held is not None:
+                        await launch(held)
+                        held = None
+                    await launch(call)
+            if held is not None:
+                # The only map call: it is the final summary.
+                return await self._run_stages(
+                    [held[1:]], 0, MapReduceSummary(""), max_tokens, self._complete_async, on_delta, focus
+                )
+            await asyncio.gather(*tasks)
+        finally:
+            for task in tasks:
+                task.cancel()
+        if not partials:
+            return MapReduceSummary(EMPTY_TEXT_SUMMARY)
+        result = MapReduceSummary("")
+        self._finish_stage(stats, 0, start, result)
+        reduce_calls = self._reduce_calls([summary for _, summary in sorted(partials)], focus)
+        return await self._run_stages(reduce_calls, 1, result, max_tokens, self._complete_async, on_delta, focus)
+
+    def summarize_map_reduce(
+        self, transcripts: list[dict[str, Any]], max_tokens: int = 1000
+    ) -> MapReduceSummary:
+        """
+        Summarize every transcript without truncation: chunk on speaker turns to
+        config.summary_chunk_tokens, summarize each chunk (map), then merge the partial
+        summaries config.summary_reduce_fan_out at a time until one remains (reduce).
+        Completions already in the summary cache are reused. Blocking, one call at a time on
+        the sync client, so it can also be called from a thread of a running event loop; see
+        summarize_map_reduce_async for the concurrent version.
+        """
+        return self._map_reduce_sync(transcripts, max_tokens)
+
+    async def summarize_map_reduce_async(
+        self,
+        transcripts: list[dict[str, Any]],
+        max_tokens: int = 1000,
+        on_delta: OnDelta | None = None,
+        focus: str | None = None,
+    ) -> MapReduceSummary:
+        """
+        Async summarize_map_reduce: all calls of a stage run concurrently (bounded by
+        config.openai_max_concurrency), so latency grows with tree depth, not transcript length.
+        With on_delta, the final completion is streamed (stream=True) into it as it is generated.
+        With focus (the user's request), every prompt asks to answer it rather than summarize.
+        """
+        return await self._map_reduce(transcripts, max_tokens, self._complete_async, on_delta, focus)
+
+    def _summarize_or_error(self, transcripts: list[dict[str, Any]]) -> str:
+        try:
+            return self.summarize_map_reduce(transcripts).summary
+        except Exception as e:
+            logger.exception("Azure OpenAI summarization failed: %s", e)
+            return f"(Summarization failed: {e})"
+
+    async def _summarize_or_error_async(
+        self,
+        transcripts: list[dict[str, Any]],
+        on_delta: OnDelta | None = None,
+        focus: str | None = None,
+    ) -> str:
+        try:
+            return (
+                await self.summarize_map_reduce_async(transcripts, on_delta=on_delta, focus=focus)
+            ).summary
         except Exception as e:
             logger.exception("Azure OpenAI summarization failed: %s", e)
             return f"(Summarization failed: {e})"
-        return "(No summary generated.)"
+
+    async def summarize_transcript_stream_async(
+        self,
+        transcripts: AsyncIterable[dict[str, Any]],
+        archive: SummaryArchive | None = None,
+        scope: ArchiveScope | None = None,
+        on_delta: OnDelta | None = None,
+    ) -> str:
+        """
+        summarize_transcripts_async(combined=True) over transcripts as they arrive (e.g. from
+        GraphTranscriptClient.iter_transcripts_for_user_async): map completions for the first
+        transcripts run while later ones are still downloading, so latency approaches the
+        slowest single download-and-summarize path rather than the sum of the stages. Consuming
+        the stream is paused while config.pipeline_queue_size map calls are outstanding.
+        Errors raised by the stream itself (e.g. a failed listing) propagate.
+        """
+        received: list[dict[str, Any]] = []
+        stream_errors: list[Exception] = []
+
+        async def keep(stream: AsyncIterable[dict[str, Any]]) -> AsyncIterator[dict[str, Any]]:
+            try:
+                async for t in stream:
+                    received.append(t)
+                    yield t
+            except Exception as e:
+                stream_errors.append(e)
+                raise
+
+        try:
+            summary = (await self._map_reduce_stream(keep(transcripts), 1000, on_delta, None)).summary
+        except Exception as e:
+            if stream_errors:
+                raise
+            logger.exception("Azure OpenAI summarization failed: %s", e)
+            summary = f"(Summarization failed: {e})"
+        if not received:
+            return NO_TRANSCRIPTS
+        if archive is not None and scope is not None:
+            await archive.awrite_transcripts(scope, received)
+            await archive.awrite_summary(scope, summary)
+        return summary
 
     def summarize_transcripts(
         self,
         transcripts: list[dict[str, Any]],
         combined: bool = True,
+        archive: SummaryArchive | None = None,
+        scope: ArchiveScope | None = None,
+        *,
         output_dir: str | None = None,
     ) -> str:
         """
         Summarize a list of transcript results (from GraphTranscriptClient).
-        If combined=True, concatenate all content and produce one summary.
+        If combined=True, produce one summary over all meetings (map-reduce, nothing truncated).
         If combined=False, summarize each and concatenate.
-        Optionally write per-meeting summaries to output_dir.
+        With archive and scope, the summaries (and the raw transcripts, if the archive keeps
+        them) are archived under scope. output_dir is deprecated: it still writes
+        combined_summary.md or summary_<meeting id>.md there, as before the archive existed.
         """
+        if output_dir:
+            _warn_output_dir()
         if not transcripts:
-            return "No transcripts found for the selected period."
+            return NO_TRANSCRIPTS
 
-        output_path = None
-        if output_dir:
-            Path(output_dir).mkdir(parents=True, exist_ok=True)
-            output_path = Path(output_dir)
+        if archive is not None and scope is not None:
+            archive.write_transcripts(scope, transcripts)
+        else:
+            archive = None
 
         if combined:
-            combined_text = "\n\n---\n\n".join(
-                f"Meeting {t.get('meeting_id', '')} ({t.get('created_date_time', '')}):\n{t.get('content_text', '')}"
-                for t in transcripts
-            )
-            summary = self.summarize_text(combined_text)
-            if output_path:
-                (output_path / "combined_summary.md").write_text(summary, encoding="utf-8")
+            summary = self._summarize_or_error(transcripts)
+            if archive is not None:
+                archive.write_summary(scope, summary)
+            if output_dir:
+                write_flat_summary(output_dir, summary)
             return summary
 
         summaries: list[str] = []
         for t in transcripts:
-            content = t.get("content_text", "")
-            meeting_id = t.get("meeting_id", "") or "unknown"
-            created = t.get("created_date_time", "")
-            one = self.summarize_text(content)
-            summaries.append(f"**Meeting {meeting_id}** ({created}):\n{one}")
-            if output_path:
-                safe_id = "".join(c if c.isalnum() or c in "-_" else "_" for c in meeting_id)[:50]
-                (output_path / f"summary_{safe_id}.md").write_text(one, encoding="utf-8")
+            one = self._summarize_or_error([t])
+            summaries.append(f"{_meeting_heading(t)}\n{one}")
+            if archive is not None:
+                archive.write_summary(scope, one, kind="meeting", meeting_id=t.get("meeting_id"))
+            if output_dir:
+                write_flat_summary(output_dir, one, t.get("meeting_id") or "unknown")
+        return "\n\n".join(summaries)
+
+    async def summarize_transcripts_async(
+        self,
+        transcripts: list[dict[str, Any]],
+        combined: bool = True,
+        archive: SummaryArchive | None = None,
+        scope: ArchiveScope | None = None,
+        on_delta: OnDelta | None = None,
+        focus: str | None = None,
+        *,
+        output_dir: str | None = None,
+    ) -> str:
+        """
+        Async summarize_transcripts (with the same deprecated output_dir). With combined=False, per-meeting summaries run
+        concurrently (completions capped by config.openai_max_concurrency); output order
+        matches the input order. With combined=True and on_delta, the summary text is passed
+        to on_delta as it is generated; the returned summary starts with the streamed text.
+        focus (combined only) turns the summary into an answer to that request. Archive writes
+        run off the event loop.
+        """
+        if output_dir:
+            _warn_output_dir()
+        if not transcripts:
+            return NO_TRANSCRIPTS
+
+        if archive is not None and scope is not None:
+            await archive.awrite_transcripts(scope, transcripts)
+        else:
+            archive = None
+
+        if combined:
+            summary = await self._summarize_or_error_async(transcripts, on_delta, focus)
+            if archive is not None:
+                await archive.awrite_summary(scope, summary)
+            if output_dir:
+                await asyncio.to_thread(write_flat_summary, output_dir, summary)
+            return summary
+
+        async def summarize_one(t: dict[str, Any]) -> str:
+            one = await self._summarize_or_error_async([t])
+            if archive is not None:
+                await archive.awrite_summary(scope, one, kind="meeting", meeting_id=t.get("meeting_id"))
+            if output_dir:
+                await asyncio.to_thread(write_flat_summary, output_dir, one, t.get("meeting_id") or "unknown")
+            return f"{_meeting_heading(t)}\n{one}"
+
+        summaries = await asyncio.gather(*(summarize_one(t) for t in transcripts))
         return "\n\n".join(summaries)
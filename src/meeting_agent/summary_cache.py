@@ -0,0 +1,133 @@
+"""Persistent, content-addressed cache of generated summaries (SQLite)."""
+
+import hashlib
+import json
+import logging
+import sqlite3
+import threading
+import time
+from pathlib import Path
+
+logger = logging.getLogger(__name__)
+
+# Eviction runs after this many writes (and on open), not on every put.
+EVICT_EVERY_PUTS = 50
+
+
+def sha256_hex(text: str) -> str:
+    return hashlib.sha256(text.encode("utf-8")).hexdigest()
+
+
+def cache_key(
+    transcript_id: str | None,
+    content_hash: str,
+    deployment: str,
+    prompt_hash: str,
+    max_tokens: int,
+) -> str:
+    """Key for one completion: same transcript content, deployment and prompts give the same summary."""
+    return sha256_hex(json.dumps([transcript_id or "", content_hash, deployment, prompt_hash, max_tokens]))
+
+
+class SummaryCache:
+    """
+    SQLite-backed summary cache with age- and size-based eviction.
+    Entries older than max_age_seconds are dropped; when the stored summaries exceed
+    max_bytes the least recently used entries are dropped first. Thread-safe.
+    """
+
+    def __init__(self, path: str | Path, max_bytes: int, max_age_seconds: float):
+        self._path = Path(path)
+        self._path.parent.mkdir(parents=True, exist_ok=True)
+        self._max_bytes = max_bytes
+        self._max_age = max_age_seconds
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(self._path, check_same_thread=False)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute(
+            "CREATE TABLE IF NOT EXISTS summaries ("
+            " key TEXT PRIMARY KEY,"
+            " transcript_id TEXT,"
+            " summary TEXT NOT NULL,"
+            " size INTEGER NOT NULL,"
+            " created_at REAL NOT NULL,"
+            " last_used_at REAL NOT NULL)"
+        )
+        self._conn.execute("CREATE INDEX IF NOT EXISTS summaries_last_used ON summaries (last_used_at)")
+        self._conn.commit()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self._puts_since_evict = 0
+        self.evict()
+
+    def get(self, key: str) -> str | None:
+        """Cached summary for key, or None (expired entries count as misses)."""
+        now = time.time()
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT summary, created_at FROM summaries WHERE key = ?", (key,)
+            ).fetchone()
+            if row is None or now - row[1] > self._max_age:
+                self.misses += 1
+                return None
+            self._conn.execute("UPDATE summaries SET last_used_at = ? WHERE key = ?", (now, key))
+            self._conn.commit()
+            self.hits += 1
+            return row[0]
+
+    def put(self, key: str, summary: str, transcript_id: str | None = None) -> None:
+        """Store a summary; periodically evicts expired and least recently used entries."""
+        now = time.time()
+        with self._lock:
+            self._conn.execute(
+                "INSERT OR REPLACE INTO summaries (key, transcript_id, summary, size, created_at, last_used_at)"
+                " VALUES (?, ?, ?, ?, ?, ?)",
+                (key, transcript_id, summary, len(summary.encode("utf-8")), now, now),
+            )
+            self._conn.commit()
+            self._puts_since_evict += 1
+            due = self._puts_since_evict >= EVICT_EVERY_PUTS
+        if due:
+            self.evict()
+
+    def evict(self) -> int:
+        """Drop expired entries, then least recently used ones until under max_bytes. Returns count removed."""
+        with self._lock:
+            self._puts_since_evict = 0
+            removed = self._conn.execute(
+                "DELETE FROM summaries WHERE created_at < ?", (time.time() - self._max_age,)
+            ).rowcount
+            total = self._conn.execute("SELECT COALESCE(SUM(size), 0) FROM summaries").fetchone()[0]
+            if total > self._max_bytes:
+                for key, size in self._conn.execute(
+                    "SELECT key, size FROM summaries ORDER BY last_used_at"
+                ).fetchall():
+                    if total <= self._max_bytes:
+                        break
+                    self._conn.execute("DELETE FROM summaries WHERE key = ?", (key,))
+                    total -= size
+                    removed += 1
+            self._conn.commit()
+            self.evictions += removed
+        if removed:
+            logger.info("Summary cache evicted %d entries", removed)
+        return removed
+
+    def stats(self) -> dict[str, int]:
+        """Hit/miss/eviction counters plus current entry count and size in bytes."""
+        with self._lock:
+            entries, size = self._conn.execute(
+                "SELECT COUNT(*), COALESCE(SUM(size), 0) FROM summaries"
+            ).fetchone()
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "evictions": self.evictions,
+            "entries": entries,
+            "bytes": size,
+        }
+
+    def close(self) -> None:
+        with self._lock:
+            self._conn.close()
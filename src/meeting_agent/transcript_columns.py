@@ -0,0 +1,175 @@
+"""
+Compact columnar in-memory transcripts: interned speaker table, array-backed cue times and all
+cue text in one UTF-8 buffer addressed by offsets. About 5x smaller than one TranscriptSegment
+per cue and no larger than the rendered content_text string while also keeping cue times (smaller
+for non-ASCII text, which a str stores at 2-4 bytes per character); sliceable by time or speaker
+without copying the text. See benchmarks/transcript_memory.py.
+"""
+
+import sys
+from array import array
+from bisect import bisect_left
+from typing import Iterable, Iterator
+
+from meeting_agent.transcript_parser import TranscriptSegment, iter_vtt_segments, segment_line
+
+# Rows selected by a view: a contiguous range, or explicit row numbers (e.g. one speaker's cues).
+Rows = range | array
+
+
+def _ms(seconds: float) -> int:
+    return min(0xFFFFFFFF, max(0, round(seconds * 1000)))
+
+
+class ColumnarTranscriptBuilder:
+    """Appends segments column by column (e.g. straight from VttStreamParser output)."""
+
+    def __init__(self) -> None:
+        self._speaker_ids: dict[str, int] = {}
+        self._speakers: list[str] = []
+        # Narrow columns: 2 + 4 + 4 + 4 bytes per cue (times in ms, up to ~49 days).
+        self._ids = array("H")
+        self._starts = array("I")
+        self._ends = array("I")
+        self._offsets = array("I", [0])
+        self._buffer = bytearray()
+
+    def add(self, segments: Iterable[TranscriptSegment]) -> None:
+        for seg in segments:
+            speaker_id = self._speaker_ids.get(seg.speaker)
+            if speaker_id is None:
+                speaker_id = self._speaker_ids[seg.speaker] = len(self._speakers)
+                # Shared across transcripts too: the same people speak in many meetings.
+                self._speakers.append(sys.intern(seg.speaker))
+                if speaker_id == 0x10000:
+                    self._ids = array("I", self._ids)
+            self._ids.append(speaker_id)
+            self._starts.append(_ms(seg.start))
+            self._ends.append(_ms(seg.end))
+            self._buffer += seg.text.encode("utf-8")
+            self._offsets.append(len(self._buffer))
+
+    def build(self) -> "ColumnarTranscript":
+        """The transcript, with columns and buffer copied to their exact size (appends over-allocate)."""
+        return ColumnarTranscript(
+            tuple(self._speakers),
+            self._ids[:],
+            self._starts[:],
+            self._ends[:],
+            self._offsets[:],
+            bytes(self._buffer),
+        )
+
+
+class ColumnarTranscript:
+    """
+    A transcript (or a view of part of one) stored column-wise. Slicing ([a:b], between,
+    for_speaker) returns a view sharing the columns and text buffer; cue text is decoded only
+    when a cue is read, and render() produces the parse_vtt_to_text format lazily from them.
+    """
+
+    __slots__ = ("_speakers", "_ids", "_starts", "_ends", "_offsets", "_buffer", "_rows")
+
+    def __init__(
+        self,
+        speakers: tuple[str, ...],
+        speaker_ids: array,
+        starts: array,
+        ends: array,
+        offsets: array,
+        buffer: bytes,
+        rows: Rows | None = None,
+    ):
+        self._speakers = speakers
+        self._ids = speaker_ids
+        self._starts = starts
+        self._ends = ends
+        self._offsets = offsets
+        self._buffer = buffer
+        self._rows: Rows = rows if rows is not None else range(len(speaker_ids))
+
+    @classmethod
+    def from_segments(cls, segments: Iterable[TranscriptSegment]) -> "ColumnarTranscript":
+        builder = ColumnarTranscriptBuilder()
+        builder.add(segments)
+        return builder.build()
+
+    @classmethod
+    def from_vtt(cls, chunks: Iterable[str]) -> "ColumnarTranscript":
+        """Parse VTT (a string is one chunk) without materializing a segment list."""
+        return cls.from_segments(iter_vtt_segments(chunks))
+
+    def _view(self, rows: Rows) -> "ColumnarTranscript":
+        return ColumnarTranscript(
+            self._speakers, self._ids, self._starts, self._ends, self._offsets, self._buffer, rows
+        )
+
+    def __len__(self) -> int:
+        return len(self._rows)
+
+    def __getitem__(self, index: int | slice) -> "TranscriptSegment | ColumnarTranscript":
+        if isinstance(index, slice):
+            return self._view(self._rows[index])
+        return self._segment(self._rows[index])
+
+    def __iter__(self) -> Iterator[TranscriptSegment]:
+        return (self._segment(row) for row in self._rows)
+
+    def _segment(self, row: int) -> TranscriptSegment:
+        return TranscriptSegment(
+            speaker=self._speakers[self._ids[row]],
+            text=self._text(row),
+            start=self._starts[row] / 1000,
+            end=self._ends[row] / 1000,
+        )
+
+    def _text(self, row: int) -> str:
+        return str(memoryview(self._buffer)[self._offsets[row] : self._offsets[row + 1]], "utf-8")
+
+    def text_view(self, index: int) -> memoryview:
+        """UTF-8 bytes of one cue's text, without copying."""
+        row = self._rows[index]
+        return memoryview(self._buffer)[self._offsets[row] : self._offsets[row + 1]]
+
+    def start_times_ms(self) -> array:
+        """Cue start times in milliseconds, one per cue (and per line of render())."""
+        if isinstance(self._rows, range) and self._rows.step == 1:
+            return self._starts[self._rows.start : self._rows.stop]
+        return array("I", (self._starts[r] for r in self._rows))
+
+    @property
+    def speakers(self) -> tuple[str, ...]:
+        """Interned speaker table (of the whole transcript, also for views)."""
+        return self._speakers
+
+    def between(self, start: float, end: float) -> "ColumnarTranscript":
+        """Cues starting in [start, end) seconds. Contiguous views of time-ordered cues stay ranges."""
+        lo_ms, hi_ms = _ms(start), _ms(end)
+        rows = self._rows
+        if isinstance(rows, range) and rows.step == 1:
+            lo = bisect_left(self._starts, lo_ms, rows.start, rows.stop)
+            hi = bisect_left(self._starts, hi_ms, lo, rows.stop)
+            return self._view(range(lo, hi))
+        return self._view(array("I", (r for r in rows if lo_ms <= self._starts[r] < hi_ms)))
+
+    def for_speaker(self, *names: str) -> "ColumnarTranscript":
+        """Cues by any of the given speakers."""
+        wanted = {i for i, name in enumerate(self._speakers) if name in names}
+        return self._view(array("I", (r for r in self._rows if self._ids[r] in wanted)))
+
+    def lines(self) -> Iterator[str]:
+        """Lines in the "Speaker: text" format, decoded one at a time."""
+        return (segment_line(seg) for seg in self)
+
+    def render(self) -> str:
+        """Plain-text transcript, the same as render_segments over the same cues."""
+        return "\n".join(self.lines()).strip()
+
+    def nbytes(self) -> int:
+        """Approximate memory held by the (shared) columns, buffer and speaker table."""
+        columns = (self._ids, self._starts, self._ends, self._offsets)
+        return (
+            sum(c.itemsize * len(c) for c in columns)
+            + len(self._buffer)
+            + sum(sys.getsizeof(s) for s in self._speakers)
+        )
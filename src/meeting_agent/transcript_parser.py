@@ -2,14 +2,131 @@
 
 import re
 from dataclasses import dataclass
+from typing import AsyncIterable, AsyncIterator, Iterable, Iterator
 
+from meeting_agent.metrics import stage
 
-@dataclass
+# Cue timing line: "00:01:02.345 --> 00:01:04.000" (hours optional, optional cue settings after).
+_TIMING_RE = re.compile(
+    r"^((?:\d+:)?\d{2}:\d{2}[.,]\d{3})\s+-->\s+((?:\d+:)?\d{2}:\d{2}[.,]\d{3})"
+)
+# Voice span: "<v Speaker Name>text</v>" (closing tag optional per WebVTT).
+_VOICE_RE = re.compile(r"^<v(?:\.[^\s>]*)?\s+([^>]+)>([^<]*)(?:</v>)?\s*$", re.IGNORECASE)
+
+
+@dataclass(slots=True)
 class TranscriptSegment:
-    """A single segment (speaker + text) from a transcript."""
+    """A single segment (speaker + text) from a transcript, with cue start/end in seconds."""
 
     speaker: str
     text: str
+    start: float = 0.0
+    end: float = 0.0
+
+
+def _seconds(timestamp: str) -> float:
+    parts = timestamp.replace(",", ".").split(":")
+    seconds = float(parts[-1]) + int(parts[-2]) * 60
+    if len(parts) == 3:
+        seconds += int(parts[0]) * 3600
+    return seconds
+
+
+def segment_line(segment: TranscriptSegment) -> str:
+    """Plain-text line for a segment: "Speaker: text" (or just the text when there is no speaker)."""
+    return f"{segment.speaker}: {segment.text}" if segment.speaker else segment.text
+
+
+def render_segments(segments: Iterable[TranscriptSegment]) -> str:
+    """Plain-text transcript, one segment per line (the parse_vtt_to_text format)."""
+    return "\n".join(segment_line(s) for s in segments).strip()
+
+
+class VttStreamParser:
+    """
+    Single-pass incremental WebVTT parser. Feed text chunks as they arrive (e.g. from
+    httpx's aiter_text()); each call returns the segments completed so far. Headers,
+    cue identifiers and NOTE/STYLE blocks are skipped; multi-line cues are joined.
+    """
+
+    __slots__ = ("_buffer", "_in_cue", "_start", "_end", "_speaker", "_pieces")
+
+    def __init__(self) -> None:
+        self._buffer = ""
+        self._in_cue = False
+        self._start = 0.0
+        self._end = 0.0
+        self._speaker = ""
+        self._pieces: list[str] = []
+
+    def feed(self, chunk: str) -> list[TranscriptSegment]:
+        """Consume a chunk of VTT text; returns segments whose cues are complete."""
+        out: list[TranscriptSegment] = []
+        lines = (self._buffer + chunk).split("\n")
+        self._buffer = lines.pop()
+        handle = self._line
+        for line in lines:
+            handle(line.strip(), out)
+        return out
+
+    def close(self) -> list[TranscriptSegment]:
+        """Flush the final (unterminated) line and cue."""
+        out: list[TranscriptSegment] = []
+        if self._buffer:
+            self._line(self._buffer.strip(), out)
+            self._buffer = ""
+        self._flush(out)
+        self._in_cue = False
+        return out
+
+    def _line(self, line: str, out: list[TranscriptSegment]) -> None:
+        if not line:
+            self._flush(out)
+            self._in_cue = False
+            return
+        timing = _TIMING_RE.match(line) if "-->" in line else None
+        if timing:
+            self._flush(out)
+            self._in_cue = True
+            self._start, self._end = _seconds(timing.group(1)), _seconds(timing.group(2))
+            return
+        if not self._in_cue:
+            return
+        voice = _VOICE_RE.match(line) if line[0] == "<" else None
+        if voice:
+            speaker = voice.group(1).strip()
+            if self._pieces and speaker != self._speaker:
+                self._flush(out)
+            self._speaker = speaker
+            line = voice.group(2).strip()
+        elif line.endswith("</v>"):
+            line = line[:-4].rstrip()
+        if line:
+            self._pieces.append(line)
+
+    def _flush(self, out: list[TranscriptSegment]) -> None:
+        if self._pieces:
+            out.append(TranscriptSegment(self._speaker, " ".join(self._pieces), self._start, self._end))
+        self._pieces = []
+        self._speaker = ""
+
+
+def iter_vtt_segments(chunks: Iterable[str]) -> Iterator[TranscriptSegment]:
+    """Yield segments from an iterable of VTT text chunks (a whole string is one chunk)."""
+    parser = VttStreamParser()
+    for chunk in chunks:
+        yield from parser.feed(chunk)
+    yield from parser.close()
+
+
+async def aiter_vtt_segments(chunks: AsyncIterable[str]) -> AsyncIterator[TranscriptSegment]:
+    """Async iter_vtt_segments, e.g. over httpx Response.aiter_text()."""
+    parser = VttStreamParser()
+    async for chunk in chunks:
+        for segment in parser.feed(chunk):
+            yield segment
+    for segment in parser.close():
+        yield segment
 
 
 def parse_vtt_to_text(vtt_content: str) -> str:
@@ -19,47 +136,31 @@ def parse_vtt_to_text(vtt_content: str) -> str:
     """
     if not vtt_content or not vtt_content.strip():
         return ""
-
-    lines = vtt_content.strip().splitlines()
-    text_parts: list[str] = []
-    in_cue = False
-
-    for line in lines:
-        line = line.strip()
-        if not line:
-            continue
-        if line.upper().startswith("WEBVTT"):
-            continue
-        if re.match(r"^\d{2}:\d{2}:\d{2}", line) or " --> " in line:
-            in_cue = True
-            continue
-        # Cue text: may be <v Speaker>text</v> or plain
-        if in_cue or "<v " in line:
-            match = re.search(r"<v\s+([^>]+)>\s*([^<]*)\s*</v>", line, re.IGNORECASE)
-            if match:
-                speaker, text = match.group(1).strip(), match.group(2).strip()
-                if text:
-                    text_parts.append(f"{speaker}: {text}")
-            else:
-                # Plain line (no voice tag)
-                if line and not line.startswith("NOTE"):
-                    text_parts.append(line)
-        in_cue = False
-
-    return "\n".join(text_parts).strip()
+    with stage("parse"):
+        return render_segments(iter_vtt_segments((vtt_content,)))
 
 
 def parse_vtt_to_segments(vtt_content: str) -> list[TranscriptSegment]:
-    """Parse VTT into list of segments (speaker, text)."""
+    """Parse VTT into list of segments (speaker, text, start, end)."""
     if not vtt_content or not vtt_content.strip():
         return []
+    with stage("parse"):
+        return list(iter_vtt_segments((vtt_content,)))
+
 
+def parse_text_to_segments(text: str) -> list[TranscriptSegment]:
+    """
+    Recover segments from parse_vtt_to_text output ("Speaker: text" per line).
+    Lines without a speaker prefix become segments with an empty speaker.
+    """
     segments: list[TranscriptSegment] = []
-    for line in vtt_content.strip().splitlines():
+    for line in text.splitlines():
         line = line.strip()
-        match = re.search(r"<v\s+([^>]+)>\s*([^<]*)\s*</v>", line, re.IGNORECASE)
-        if match:
-            segments.append(
-                TranscriptSegment(speaker=match.group(1).strip(), text=match.group(2).strip())
-            )
+        if not line:
+            continue
+        speaker, sep, rest = line.partition(": ")
+        if sep and speaker and "<" not in speaker:
+            segments.append(TranscriptSegment(speaker=speaker, text=rest.strip()))
+        else:
+            segments.append(TranscriptSegment(speaker="", text=line))
     return segments
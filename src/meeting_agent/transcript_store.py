@@ -0,0 +1,176 @@
+"""Local transcript store (SQLite) with per-organizer sync watermarks for incremental Graph fetches."""
+
+import logging
+import sqlite3
+import threading
+from array import array
+from datetime import datetime, timedelta, timezone
+from pathlib import Path
+from typing import Any
+
+logger = logging.getLogger(__name__)
+
+
+def parse_graph_datetime(value: str) -> datetime | None:
+    """Parse a Graph ISO 8601 timestamp (e.g. 2024-05-01T10:00:00.1234567Z) as aware UTC."""
+    if not value:
+        return None
+    try:
+        dt = datetime.fromisoformat(value)
+    except ValueError:
+        return None
+    return dt if dt.tzinfo else dt.replace(tzinfo=timezone.utc)
+
+
+class TranscriptStore:
+    """
+    Parsed transcripts keyed by transcript ID, plus one watermark per organizer: the
+    createdDateTime up to which every transcript has been fetched. Thread-safe.
+    """
+
+    def __init__(self, path: str | Path, retention_days: int):
+        self._path = Path(path)
+        self._path.parent.mkdir(parents=True, exist_ok=True)
+        self._retention = timedelta(days=retention_days)
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(self._path, check_same_thread=False)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute(
+            "CREATE TABLE IF NOT EXISTS transcripts ("
+            " transcript_id TEXT PRIMARY KEY,"
+            " organizer_id TEXT NOT NULL,"
+            " meeting_id TEXT,"
+            " created_date_time TEXT NOT NULL,"
+            " created_ts REAL NOT NULL,"
+            " content_text TEXT NOT NULL,"
+            " cue_starts BLOB)"
+        )
+        columns = {r[1] for r in self._conn.execute("PRAGMA table_info(transcripts)")}
+        if "cue_starts" not in columns:
+            # Stores created before cue times were kept: those rows have none.
+            self._conn.execute("ALTER TABLE transcripts ADD COLUMN cue_starts BLOB")
+        self._conn.execute(
+            "CREATE INDEX IF NOT EXISTS transcripts_organizer_created"
+            " ON transcripts (organizer_id, created_ts)"
+        )
+        self._conn.execute(
+            "CREATE TABLE IF NOT EXISTS watermarks ("
+            " organizer_id TEXT PRIMARY KEY,"
+            " synced_from_ts REAL NOT NULL,"
+            " watermark_ts REAL NOT NULL)"
+        )
+        self._conn.commit()
+        self.prune()
+
+    def watermark(self, organizer_id: str) -> tuple[datetime, datetime] | None:
+        """(synced_from, watermark) for the organizer, or None if never synced."""
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT synced_from_ts, watermark_ts FROM watermarks WHERE organizer_id = ?",
+                (organizer_id,),
+            ).fetchone()
+        if row is None:
+            return None
+        return (
+            datetime.fromtimestamp(row[0], timezone.utc),
+            datetime.fromtimestamp(row[1], timezone.utc),
+        )
+
+    def known_ids(self, organizer_id: str) -> set[str]:
+        """Transcript IDs already stored for the organizer."""
+        with self._lock:
+            rows = self._conn.execute(
+                "SELECT transcript_id FROM transcripts WHERE organizer_id = ?", (organizer_id,)
+            ).fetchall()
+        return {r[0] for r in rows}
+
+    def merge(
+        self,
+        organizer_id: str,
+        transcripts: list[dict[str, Any]],
+        synced_from: datetime,
+        watermark: datetime,
+        rewind: bool = False,
+    ) -> None:
+        """
+        Store fetched transcripts (fetch_transcripts_for_user shape) and advance the organizer's
+        watermark; it never moves back unless rewind (a failed download to retry) is set.
+        """
+        rows = []
+        for t in transcripts:
+            created = parse_graph_datetime(t.get("created_date_time", ""))
+            if not t.get("transcript_id") or created is None:
+                continue
+            rows.append(
+                (
+                    t["transcript_id"],
+                    organizer_id,
+                    t.get("meeting_id"),
+                    t.get("created_date_time", ""),
+                    created.timestamp(),
+                    t.get("content_text", ""),
+                    t["cue_starts_ms"].tobytes() if t.get("cue_starts_ms") is not None else None,
+                )
+            )
+        with self._lock:
+            self._conn.executemany(
+                "INSERT OR REPLACE INTO transcripts"
+                " (transcript_id, organizer_id, meeting_id, created_date_time, created_ts, content_text,"
+                " cue_starts) VALUES (?, ?, ?, ?, ?, ?, ?)",
+                rows,
+            )
+            new_watermark = "excluded.watermark_ts" if rewind else "MAX(watermark_ts, excluded.watermark_ts)"
+            self._conn.execute(
+                "INSERT INTO watermarks (organizer_id, synced_from_ts, watermark_ts) VALUES (?, ?, ?)"
+                " ON CONFLICT (organizer_id) DO UPDATE SET"
+                " synced_from_ts = MIN(synced_from_ts, excluded.synced_from_ts),"
+                f" watermark_ts = {new_watermark}",
+                (organizer_id, synced_from.timestamp(), watermark.timestamp()),
+            )
+            self._conn.commit()
+
+    def transcripts_in_window(
+        self, organizer_id: str, start: datetime, end: datetime
+    ) -> list[dict[str, Any]]:
+        """
+        Stored transcripts created in [start, end], oldest first, in fetch_transcripts_for_user
+        shape (with cue_starts_ms if the cue times were stored).
+        """
+        with self._lock:
+            rows = self._conn.execute(
+                "SELECT transcript_id, meeting_id, created_date_time, content_text, cue_starts FROM transcripts"
+                " WHERE organizer_id = ? AND created_ts >= ? AND created_ts <= ?"
+                " ORDER BY created_ts, transcript_id",
+                (organizer_id, start.timestamp(), end.timestamp()),
+            ).fetchall()
+        results = []
+        for r in rows:
+            result: dict[str, Any] = {
+                "transcript_id": r[0],
+                "meeting_id": r[1],
+                "created_date_time": r[2],
+                "content_text": r[3],
+            }
+            if r[4] is not None:
+                result["cue_starts_ms"] = array("I", r[4])
+            results.append(result)
+        return results
+
+    def prune(self) -> int:
+        """Drop transcripts older than the retention window and clamp watermarks' sync start to it."""
+        cutoff = (datetime.now(timezone.utc) - self._retention).timestamp()
+        with self._lock:
+            removed = self._conn.execute(
+                "DELETE FROM transcripts WHERE created_ts < ?", (cutoff,)
+            ).rowcount
+            self._conn.execute(
+                "UPDATE watermarks SET synced_from_ts = ? WHERE synced_from_ts < ?", (cutoff, cutoff)
+            )
+            self._conn.commit()
+        if removed:
+            logger.info("Transcript store pruned %d transcripts", removed)
+        return removed
+
+    def close(self) -> None:
+        with self._lock:
+            self._conn.close()
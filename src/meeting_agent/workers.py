@@ -0,0 +1,171 @@
+"""
+Pre-fork supervisor for WEB_WORKERS > 1: bind the port once, fork worker processes that each
+run the aiohttp app and accept on the shared socket, restart workers that exit, and on SIGHUP
+replace them one at a time. POSIX only (os.fork).
+"""
+
+import logging
+import os
+import signal
+import socket
+import time
+from typing import Callable
+
+from aiohttp import web
+
+logger = logging.getLogger(__name__)
+
+WORKER_INDEX_ENV = "MEETING_AGENT_WORKER_INDEX"
+
+# A worker that exits sooner than this after starting is restarted only after a pause.
+MIN_UPTIME_SECONDS = 5.0
+RESTART_PAUSE_SECONDS = 1.0
+POLL_SECONDS = 0.5
+
+
+def worker_index() -> int:
+    """Index of this worker process (0 without a supervisor)."""
+    return int(os.environ.get(WORKER_INDEX_ENV, "0"))
+
+
+def supervised() -> bool:
+    """True in a worker process forked by Supervisor."""
+    return WORKER_INDEX_ENV in os.environ
+
+
+class Supervisor:
+    """
+    Runs workers copies of create_app() in forked processes on one listening socket; the
+    kernel spreads connections over them. SIGTERM/SIGINT stop all workers gracefully (each
+    finishes its requests and background jobs within shutdown_timeout), SIGHUP restarts them
+    one by one, starting each replacement before stopping the worker it replaces. preload, if
+    given, runs in the supervisor once the first workers are started (they load what they need
+    after their port opens), so workers forked later start with its imports already done.
+    """
+
+    def __init__(
+        self,
+        create_app: Callable[[], web.Application],
+        host: str,
+        port: int,
+        workers: int,
+        shutdown_timeout: float,
+        preload: Callable[[], object] | None = None,
+    ):
+        self._create_app = create_app
+        self._preload = preload
+        self._host = host
+        self._port = port
+        self._count = workers
+        self._shutdown_timeout = shutdown_timeout
+        self._sock: socket.socket | None = None
+        # pid -> (worker index, monotonic start time)
+        self._workers: dict[int, tuple[int, float]] = {}
+        self._retiring: set[int] = set()
+        self._stopping = False
+        self._reload = False
+
+    def run(self) -> None:
+        self._sock = socket.create_server((self._host, self._port), backlog=128)
+        signal.signal(signal.SIGTERM, self._on_stop)
+        signal.signal(signal.SIGINT, self._on_stop)
+        signal.signal(signal.SIGHUP, self._on_reload)
+        logger.info("Supervisor %d: starting %d workers on port %s", os.getpid(), self._count, self._port)
+        for index in range(self._count):
+            self._spawn(index)
+        if self._preload is not None:
+            try:
+                self._preload()
+            except Exception as e:
+                logger.warning("Supervisor %d: preload failed, workers load on their own: %s", os.getpid(), e)
+        while not self._stopping:
+            self._reap()
+            if self._reload:
+                self._reload = False
+                self._rolling_restart()
+            time.sleep(POLL_SECONDS)
+        self._stop_all()
+        self._sock.close()
+        logger.info("Supervisor %d: all workers stopped", os.getpid())
+
+    def _on_stop(self, signum: int, frame) -> None:
+        self._stopping = True
+
+    def _on_reload(self, signum: int, frame) -> None:
+        self._reload = True
+
+    def _spawn(self, index: int) -> int:
+        pid = os.fork()
+        if pid:
+            self._workers[pid] = (index, time.monotonic())
+            logger.info("Worker %d started (pid %d)", index, pid)
+            return pid
+        code = 0
+        try:
+            # Own process group: a terminal's Ctrl+C reaches only the supervisor, which stops
+            # workers with one SIGTERM (a second signal would cut their graceful shutdown short).
+            os.setpgid(0, 0)
+            for signum in (signal.SIGTERM, signal.SIGINT, signal.SIGHUP):
+                signal.signal(signum, signal.SIG_DFL)
+            os.environ[WORKER_INDEX_ENV] = str(index)
+            web.run_app(
+                self._create_app(),
+                sock=self._sock,
+                shutdown_timeout=self._shutdown_timeout,
+                print=None,
+            )
+        except Exception as e:
+            logger.exception("Worker %d failed: %s", index, e)
+            code = 1
+        finally:
+            logging.shutdown()
+            os._exit(code)
+
+    def _reap(self) -> None:
+        """Collect exited workers; restart those that were not asked to stop."""
+        while self._workers:
+            pid, status = os.waitpid(-1, os.WNOHANG)
+            if pid == 0:
+                return
+            index, started = self._workers.pop(pid)
+            if pid in self._retiring:
+                self._retiring.discard(pid)
+                continue
+            logger.warning(
+                "Worker %d (pid %d) exited with code %d", index, pid, os.waitstatus_to_exitcode(status)
+            )
+            if self._stopping:
+                continue
+            if time.monotonic() - started < MIN_UPTIME_SECONDS:
+                time.sleep(RESTART_PAUSE_SECONDS)
+            self._spawn(index)
+
+    def _wait_for(self, pids: set[int], deadline: float) -> None:
+        """Reap until the given workers have exited; SIGKILL any left at the deadline."""
+        while pids & self._workers.keys() and time.monotonic() < deadline:
+            self._reap()
+            time.sleep(POLL_SECONDS / 5)
+        for pid in pids & self._workers.keys():
+            logger.warning("Worker pid %d did not stop in time; killing it", pid)
+            os.kill(pid, signal.SIGKILL)
+        while pids & self._workers.keys():
+            self._reap()
+            time.sleep(POLL_SECONDS / 5)
+
+    def _stop_gracefully(self, pids: set[int]) -> None:
+        for pid in pids:
+            self._retiring.add(pid)
+            os.kill(pid, signal.SIGTERM)
+        # Background jobs are drained first, then open requests: up to two timeouts in a row.
+        self._wait_for(pids, time.monotonic() + 2 * self._shutdown_timeout + 5)
+
+    def _rolling_restart(self) -> None:
+        logger.info("Supervisor %d: restarting workers one by one", os.getpid())
+        for pid, (index, _) in list(self._workers.items()):
+            if pid not in self._workers or self._stopping:
+                continue
+            self._spawn(index)
+            self._stop_gracefully({pid})
+
+    def _stop_all(self) -> None:
+        self._stop_gracefully(set(self._workers))
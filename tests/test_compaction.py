@@ -0,0 +1,58 @@
+"""Transcript compaction: which cues and words are dropped."""
+
+import pytest
+
+from meeting_agent.compaction import (
+    ASSENT_WORDS,
+    DEFAULT_FILLERS,
+    CompactionOptions,
+    clean_text,
+    compact_segments,
+    compaction_options,
+    is_filler,
+)
+from meeting_agent.config import load_config
+from meeting_agent.transcript_parser import TranscriptSegment
+
+
+@pytest.mark.parametrize("text", ["Mm-hmm.", "Uh-huh, hmm.", "Um."])
+def test_back_channel_sounds_are_fillers(text):
+    assert is_filler(text)
+
+
+@pytest.mark.parametrize("text", ["Sure.", "Okay.", "Yeah.", "Right."])
+def test_assent_words_are_kept_by_default(text):
+    assert not is_filler(text)
+    assert is_filler(text, DEFAULT_FILLERS | ASSENT_WORDS)
+
+
+def test_assent_words_are_opt_in():
+    assert compaction_options(load_config({})).fillers == DEFAULT_FILLERS
+    options = compaction_options(load_config({"TRANSCRIPT_COMPACTION_DROP_ASSENT": "true"}))
+    assert options.fillers == DEFAULT_FILLERS | ASSENT_WORDS
+
+
+@pytest.mark.parametrize(
+    "text, expected",
+    [
+        ("No, no, we ship Friday.", "No, no, we ship Friday."),
+        ("We need 10, 10 seats.", "We need 10, 10 seats."),
+        ("Mm-hmm, mm-hmm, go on.", "Mm-hmm, go on."),
+        ("Uh-huh uh-huh.", "Uh-huh."),
+    ],
+)
+def test_only_filler_repeats_are_collapsed(text, expected):
+    assert clean_text(text) == expected
+
+
+def test_short_answers_survive_compaction():
+    segments = [
+        TranscriptSegment(speaker="Alice", text="Can you take the release?"),
+        TranscriptSegment(speaker="Bob", text="Mm-hmm."),
+        TranscriptSegment(speaker="Bob", text="Sure."),
+    ]
+    compacted, _ = compact_segments(segments, CompactionOptions())
+    assert [(s.speaker, s.text) for s in compacted] == [
+        ("Alice", "Can you take the release?"),
+        ("Bob", "Sure."),
+    ]
@@ -0,0 +1,94 @@
+"""Incremental transcript sync and $batch retries against a stand-in Graph."""
+
+import asyncio
+import json
+
+import httpx
+import pytest
+
+pytest.importorskip("msal")
+
+from meeting_agent.config import load_config  # noqa: E402
+from meeting_agent.graph_client import GraphTranscriptClient  # noqa: E402
+from meeting_agent.transcript_store import TranscriptStore  # noqa: E402
+
+
+class StaticTokens:
+    async def get_token(self) -> str:
+        return "token"
+
+
+@pytest.fixture
+def store(tmp_path):
+    store = TranscriptStore(tmp_path / "transcripts.sqlite3", retention_days=14)
+    yield store
+    store.close()
+
+
+def _client(store: TranscriptStore, handler) -> GraphTranscriptClient:
+    return GraphTranscriptClient(
+        load_config({}), StaticTokens(), store=store, transport=httpx.MockTransport(handler)
+    )
+
+
+def test_empty_syncs_do_not_move_the_watermark_back(store):
+    listings = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        listings.append(str(request.url))
+        return httpx.Response(200, json={"value": []})
+
+    client = _client(store, handler)
+
+    async def sync():
+        await client.fetch_transcripts_for_user_async("organizer")
+        return store.watermark("organizer")[1]
+
+    async def run():
+        try:
+            return await sync(), await sync()
+        finally:
+            await client.aclose()
+
+    first, second = asyncio.run(run())
+    assert second >= first
+    # The empty listing advanced the watermark to the end of the window, not back by the overlap.
+    _, end = client._config.window_utc()
+    assert (end - first).total_seconds() < 60
+    assert len(listings) == 2
+
+
+def test_batch_counts_retried_and_failed_sub_requests(store):
+    def handler(request: httpx.Request) -> httpx.Response:
+        subs = json.loads(request.content)["requests"]
+        return httpx.Response(
+            200,
+            json={
+                "responses": [
+                    # "a" is always throttled; "b" does not exist.
+                    {"id": s["id"], "status": 429, "headers": {"Retry-After": "0"}}
+                    if s["url"] == "/a"
+                    else {"id": s["id"], "status": 404, "body": {}}
+                    for s in subs
+                ]
+            },
+        )
+
+    client = GraphTranscriptClient(
+        load_config({"GRAPH_MAX_RETRIES": "1"}),
+        StaticTokens(),
+        store=store,
+        transport=httpx.MockTransport(handler),
+    )
+
+    async def run():
+        try:
+            return await client._batch([{"method": "GET", "url": "/a"}, {"method": "GET", "url": "/b"}])
+        finally:
+            await client.aclose()
+
+    results = asyncio.run(run())
+    assert [r["status"] for r in results] == [429, 404]
+    stats = client.scheduler.stats()
+    assert stats["retries"] == 1
+    assert stats["failures"] == 2
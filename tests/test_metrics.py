@@ -0,0 +1,29 @@
+"""Metrics registry: Prometheus text rendering and per-worker labels."""
+
+from meeting_agent.metrics import Counter, Histogram, Registry
+
+
+def test_const_labels_on_every_sample():
+    registry = Registry()
+    counter = registry.register(Counter("requests_total", "Requests.", ("command",)))
+    histogram = registry.register(Histogram("latency_seconds", "Latency.", buckets=(1,)))
+    counter.inc(command="summary")
+    histogram.observe(0.5)
+    registry.set_const_labels(worker="2")
+
+    samples = [line for line in registry.render().splitlines() if not line.startswith("#")]
+
+    assert samples == [
+        'requests_total{command="summary",worker="2"} 1',
+        'latency_seconds_bucket{worker="2",le="1"} 1',
+        'latency_seconds_bucket{worker="2",le="+Inf"} 1',
+        'latency_seconds_sum{worker="2"} 0.5',
+        'latency_seconds_count{worker="2"} 1',
+    ]
+
+
+def test_no_const_labels_by_default():
+    registry = Registry()
+    registry.register(Counter("requests_total", "Requests.")).inc()
+
+    assert registry.render().splitlines()[-1] == "requests_total 1"
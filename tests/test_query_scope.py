@@ -0,0 +1,93 @@
+"""Routing of free-text requests: full summary vs. answer from matching excerpts."""
+
+from datetime import datetime, timedelta, timezone
+
+import pytest
+
+from meeting_agent.query_scope import is_scoped_request, parse_query
+from meeting_agent.segment_index import SegmentIndex
+
+NOW = datetime(2026, 10, 17, 12, tzinfo=timezone.utc)
+WINDOW = (NOW - timedelta(days=7), NOW)
+
+
+@pytest.fixture
+def index(tmp_path):
+    index = SegmentIndex(tmp_path / "segments.sqlite3", retention_days=14)
+    index.add(
+        "organizer",
+        [
+            {
+                "transcript_id": "t1",
+                "meeting_id": "meetingAAA111",
+                "created_date_time": (NOW - timedelta(days=1)).strftime("%Y-%m-%dT%H:%M:%SZ"),
+                "content_text": "Alice Smith: hi all\nBob Jones: we decided the budget is 10k\nAlice Smith: ok",
+            }
+        ],
+    )
+    yield index
+    index.close()
+
+
+def _scoped(text: str, index: SegmentIndex) -> bool:
+    text = text.lower()
+    start, end = WINDOW
+    scope = parse_query(
+        text,
+        start,
+        end,
+        index.speakers("organizer", start, end),
+        index.meeting_ids("organizer", start, end),
+        now=NOW,
+    )
+    return is_scoped_request(
+        text, scope, lambda terms: index.has_matches("organizer", scope.start, scope.end, terms)
+    )
+
+
+@pytest.mark.parametrize(
+    "text",
+    [
+        "summary",
+        "send me the summary",
+        "summary thanks",
+        "summarize everything",
+        "hi bot, summary",
+        "can I get the weekly summary?",
+        "summary of the quarterly offsite",
+        "hello",
+        "what can you do?",
+        "are you there?",
+        "what about the roadmap?",
+        "what happened last monday?",
+    ],
+)
+def test_plain_summary_requests_get_the_full_summary(text, index):
+    assert not _scoped(text, index)
+
+
+@pytest.mark.parametrize(
+    "text",
+    [
+        "summary of yesterday's standup",
+        "summarize what Bob said",
+        "summary of meetingaaa1",
+        "summary of the budget discussion",
+        "what did we decide about the budget?",
+        "what happened yesterday?",
+        "what did bob say?",
+    ],
+)
+def test_scoped_requests_and_questions_use_excerpts(text, index):
+    assert _scoped(text, index)
+
+
+@pytest.mark.parametrize(("text", "scoped"), [("what about the roadmap?", True), ("what can you do?", False)])
+def test_questions_without_an_index_need_a_topic(text, scoped):
+    scope = parse_query(text, *WINDOW, now=NOW)
+    assert is_scoped_request(text, scope, None) is scoped
+
+
+def test_leftover_words_are_not_search_terms():
+    for text in ("send me the summary", "summary thanks", "summarize everything", "hi bot, summary"):
+        assert parse_query(text, *WINDOW).terms == ()
@@ -0,0 +1,84 @@
+"""Segment index: cue times, time filters and excerpt citations."""
+
+from array import array
+from datetime import datetime, timedelta, timezone
+
+import pytest
+
+from meeting_agent import segment_index
+from meeting_agent.segment_index import SegmentIndex
+
+CREATED = datetime(2026, 10, 16, 9, tzinfo=timezone.utc)
+
+
+@pytest.fixture
+def index(tmp_path):
+    index = SegmentIndex(tmp_path / "segments.sqlite3", retention_days=36500)
+    index.add(
+        "organizer",
+        [
+            {
+                "transcript_id": "t1",
+                "meeting_id": "m1",
+                "created_date_time": CREATED.strftime("%Y-%m-%dT%H:%M:%SZ"),
+                "content_text": "Alice: opening remarks\nBob: the budget is approved\nAlice: wrap up",
+                # Second cue 45 minutes in, third 1h30m in.
+                "cue_starts_ms": array("I", [0, 45 * 60_000, 90 * 60_000]),
+            }
+        ],
+    )
+    yield index
+    index.close()
+
+
+def test_segments_keep_their_cue_offsets(index):
+    segments = index.search("organizer", CREATED, CREATED + timedelta(days=1), terms=("budget",))
+    assert [(s.speaker, s.offset) for s in segments] == [("Bob", 45 * 60.0)]
+
+
+def test_time_filters_use_when_the_segment_was_spoken(index):
+    later = index.search("organizer", CREATED + timedelta(hours=1), CREATED + timedelta(days=1))
+    assert [s.text for s in later] == ["wrap up"]
+
+
+def test_excerpts_cite_the_cue_time(index):
+    excerpts = index.excerpts("organizer", CREATED, CREATED + timedelta(days=1), terms=("budget",))
+    assert "[00:45:00] Bob: the budget is approved" in excerpts[0]["content_text"]
+
+
+def test_mismatched_cue_times_are_dropped(tmp_path):
+    index = SegmentIndex(tmp_path / "segments.sqlite3", retention_days=36500)
+    index.add(
+        "organizer",
+        [
+            {
+                "transcript_id": "t2",
+                "meeting_id": "m2",
+                "created_date_time": CREATED.strftime("%Y-%m-%dT%H:%M:%SZ"),
+                "content_text": "Alice: one\nBob: two",
+                "cue_starts_ms": array("I", [0]),
+            }
+        ],
+    )
+    segments = index.search("organizer", CREATED, CREATED + timedelta(days=1))
+    assert [s.offset for s in segments] == [None, None]
+    index.close()
+
+
+def test_add_prunes_expired_segments_while_running(tmp_path, monkeypatch):
+    index = SegmentIndex(tmp_path / "segments.sqlite3", retention_days=14)
+    old = datetime.now(timezone.utc) - timedelta(days=10)
+    transcript = {
+        "transcript_id": "old",
+        "meeting_id": "m",
+        "created_date_time": old.strftime("%Y-%m-%dT%H:%M:%SZ"),
+        "content_text": "Alice: hello",
+    }
+    index.add("organizer", [transcript])
+    assert index.stats()["segments"] == 1
+    # Without a restart, the transcript falls out of retention.
+    monkeypatch.setattr(index, "_retention", timedelta(days=5))
+    monkeypatch.setattr(segment_index, "PRUNE_INTERVAL_SECONDS", 0.0)
+    index.add("organizer", [])
+    assert index.stats()["segments"] == 0
+    index.close()
@@ -0,0 +1,44 @@
+"""Turn-state storage shared by several worker processes."""
+
+import asyncio
+
+import pytest
+
+pytest.importorskip("microsoft_agents.hosting.core")
+
+from microsoft_agents.hosting.core import StoreItem  # noqa: E402
+
+from meeting_agent.state_storage import SqliteStorage  # noqa: E402
+
+
+class Item(StoreItem):
+    def __init__(self, value: str):
+        self.value = value
+
+    def store_item_to_json(self) -> dict:
+        return {"value": self.value}
+
+    @staticmethod
+    def from_json_to_store_item(json_data: dict) -> "Item":
+        return Item(json_data["value"])
+
+
+def test_write_through_is_visible_to_another_instance_at_once(tmp_path):
+    path = tmp_path / "turn_state.sqlite3"
+
+    async def run():
+        writer = SqliteStorage(path, flush_interval=0.0)
+        reader = SqliteStorage(path, flush_interval=0.0)
+        try:
+            await writer.write({"conversation": Item("turn 1")})
+            found = await reader.read(["conversation"], target_cls=Item)
+            await writer.delete(["conversation"])
+            gone = await reader.read(["conversation"], target_cls=Item)
+        finally:
+            await writer.aclose()
+            await reader.aclose()
+        return found, gone
+
+    found, gone = asyncio.run(run())
+    assert found["conversation"].value == "turn 1"
+    assert gone == {}
@@ -0,0 +1,117 @@
+"""Map-reduce summarization: blocking path, call sizes, streamed usage, deprecated output_dir."""
+
+import asyncio
+from types import SimpleNamespace
+
+import pytest
+
+from meeting_agent.chunking import CHARS_PER_TOKEN
+from meeting_agent.config import MAX_CHUNK_TOKENS, load_config
+from meeting_agent.summarizer import (
+    MAX_SINGLE_CALL_CHARS,
+    PROMPT_RESERVE_CHARS,
+    TranscriptSummarizer,
+    _split_for_call,
+)
+
+
+@pytest.fixture
+def summarizer():
+    config = load_config(
+        {
+            "AZURE_OPENAI_ENDPOINT": "https://example.invalid",
+            "AZURE_OPENAI_API_KEY": "key",
+            "AZURE_OPENAI_DEPLOYMENT": "deployment",
+            "SUMMARY_CHUNK_TOKENS": "500",
+            "SUMMARY_REDUCE_FAN_OUT": "2",
+        }
+    )
+    summarizer = TranscriptSummarizer(config)
+    calls = []
+
+    def complete(messages, max_tokens):
+        calls.append(messages[-1]["content"])
+        return f"partial {len(calls)}", 10, 2
+
+    summarizer._complete = complete
+    summarizer.calls = calls
+    yield summarizer
+    summarizer.close()
+
+
+def _transcripts(count: int) -> list[dict]:
+    return [
+        {
+            "transcript_id": f"t{i}",
+            "meeting_id": f"m{i}",
+            "created_date_time": f"2026-10-1{i}T09:00:00Z",
+            "content_text": f"Alice: point {i}\nBob: reply {i}",
+        }
+        for i in range(count)
+    ]
+
+
+def test_map_reduce_runs_on_the_sync_client(summarizer):
+    result = summarizer.summarize_map_reduce(_transcripts(3))
+    assert [s.stage for s in result.stages] == ["map", "reduce-1", "reduce-2"]
+    assert len(summarizer.calls) == 6
+    assert result.summary == "partial 6"
+
+
+def test_map_reduce_works_inside_a_running_event_loop(summarizer):
+    async def handler() -> str:
+        return summarizer.summarize_transcripts(_transcripts(2))
+
+    assert asyncio.run(handler()) == "partial 3"
+
+
+def test_output_dir_still_writes_the_flat_files(summarizer, tmp_path):
+    transcripts = _transcripts(2)
+    with pytest.warns(DeprecationWarning):
+        summarizer.summarize_transcripts(transcripts, output_dir=str(tmp_path))
+    with pytest.warns(DeprecationWarning):
+        summarizer.summarize_transcripts(transcripts, combined=False, output_dir=str(tmp_path))
+    assert sorted(p.name for p in tmp_path.iterdir()) == ["combined_summary.md", "summary_m0.md", "summary_m1.md"]
+    assert (tmp_path / "combined_summary.md").read_text() == "partial 3"
+
+
+def test_chunk_size_is_capped_below_the_single_call_limit():
+    config = load_config({"SUMMARY_CHUNK_TOKENS": "100000"})
+    assert config.summary_chunk_tokens == MAX_CHUNK_TOKENS
+    assert MAX_CHUNK_TOKENS * CHARS_PER_TOKEN + PROMPT_RESERVE_CHARS <= MAX_SINGLE_CALL_CHARS
+
+
+def test_oversized_chunks_are_split_not_truncated():
+    line = "Alice: " + "word " * 2000
+    text = "\n".join([line] * 10)
+    pieces = _split_for_call(text)
+    assert len(pieces) > 1
+    assert all(len(p) <= MAX_SINGLE_CALL_CHARS - PROMPT_RESERVE_CHARS for p in pieces)
+    assert "\n".join(pieces) == text
+
+
+def test_streamed_completion_reads_usage_from_the_final_chunk(summarizer):
+    def chunk(content=None, usage=None):
+        choices = [SimpleNamespace(delta=SimpleNamespace(content=content))] if content else []
+        return SimpleNamespace(choices=choices, usage=usage)
+
+    requests = []
+
+    async def create(**kwargs):
+        requests.append(kwargs)
+
+        async def stream():
+            yield chunk(" Hello")
+            yield chunk(" world")
+            yield chunk(usage=SimpleNamespace(prompt_tokens=120, completion_tokens=7))
+
+        return stream()
+
+    summarizer._async_client = SimpleNamespace(chat=SimpleNamespace(completions=SimpleNamespace(create=create)))
+    deltas = []
+    result = asyncio.run(
+        summarizer._complete_stream_async([{"role": "user", "content": "text"}], 100, deltas.append)
+    )
+    assert requests[0]["stream_options"] == {"include_usage": True}
+    assert result == ("Hello world", 120, 7)
+    assert deltas == ["Hello", " world"]
@@ -0,0 +1,24 @@
+"""Transcript store watermarks."""
+
+from datetime import datetime, timedelta, timezone
+
+import pytest
+
+from meeting_agent.transcript_store import TranscriptStore
+
+
+@pytest.fixture
+def store(tmp_path):
+    store = TranscriptStore(tmp_path / "transcripts.sqlite3", retention_days=14)
+    yield store
+    store.close()
+
+
+def test_watermark_only_rewinds_for_failed_downloads(store):
+    start = datetime.now(timezone.utc) - timedelta(days=7)
+    late, early = start + timedelta(days=6), start + timedelta(days=2)
+    store.merge("organizer", [], start, late)
+    store.merge("organizer", [], start, early)
+    assert store.watermark("organizer")[1] == late
+    store.merge("organizer", [], start, early, rewind=True)
+    assert store.watermark("organizer")[1] == early